@@ -4,9 +4,12 @@
 # --------------------------------------------------------------------------
 import json
 import logging
+import os
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from olive.common.config_utils import serialize_to_json
 from olive.common.utils import hash_dict
@@ -14,6 +17,8 @@ from olive.resource_path import ResourcePath, create_resource_path
 
 logger = logging.getLogger(__name__)
 
+# cache directory of the non-local resources resolved by get_local_path without a cache directory
+RESOURCE_CACHE_DIR = ".olive-cache"
 
 def get_cache_sub_dirs(cache_dir: Union[str, Path] = ".olive-cache"):
     """
@@ -112,45 +117,101 @@ def clean_pass_run_cache(pass_type: str, cache_dir: Union[str, Path] = ".olive-c
         _delete_run(run_json.stem, cache_dir)
 
 
+# locks of the non-local resources being downloaded by this process, keyed by the path of their cache json
+_download_locks: Dict[str, threading.Lock] = {}
+_download_locks_lock = threading.Lock()
+
+
+def _get_download_lock(resource_path_json: Path) -> threading.Lock:
+    with _download_locks_lock:
+        return _download_locks.setdefault(str(resource_path_json.resolve()), threading.Lock())
+
+
 def download_resource(resource_path: ResourcePath, cache_dir: Union[str, Path] = ".olive-cache"):
     """
     Returns the path to a non-local resource.
 
-    Non-local resources are stored in the non_local_resources subdirectory of the cache.
+    Non-local resources are stored in the non_local_resources subdirectory of the cache. The resource is downloaded to a
+    staging directory and moved into place once complete, so an interrupted download is never used and is started
+    again by the next call. Concurrent calls for the same resource download it once.
     """
     non_local_resource_dir = get_cache_sub_dirs(cache_dir)[3]
 
     resource_path_hash = hash_dict(resource_path.to_json())
     resource_path_json = non_local_resource_dir / f"{resource_path_hash}.json"
 
-    # check if resource path is cached
-    if resource_path_json.exists():
-        logger.debug(f"Using cached resource path {resource_path.to_json()}")
-        with resource_path_json.open("r") as f:
-            resource_path_data = json.load(f)["dest"]
-        return create_resource_path(resource_path_data)
-
-    # cache resource path
-    save_dir = non_local_resource_dir / resource_path_hash
-    # ensure save directory is empty
-    if save_dir.exists():
-        shutil.rmtree(save_dir)
-    save_dir.mkdir(parents=True, exist_ok=True)
-
-    # download resource to save directory
-    logger.debug(f"Downloading non-local resource {resource_path.to_json()} to {save_dir}")
-    local_resource_path = create_resource_path(resource_path.save_to_dir(save_dir))
-
-    # cache resource path
-    logger.debug(f"Caching resource path {resource_path}")
-    with resource_path_json.open("w") as f:
-        data = {"source": resource_path.to_json(), "dest": local_resource_path.to_json()}
-        json.dump(data, f, indent=4)
+    with _get_download_lock(resource_path_json):
+        # check if resource path is cached
+        if resource_path_json.exists():
+            logger.debug(f"Using cached resource path {resource_path.to_json()}")
+            with resource_path_json.open("r") as f:
+                resource_path_data = json.load(f)["dest"]
+            return create_resource_path(resource_path_data)
+
+        # download resource to a staging directory
+        save_dir = non_local_resource_dir / resource_path_hash
+        staging_dir = non_local_resource_dir / f"{resource_path_hash}.{os.getpid()}.tmp"
+        if staging_dir.exists():
+            shutil.rmtree(staging_dir)
+        staging_dir.mkdir(parents=True)
+        logger.debug(f"Downloading non-local resource {resource_path.to_json()} to {save_dir}")
+        try:
+            saved_path = resource_path.save_to_dir(staging_dir)
+            staged_path = Path(saved_path).resolve()
+            staging_dir = staging_dir.resolve()
+            # move the complete download into place
+            if save_dir.exists():
+                shutil.rmtree(save_dir)
+            os.replace(staging_dir, save_dir)
+        finally:
+            if staging_dir.exists():
+                shutil.rmtree(staging_dir)
+        if staged_path == staging_dir or staging_dir in staged_path.parents:
+            local_resource_path = create_resource_path(save_dir / staged_path.relative_to(staging_dir))
+        else:
+            # the resource is not saved as files, such as a string name
+            local_resource_path = create_resource_path(saved_path)
+
+        # cache resource path
+        logger.debug(f"Caching resource path {resource_path}")
+        tmp_resource_path_json = resource_path_json.with_name(f"{resource_path_json.name}.{os.getpid()}.tmp")
+        with tmp_resource_path_json.open("w") as f:
+            data = {"source": resource_path.to_json(), "dest": local_resource_path.to_json()}
+            json.dump(data, f, indent=4)
+        os.replace(tmp_resource_path_json, resource_path_json)
 
     return local_resource_path
 
 
-def get_local_path(resource_path: Optional[ResourcePath], cache_dir: Union[str, Path] = ".olive-cache"):
+def download_resources(
+    resource_paths: List[Tuple[ResourcePath, Union[str, Path]]], max_workers: int = 4, raise_errors: bool = True
+) -> List[Optional[ResourcePath]]:
+    """
+    Download non-local resources to the cache concurrently.
+
+    resource_paths are pairs of the resource path and the cache directory to download it to. Returns the local
+    resource paths in the same order. If raise_errors is False, failed downloads are logged as warnings and their
+    local resource paths are None.
+    """
+    if not resource_paths:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(resource_paths))) as executor:
+        futures = [
+            executor.submit(download_resource, resource_path, cache_dir) for resource_path, cache_dir in resource_paths
+        ]
+        local_resource_paths = []
+        for (resource_path, _), future in zip(resource_paths, futures):
+            try:
+                local_resource_paths.append(future.result())
+            except Exception as e:
+                if raise_errors:
+                    raise
+                logger.warning(f"Failed to download non-local resource {resource_path}: {e}")
+                local_resource_paths.append(None)
+        return local_resource_paths
+
+
+def get_local_path(resource_path: Optional[ResourcePath], cache_dir: Union[str, Path] = RESOURCE_CACHE_DIR):
     """
     Return the local path of the any resource path.
     If the resource path is a local resource, the path is returned.
@@ -3,12 +3,29 @@
 # Licensed under the MIT License.
 # --------------------------------------------------------------------------
 import importlib.util
+import logging
 import sys
+import threading
 from pathlib import Path
-from typing import Optional, Union
+from types import ModuleType
+from typing import Dict, Optional, Tuple, Union
 
+logger = logging.getLogger(__name__)
 
-def import_module_from_file(module_path: Union[Path, str], module_name: str = None):
+# process-wide cache of imported user modules
+# (resolved module path, module name) -> ((mtime, size) of the module file, module)
+_MODULE_CACHE: Dict[Tuple[str, str], Tuple[Tuple[int, int], ModuleType]] = {}
+# reentrant since a user module can import another user module while being executed
+_MODULE_CACHE_LOCK = threading.RLock()
+
+
+def import_module_from_file(module_path: Union[Path, str], module_name: str = None, reload: bool = False):
+    """
+    Import a module from a file or package directory.
+
+    The module is executed only once per process and re-imported only if the module file changes (based on its
+    modification time and size). Use reload=True to force re-executing the module.
+    """
     module_path = Path(module_path).resolve()
     if not module_path.exists():
         raise ValueError(f"{module_path} doesn't exist")
@@ -22,13 +39,33 @@ def import_module_from_file(module_path: Union[Path, str], module_name: str = No
         else:
             module_name = module_path.stem
 
-    spec = importlib.util.spec_from_file_location(module_name, module_path)
-    new_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(new_module)
+    cache_key = (str(module_path), module_name)
+    file_key = _get_file_key(module_path)
+    with _MODULE_CACHE_LOCK:
+        cached = _MODULE_CACHE.get(cache_key)
+        if not reload and file_key and cached and cached[0] == file_key:
+            logger.debug(f"Using cached module {module_name} from {module_path}")
+            return cached[1]
+
+        spec = importlib.util.spec_from_file_location(module_name, module_path)
+        new_module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(new_module)
+        if file_key:
+            _MODULE_CACHE[cache_key] = (file_key, new_module)
     return new_module
 
 
-def import_user_module(user_script: Union[Path, str], script_dir: Optional[Union[Path, str]] = None):
+def _get_file_key(file_path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = file_path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def import_user_module(
+    user_script: Union[Path, str], script_dir: Optional[Union[Path, str]] = None, reload: bool = False
+):
     if script_dir is not None:
         script_dir = Path(script_dir).resolve()
         if not script_dir.exists():
@@ -36,4 +73,4 @@ def import_user_module(user_script: Union[Path, str], script_dir: Optional[Union
         if str(script_dir) not in sys.path:
             sys.path.append(str(script_dir))
 
-    return import_module_from_file(user_script)
+    return import_module_from_file(user_script, reload=reload)
@@ -14,13 +14,19 @@ class UserModuleLoader:
     Load user module and call object in it.
 
     Only used for objects that are not json serializable.
+    The user module is imported once per process and shared by all loaders. Use reload=True to re-execute it.
     """
 
-    def __init__(self, user_script: Optional[Union[Path, str]], script_dir: Optional[Union[Path, str]] = None):
+    def __init__(
+        self,
+        user_script: Optional[Union[Path, str]],
+        script_dir: Optional[Union[Path, str]] = None,
+        reload: bool = False,
+    ):
         self.user_script = user_script
         self.script_dir = script_dir
         if self.user_script:
-            self.user_module = import_user_module(user_script, script_dir)
+            self.user_module = import_user_module(user_script, script_dir, reload)
         else:
             self.user_module = None
 
@@ -7,15 +7,23 @@ import inspect
 import io
 import json
 import logging
+import os
 import pickle
 import platform
 import shlex
 import shutil
 import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+# size of the reads when hashing the content of files
+HASH_CHUNK_SIZE = 8 * 1024 * 1024
+
 
 def run_subprocess(cmd, env=None, cwd=None, check=False):  # pragma: no cover
     logger.debug(f"Running command: {cmd} with env: {env}")
@@ -79,6 +87,96 @@ def hash_object(obj):  # pragma: no cover
     return hash_io_stream(f)
 
 
+class FileHashMemo:
+    """Memo of file content hashes, optionally saved to a JSON file. A hash is reused while the file is unchanged."""
+
+    def __init__(self, memo_path: Union[str, Path] = None):
+        self.memo_path = Path(memo_path) if memo_path else None
+        self.hashes: Dict[str, Tuple[int, int, int, str]] = {}
+        self.updated = False
+        self.lock = threading.Lock()
+        if self.memo_path and self.memo_path.is_file():
+            try:
+                with open(self.memo_path) as f:
+                    self.hashes = {k: tuple(v) for k, v in json.load(f).items()}
+            except (OSError, ValueError):
+                logger.warning(f"Could not read file hash memo {self.memo_path}. Starting with an empty memo.")
+
+    @staticmethod
+    def get_file_id(path: Union[str, Path]) -> Tuple[str, Tuple[int, int, int]]:
+        """Get the memo key of the file and the id of its current version: size, mtime and inode."""
+        stat = os.stat(path)
+        return str(Path(path).resolve()), (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+    def get(self, key: str, file_id: Tuple[int, int, int]) -> Optional[str]:
+        with self.lock:
+            entry = self.hashes.get(key)
+        return entry[3] if entry is not None and tuple(entry[:3]) == file_id else None
+
+    def put(self, key: str, file_id: Tuple[int, int, int], file_hash: str):
+        with self.lock:
+            self.hashes[key] = (*file_id, file_hash)
+            self.updated = True
+
+    def save(self):
+        with self.lock:
+            if not self.memo_path or not self.updated:
+                return
+            self.memo_path.parent.mkdir(parents=True, exist_ok=True)
+            # write to a temporary file first so that the memo is never left half written
+            tmp_path = self.memo_path.with_name(f"{self.memo_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(self.hashes, f)
+            os.replace(tmp_path, self.memo_path)
+            self.updated = False
+
+
+def hash_file_content(filename: Union[str, Path], memo: FileHashMemo = None) -> str:
+    """Hash the content of a file with blake2b, reusing the hash in the memo if the file is unchanged."""
+    if memo is not None:
+        # stat the file before reading it so that a change during the read is not stored under the new file id
+        key, file_id = memo.get_file_id(filename)
+        file_hash = memo.get(key, file_id)
+        if file_hash is not None:
+            return file_hash
+
+    blake2b_hash = hashlib.blake2b(digest_size=16)
+    buffer = bytearray(HASH_CHUNK_SIZE)
+    view = memoryview(buffer)
+    with open(filename, "rb", buffering=0) as f:
+        while True:
+            num_bytes = f.readinto(buffer)
+            if not num_bytes:
+                break
+            blake2b_hash.update(view[:num_bytes])
+    file_hash = blake2b_hash.hexdigest()
+
+    if memo is not None:
+        memo.put(key, file_id, file_hash)
+    return file_hash
+
+
+def hash_path_content(path: Union[str, Path], memo: FileHashMemo = None, max_workers: int = None) -> str:
+    """Hash the content of a file, or of all files under a directory in parallel along with their relative paths."""
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Cannot hash the content of {path} since it does not exist.")
+    if path.is_file():
+        path_hash = hash_file_content(path, memo)
+    else:
+        files = sorted(f for f in path.rglob("*") if f.is_file())
+        with ThreadPoolExecutor(max_workers=max_workers or min(len(files), os.cpu_count() or 1, 8) or 1) as executor:
+            file_hashes = list(executor.map(lambda f: hash_file_content(f, memo), files))
+        blake2b_hash = hashlib.blake2b(digest_size=16)
+        for file, file_hash in zip(files, file_hashes):
+            blake2b_hash.update(f"{file.relative_to(path).as_posix()}:{file_hash}\n".encode())
+        path_hash = blake2b_hash.hexdigest()
+
+    if memo is not None:
+        memo.save()
+    return path_hash
+
+
 def unflatten_dict(dictionary):  # pragma: no cover
     """
     Unflatten a dictionary with keys of the form "a.b.c" into a nested dictionary.
@@ -162,3 +260,58 @@ def tensor_data_to_device(data, device: str):
         return set(tensor_data_to_device(v, device) for v in data)
     else:
         return data
+
+
+def get_current_rss() -> int:
+    """
+    Get the current resident set size of the current process in bytes.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, AttributeError, ValueError):
+        # /proc is only available on Linux
+        try:
+            import psutil
+        except ImportError:
+            raise ImportError("Please install psutil to measure the memory of a process on this platform.") from None
+
+        return psutil.Process().memory_info().rss
+
+
+class PeakRSSMonitor:
+    """
+    Track the peak resident set size of the current process while the context is active.
+    """
+
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.peak_rss = 0
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def _poll(self):
+        while not self._stop_event.wait(self.interval):
+            self.peak_rss = max(self.peak_rss, get_current_rss())
+
+    def __enter__(self):
+        self.peak_rss = get_current_rss()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._poll, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._stop_event.set()
+        self._thread.join()
+        self.peak_rss = max(self.peak_rss, get_current_rss())
+
+
+def get_path_size(path: str) -> int:
+    """
+    Get the size of a file, or the total size of the files under a directory, in bytes.
+    """
+    path = Path(path)
+    if path.is_file():
+        return path.stat().st_size
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
@@ -0,0 +1,128 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------
+import json
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+from olive.common.config_utils import serialize_to_json
+from olive.common.utils import hash_dict, hash_file, hash_function
+from olive.data.constants import DataComponentType
+
+if TYPE_CHECKING:
+    from olive.data.config import DataConfig
+
+logger = logging.getLogger(__name__)
+
+DATASET_DIR_NAME = "dataset"
+METADATA_FILE_NAME = "metadata.json"
+
+
+def get_pre_process_cache_key(config: "DataConfig") -> str:
+    """
+    Get a stable key for the pre-processed dataset of a data config.
+
+    The key covers everything that the output of load_dataset -> pre_process depends on: the container type, the
+    type, params and source code of both components, and the contents of the user script.
+    Changes to the files under data_dir are not detected.
+    """
+    key = {"type": config.type}
+    components = {
+        DataComponentType.LOAD_DATASET.value: config.load_dataset,
+        DataComponentType.PRE_PROCESS_DATA.value: config.pre_process,
+    }
+    for component_type, component_func in components.items():
+        component = config.components[component_type]
+        key[component_type] = {
+            "type": component.type,
+            "params": serialize_to_json(component.params),
+            "source": hash_function(component_func),
+        }
+    if config.user_script and Path(config.user_script).is_file():
+        key["user_script"] = hash_file(config.user_script)
+    return hash_dict(key)
+
+
+def _get_arrow_dataset(dataset):
+    """
+    Return the huggingface dataset backing the pre-processed dataset and its label columns.
+
+    Returns (None, None) if the dataset cannot be stored in arrow format.
+    """
+    try:
+        from datasets import Dataset
+    except ImportError:
+        return None, None
+
+    from olive.data.component.dataset import BaseDataset
+
+    if isinstance(dataset, Dataset):
+        return dataset, None
+    # only the plain BaseDataset can be rebuilt from its data and label_cols
+    if type(dataset) is BaseDataset and isinstance(dataset.data, Dataset):
+        return dataset.data, dataset.label_cols
+    return None, None
+
+
+def load_pre_processed_dataset(config: "DataConfig"):
+    """
+    Load the pre-processed dataset of a data config from the cache.
+
+    The arrow files are memory-mapped so the dataset is not read into memory. Returns None on a cache miss.
+    """
+    cache_path = Path(config.cache_dir) / get_pre_process_cache_key(config)
+    metadata_path = cache_path / METADATA_FILE_NAME
+    if not metadata_path.exists():
+        return None
+
+    from datasets import load_from_disk
+
+    from olive.data.component.dataset import BaseDataset
+
+    with metadata_path.open("r") as f:
+        metadata = json.load(f)
+    logger.debug(f"Loading pre-processed dataset from cache {cache_path}")
+    dataset = load_from_disk(str(cache_path / DATASET_DIR_NAME))
+    if metadata["label_cols"] is None:
+        return dataset
+    return BaseDataset(dataset, label_cols=metadata["label_cols"])
+
+
+def save_pre_processed_dataset(config: "DataConfig", dataset) -> Optional[Path]:
+    """
+    Save the pre-processed dataset of a data config to the cache.
+
+    Only huggingface datasets, bare or wrapped in BaseDataset, are supported. Other datasets are not cached.
+    Returns the cache path if the dataset was saved.
+    """
+    arrow_dataset, label_cols = _get_arrow_dataset(dataset)
+    if arrow_dataset is None:
+        logger.debug(f"Pre-processed dataset of type {type(dataset).__name__} is not cacheable. Skipping.")
+        return None
+
+    cache_dir = Path(config.cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cache_path = cache_dir / get_pre_process_cache_key(config)
+
+    # write to a temporary directory first so that concurrent readers never see a partial entry
+    tmp_dir = Path(tempfile.mkdtemp(prefix=f"{cache_path.name}.", dir=cache_dir))
+    try:
+        dataset_dir = tmp_dir / DATASET_DIR_NAME
+        dataset_dir.mkdir()
+        arrow_dataset.save_to_disk(str(dataset_dir))
+        with (tmp_dir / METADATA_FILE_NAME).open("w") as f:
+            json.dump({"label_cols": label_cols}, f, indent=4)
+        os.rename(tmp_dir, cache_path)
+    except OSError:
+        # another process already populated the entry
+        if not (cache_path / METADATA_FILE_NAME).exists():
+            raise
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    logger.debug(f"Cached pre-processed dataset to {cache_path}")
+    return cache_path
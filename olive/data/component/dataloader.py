@@ -3,8 +3,6 @@
 # Licensed under the MIT License.
 # --------------------------------------------------------------------------
 
-from torch.utils.data import DataLoader
-
 from olive.data.registry import Registry
 
 
@@ -15,11 +13,15 @@ def skip_dataloader(_dataset):
 
 @Registry.register_default_dataloader()
 def default_dataloader(_dataset, batch_size=1, **kwargs):
+    from torch.utils.data import DataLoader
+
     return DataLoader(_dataset, batch_size=batch_size, **kwargs)
 
 
 @Registry.register_dataloader()
 def no_auto_batch_dataloader(_dataset, **kwargs):
+    from torch.utils.data import DataLoader
+
     # torch dataloader will automatically batch if batch_size is not None
     # this dataloader will not batch. Assumes that the dataset already returns a batch
     return DataLoader(_dataset, batch_size=None, **kwargs)
@@ -3,7 +3,6 @@
 # Licensed under the MIT License.
 # --------------------------------------------------------------------------
 
-from olive.data.component.dataset import DummyDataset, RawDataset
 from olive.data.registry import Registry
 
 
@@ -39,6 +38,8 @@ def huggingface_dataset(data_name=None, subset=None, split="validation", **kwarg
 
 @Registry.register_dataset()
 def dummy_dataset(input_shapes, input_names=None, input_types=None):
+    from olive.data.component.dataset import DummyDataset
+
     return DummyDataset(input_shapes, input_names, input_types)
 
 
@@ -53,6 +54,8 @@ def raw_dataset(
     input_order_file=None,
     annotations_file=None,
 ):
+    from olive.data.component.dataset import RawDataset
+
     return RawDataset(
         data_dir=data_dir,
         input_names=input_names,
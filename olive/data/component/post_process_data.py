@@ -2,9 +2,6 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 # --------------------------------------------------------------------------
-import torch
-import transformers
-
 from olive.data.registry import Registry
 
 
@@ -24,6 +21,9 @@ def text_classification_post_process(_output_data, **kwargs):
     Returns:
         object: Post-processed data.
     """
+    import torch
+    import transformers
+
     if isinstance(_output_data, transformers.modeling_outputs.SequenceClassifierOutput):
         _, preds = torch.max(_output_data.logits, dim=1)
     else:
@@ -3,8 +3,6 @@
 # Licensed under the MIT License.
 # --------------------------------------------------------------------------
 
-
-from olive.data.component.dataset import BaseDataset
 from olive.data.registry import Registry
 
 
@@ -29,16 +27,20 @@ def huggingface_pre_process(_dataset, model_name, input_cols, label_cols, **kwar
     Args:
         data (object): Data to be pre-processed.
         **kwargs: Additional arguments.
+            tokenizer_kwargs (dict): Arguments to create the tokenizer.
+            num_proc (int): Number of processes to tokenize the dataset in parallel.
 
     Returns:
         object: Pre-processed data.
     """
-    from transformers import AutoTokenizer
+    from olive.data.component.dataset import BaseDataset
+    from olive.model.hf_utils import get_tokenizer
 
     dataset = _dataset
+    # create the tokenizer once instead of in every batch. It is pickled to the map workers if num_proc > 1
+    tokenizer = get_tokenizer(model_name, **(kwargs.get("tokenizer_kwargs") or {}))
 
     def _tokenizer_and_align_labels(examples):
-        tokenizer = AutoTokenizer.from_pretrained(model_name)
         tokenized_inputs = tokenizer(
             *[examples[input_col] for input_col in input_cols],
             padding=kwargs.get("padding", True),
@@ -56,6 +58,7 @@ def huggingface_pre_process(_dataset, model_name, input_cols, label_cols, **kwar
         _tokenizer_and_align_labels,
         batched=kwargs.get("batched", True),
         remove_columns=dataset.column_names,
+        num_proc=kwargs.get("num_proc"),
     )
     tokenized_datasets.set_format("torch", output_all_columns=True)
     # label_cols is ["label"] since we added label_cols[0] as "label" to tokenized_inputs
@@ -42,6 +42,9 @@ class DataConfig(ConfigBase):
     user_script: Union[Path, str] = None
     script_dir: Union[Path, str] = None
 
+    # directory to persist the pre-processed dataset across evaluations, passes and runs. No caching if None
+    cache_dir: Union[Path, str] = None
+
     # use to update default components
     # 1. update default_components_type from DataContainer or DefaultDataComponentCombos
     # 2. update default_components from default_components_type
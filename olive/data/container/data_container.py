@@ -6,10 +6,12 @@ from typing import ClassVar
 
 from pydantic import BaseModel
 
+from olive.data.cache import load_pre_processed_dataset, save_pre_processed_dataset
 from olive.data.component.dataloader import default_calibration_dataloader
 from olive.data.config import DataConfig, DefaultDataComponentCombos
 from olive.data.constants import DataContainerType, DefaultDataContainer
 from olive.data.registry import Registry
+from olive.data.subset import DataSubsetConfig, get_subset_dataset
 
 
 @Registry.register(DataContainerType.DATA_CONTAINER, name=DefaultDataContainer.DATA_CONTAINER.value)
@@ -56,13 +58,31 @@ class DataContainer(BaseModel):
         """
         return self.config.dataloader(dataset, **self.config.dataloader_params)
 
-    def create_dataloader(self):
+    def create_pre_processed_dataset(self):
         """
-        Create dataloader
-        dataset -> preprocess -> dataloader
+        Create pre-processed dataset
+        dataset -> preprocess
+        If cache_dir is set in the config, the pre-processed dataset is loaded from or saved to the cache.
         """
+        if self.config.cache_dir:
+            pre_process_dataset = load_pre_processed_dataset(self.config)
+            if pre_process_dataset is not None:
+                return pre_process_dataset
+
         dataset = self.load_dataset()
         pre_process_dataset = self.pre_process(dataset)
+        if self.config.cache_dir:
+            save_pre_processed_dataset(self.config, pre_process_dataset)
+        return pre_process_dataset
+
+    def create_dataloader(self, subset: DataSubsetConfig = None):
+        """
+        Create dataloader
+        dataset -> preprocess -> dataloader
+        If subset is set, the dataloader only iterates over the subset of the pre-processed dataset.
+        """
+        pre_process_dataset = self.create_pre_processed_dataset()
+        pre_process_dataset = get_subset_dataset(pre_process_dataset, subset)
         return self.dataloader(pre_process_dataset)
 
     def create_calibration_dataloader(self):
@@ -0,0 +1,103 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------
+import logging
+import math
+from collections import defaultdict
+from typing import List
+
+from pydantic import validator
+
+from olive.common.config_utils import ConfigBase
+
+logger = logging.getLogger(__name__)
+
+_VALID_SUBSET_STRATEGIES = ["prefix", "stratified"]
+
+
+class DataSubsetConfig(ConfigBase):
+    # fraction of the samples in the dataset to use
+    fraction: float
+    # prefix: the first samples of the dataset
+    # stratified: the first samples of each label, so that the subset keeps the label distribution of the dataset
+    strategy: str = "prefix"
+
+    @validator("fraction")
+    def _validate_fraction(cls, v):
+        if not 0 < v <= 1:
+            raise ValueError(f"fraction must be in (0, 1], got {v}")
+        return v
+
+    @validator("strategy")
+    def _validate_strategy(cls, v):
+        if v not in _VALID_SUBSET_STRATEGIES:
+            raise ValueError(f"Unknown subset strategy: {v}. Valid strategies are {_VALID_SUBSET_STRATEGIES}")
+        return v
+
+
+def _get_label_key(label):
+    if hasattr(label, "tolist"):
+        label = label.tolist()
+    return str(label)
+
+
+def get_subset_indices(dataset, subset: DataSubsetConfig) -> List[int]:
+    """
+    Get the indices of the samples in the subset of the dataset.
+
+    The indices are deterministic and sorted so the subset keeps the order of the dataset.
+    """
+    dataset_len = len(dataset)
+    if subset.strategy == "prefix":
+        return list(range(math.ceil(dataset_len * subset.fraction)))
+
+    # stratified: the labels are the second item of the samples
+    label_indices = defaultdict(list)
+    for index in range(dataset_len):
+        label_indices[_get_label_key(dataset[index][1])].append(index)
+    indices = []
+    for indices_of_label in label_indices.values():
+        indices.extend(indices_of_label[: math.ceil(len(indices_of_label) * subset.fraction)])
+    return sorted(indices)
+
+
+def get_subset_dataset(dataset, subset: DataSubsetConfig):
+    """
+    Get the subset of the dataset.
+    """
+    if subset is None or subset.fraction == 1:
+        return dataset
+
+    indices = get_subset_indices(dataset, subset)
+    logger.debug(f"Using {len(indices)} of {len(dataset)} samples with {subset.strategy} strategy")
+    if hasattr(dataset, "select"):
+        # huggingface dataset
+        return dataset.select(indices)
+
+    from torch.utils.data import Subset
+
+    return Subset(dataset, indices)
+
+
+def get_subset_dataloader(dataloader, subset: DataSubsetConfig):
+    """
+    Get a dataloader over the subset of the dataset of a torch dataloader.
+
+    Other dataloaders are returned as is since their dataset is not known.
+    """
+    if subset is None or subset.fraction == 1:
+        return dataloader
+
+    from torch.utils.data import DataLoader
+
+    if not isinstance(dataloader, DataLoader):
+        logger.warning(f"Cannot use a subset of dataloader of type {type(dataloader)}. Using the full dataloader.")
+        return dataloader
+    return DataLoader(
+        get_subset_dataset(dataloader.dataset, subset),
+        batch_size=dataloader.batch_size,
+        collate_fn=dataloader.collate_fn,
+        num_workers=dataloader.num_workers,
+        drop_last=dataloader.drop_last,
+    )
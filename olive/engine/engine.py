@@ -12,16 +12,19 @@ from typing import Any, Dict, List, Optional, Tuple, Type, Union
 import olive.cache as cache_utils
 from olive.common.config_utils import ConfigBase, validate_config
 from olive.common.utils import hash_dict
+from olive.data.subset import DataSubsetConfig
 from olive.engine.config import PRUNED_CONFIG, EngineConfig
 from olive.engine.footprint import Footprint, FootprintNode, FootprintNodeMetric
 from olive.engine.packaging.packaging_config import PackagingConfig
 from olive.engine.packaging.packaging_generator import generate_output_artifacts
 from olive.evaluator.metric import Metric, MetricResult, joint_metric_key
+from olive.evaluator.metric_config import MetricGoal
 from olive.evaluator.olive_evaluator import OliveEvaluatorConfig
 from olive.exception import OlivePassException
 from olive.hardware import AcceleratorLookup, AcceleratorSpec, Device
 from olive.model import ModelConfig, OliveModel
 from olive.passes.olive_pass import Pass
+from olive.resource_path import ResourcePath, ResourcePathConfig, create_resource_path
 from olive.strategy.search_strategy import SearchStrategy
 from olive.systems.common import SystemType
 from olive.systems.local import LocalSystem
@@ -278,6 +281,10 @@ class Engine:
         output_dir: Path = Path(output_dir) if output_dir else Path.cwd()
         output_dir.mkdir(parents=True, exist_ok=True)
 
+        # download the non-local resources concurrently before any pass or evaluation needs them
+        # a resource that fails here is downloaded again when it is used, so unused resources don't fail the run
+        cache_utils.download_resources(self._get_non_local_resources(input_model), raise_errors=False)
+
         outputs = {}
         pf_footprints = {}
         for accelerator_spec in self.accelerator_specs:
@@ -503,7 +510,9 @@ class Engine:
             logger.debug(f"Step {iter_num} with search point {next_step['search_point']} ...")
 
             # run all the passes in the step
-            should_prune, signal, model_ids = self._run_passes(next_step["passes"], model, model_id, accelerator_spec)
+            should_prune, signal, model_ids = self._run_passes(
+                next_step["passes"], model, model_id, accelerator_spec, next_step.get("subset")
+            )
 
             # record feedback signal
             self.search_strategy.record_feedback_signal(next_step["search_point"], signal, model_ids, should_prune)
@@ -717,6 +726,53 @@ class Engine:
 
         return model
 
+    def _get_non_local_resources(self, input_model: OliveModel) -> List[Tuple[ResourcePath, str]]:
+        """
+        Get the non-local resources of the run that are downloaded before use, with the cache directory of each.
+
+        These are the input model, the data dirs of the metrics and the resources in the pass configs. Resources used
+        on AzureML systems are not included since they are not downloaded.
+        """
+        resources = OrderedDict()
+
+        def add_resource(resource_path: Optional[ResourcePath], cache_dir: str):
+            if resource_path is None or resource_path.is_local_resource() or resource_path.is_string_name():
+                return
+            resources[hash_dict({"resource_path": resource_path.to_json(), "cache_dir": str(cache_dir)})] = (
+                resource_path,
+                cache_dir,
+            )
+
+        # (host, evaluator config, config values) of the pass configs and of the registered passes
+        passes = [
+            (config["host"] or self.host, config["evaluator"], config["config"].values())
+            for config in self.pass_config.values()
+        ]
+        passes.extend(
+            (item["host"] or self.host, item["evaluator"], item["pass"].to_json()["config"].values())
+            for item in self.passes.values()
+        )
+        if any(system.system_type != SystemType.AzureML for system in [self.target, *(host for host, _, _ in passes)]):
+            # see _prepare_non_local_model
+            add_resource(input_model.model_resource_path, self._config.cache_dir)
+
+        # the data resources are looked up by get_local_path in its default cache directory
+        evaluator_configs = [(self.evaluator_config, self.target)]
+        for host, evaluator_config, config_values in passes:
+            evaluator_configs.append((evaluator_config, self.target))
+            if host.system_type != SystemType.AzureML:
+                for value in config_values:
+                    add_resource(_get_resource_path(value), cache_utils.RESOURCE_CACHE_DIR)
+        for evaluator_config, system in evaluator_configs:
+            if evaluator_config is None or system.system_type == SystemType.AzureML:
+                continue
+            for metric in evaluator_config.metrics:
+                add_resource(
+                    _get_resource_path(getattr(metric.user_config, "data_dir", None)), cache_utils.RESOURCE_CACHE_DIR
+                )
+
+        return list(resources.values())
+
     def _init_input_model(self, input_model: OliveModel):
         """
         Initialize the input model.
@@ -796,10 +852,12 @@ class Engine:
         model: OliveModel,
         model_id: str,
         accelerator_spec: AcceleratorSpec,
+        subset: DataSubsetConfig = None,
     ):
         """
         Run all the passes in the order they were registered.
         the passes is the list of (pass_name, pass_search_point) tuples
+        If subset is set, the output model is only evaluated on the subset of the evaluation data.
         """
         should_prune = False
         # run all the passes in the step
@@ -819,8 +877,12 @@ class Engine:
                 # skip evaluation if no search and no evaluator
                 signal = None
             else:
-                signal = self._evaluate_model(model, model_id, evaluator_config, accelerator_spec)
+                signal = self._evaluate_model(model, model_id, evaluator_config, accelerator_spec, subset)
             logger.debug(f"Signal: {signal}")
+            if signal and signal.get_early_stopped_metrics():
+                # the goals cannot be met, the partial metrics must not be used to rank the search point
+                should_prune = True
+                logger.info(f"Evaluation of model {model_id} stopped early since the goals cannot be met. Not ranked.")
         else:
             signal = None
             logger.warning("Skipping evaluation as model was pruned")
@@ -961,15 +1023,45 @@ class Engine:
         else:
             return None
 
+    def _resolve_early_stop_goals(self, metrics: List[Metric], accelerator_spec: AcceleratorSpec) -> List[Metric]:
+        """
+        Replace the goals of the metrics with accuracy early stopping by the resolved threshold goals.
+
+        The evaluators can only stop early against threshold goals. Relative goals are resolved against the baseline
+        and recorded in the objective dict of the footprint. Until then, the input model is being evaluated as the
+        baseline, so early stopping is disabled and its metrics are computed over the whole data.
+        """
+        objective_dict = self.footprints[accelerator_spec].objective_dict
+        resolved_metrics = []
+        for metric in metrics:
+            if not getattr(metric.user_config, "early_stop", None):
+                resolved_metrics.append(metric)
+                continue
+            metric = metric.copy(deep=True)
+            if not objective_dict:
+                metric.user_config.early_stop = None
+                resolved_metrics.append(metric)
+                continue
+            for sub_type in metric.sub_types:
+                objective = objective_dict.get(joint_metric_key(metric.name, sub_type.name))
+                if sub_type.goal is not None and objective and objective["goal"] is not None:
+                    sub_type.goal = MetricGoal(type="threshold", value=objective["goal"])
+            resolved_metrics.append(metric)
+        return resolved_metrics
+
     def _evaluate_model(
         self,
         model: OliveModel,
         model_id: str,
         evaluator_config: OliveEvaluatorConfig,
         accelerator_spec: AcceleratorSpec,
+        subset: DataSubsetConfig = None,
     ):
         """
         Evaluate a model.
+
+        If subset is set, the model is only evaluated on the subset of the evaluation data. The result is cached
+        separately and not recorded in the footprints.
         """
         logger.debug("Evaluating model ...")
         accelerator_suffix = f"-{accelerator_spec}" if accelerator_spec else ""
@@ -979,28 +1071,41 @@ class Engine:
         else:
             model_id_with_accelerator = model_id
 
+        metrics = evaluator_config.metrics if evaluator_config else []
+        if subset is not None:
+            model_id_with_accelerator = f"{model_id_with_accelerator}-subset-{hash_dict(subset.dict())}"
+            metrics = [metric.copy(deep=True) for metric in metrics]
+            for metric in metrics:
+                metric.user_config.subset = subset
+
         # load evaluation from cache if it exists
         signal = self._load_evaluation(model_id_with_accelerator)
         if signal is not None:
             logger.debug("Loading evaluation from cache ...")
-            # footprint evaluation
-            self.footprints[accelerator_spec].record(
-                model_id=model_id,
-                metrics=FootprintNodeMetric(
-                    value=signal,
-                    is_goals_met=False,
-                ),
-            )
+            if subset is None:
+                # footprint evaluation
+                self.footprints[accelerator_spec].record(
+                    model_id=model_id,
+                    metrics=FootprintNodeMetric(
+                        value=signal,
+                        is_goals_met=False,
+                    ),
+                )
             return signal
 
         # evaluate model
-        metrics = evaluator_config.metrics if evaluator_config else []
         if self.target.system_type != SystemType.AzureML:
             model = self._prepare_non_local_model(model)
+        if subset is None:
+            metrics = self._resolve_early_stop_goals(metrics, accelerator_spec)
         signal = self.target.evaluate_model(model, metrics, accelerator_spec)
 
         # cache evaluation
-        self._cache_evaluation(model_id_with_accelerator, signal)
+        # early stopped results depend on the goals and are only partial, so they are not reused by later runs
+        if not signal.get_early_stopped_metrics():
+            self._cache_evaluation(model_id_with_accelerator, signal)
+        if subset is not None:
+            return signal
 
         # footprint evaluation
         self.footprints[accelerator_spec].record(
@@ -1028,3 +1133,19 @@ class Engine:
         )
         selected_footprint_nodes = sorted_footprint_node_list[:k]
         return selected_footprint_nodes
+
+
+def _get_resource_path(value: Any) -> Optional[ResourcePath]:
+    """
+    Get the resource path of a config value, or None if the value is not a resource.
+    """
+    if isinstance(value, str) and not value.startswith("azureml://"):
+        # other strings are local paths or string names
+        return None
+    if not isinstance(value, (str, dict, ResourcePath, ResourcePathConfig)):
+        return None
+    try:
+        return create_resource_path(value)
+    except ValueError:
+        # not a valid resource path config, pydantic's ValidationError is also a ValueError
+        return None
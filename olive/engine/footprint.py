@@ -20,11 +20,16 @@ class FootprintNodeMetric(ConfigBase):
     cmp_direction: will be auto suggested. The format will be like: {"metric_name": 1, ...},
         1: higher is better, -1: lower is better
     is_goals_met: if the goals set by users is met
+    is_early_stopped: if the evaluation stopped early since the goals cannot be met. The metrics are computed on part
+        of the data, so the node is not a candidate.
+    early_stop_reason: why the evaluation stopped early
     """
 
     value: MetricResult = None
     cmp_direction: DefaultDict[str, int] = None
     is_goals_met: bool = False
+    is_early_stopped: bool = False
+    early_stop_reason: str = None
 
 
 class FootprintNode(ConfigBase):
@@ -99,6 +104,14 @@ class Footprint:
                     is_goals_met.append(v.metrics.value[metric_name].value * cmp_direction >= _goal)
             self.nodes[k].metrics.is_goals_met = all(is_goals_met)
 
+            early_stopped_metrics = v.metrics.value.get_early_stopped_metrics() if v.metrics.value else []
+            if early_stopped_metrics:
+                self.nodes[k].metrics.is_goals_met = False
+                self.nodes[k].metrics.is_early_stopped = True
+                self.nodes[k].metrics.early_stop_reason = (
+                    f"The evaluation of {', '.join(early_stopped_metrics)} stopped early since the goals cannot be met."
+                )
+
     def record(self, foot_print_node: FootprintNode = None, **kwargs):
         _model_id = kwargs.get("model_id", None)
         if foot_print_node is not None:
@@ -114,7 +127,7 @@ class Footprint:
         return {
             k: v
             for k, v in self.nodes.items()
-            if not self._is_empty_metric(v.metrics) and v.parent_model_id is not None
+            if not self._is_empty_metric(v.metrics) and v.parent_model_id is not None and not v.metrics.is_early_stopped
         }
 
     def mark_pareto_frontier(self):
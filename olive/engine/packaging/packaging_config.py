@@ -3,6 +3,8 @@
 # Licensed under the MIT License.
 # --------------------------------------------------------------------------
 from enum import Enum
+from pathlib import Path
+from typing import Union
 
 from olive.common.config_utils import ConfigBase
 
@@ -22,3 +24,6 @@ class PackagingConfig(ConfigBase):
 
     type: PackagingType = PackagingType.Zipfile
     name: str = "OutputModels"
+    # directory of the downloaded onnxruntime packages, reused by the next packaging runs. A directory with the
+    # packages already in its Python and NuGet subdirectories can be used to package without network access
+    package_cache_dir: Union[Path, str] = None
@@ -4,14 +4,17 @@
 # --------------------------------------------------------------------------
 import json
 import logging
+import os
 import platform
 import shutil
 import tempfile
 import urllib.request
+import zipfile
 from collections import OrderedDict
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from pathlib import Path
 from string import Template
-from typing import Dict
+from typing import Dict, List, Optional, Tuple, Union
 
 import pkg_resources
 
@@ -24,6 +27,11 @@ from olive.resource_path import ResourceType, create_resource_path
 
 logger = logging.getLogger(__name__)
 
+# suffixes of the files stored in the zip file without compression
+_STORED_SUFFIXES = {".onnx", ".data", ".bin", ".pb", ".whl", ".nupkg", ".zip", ".gz"}
+_MAX_PACKAGING_WORKERS = 4
+NIGHTLY_PYTHON_INDEX_URL = "https://aiinfra.pkgs.visualstudio.com/PublicPackages/_packaging/ORT-Nightly/pypi/simple/"
+
 
 def generate_output_artifacts(
     packaging_config: PackagingConfig,
@@ -46,102 +54,154 @@ def _generate_zipfile_output(
 ) -> None:
     logger.info("Packaging Zipfile output artifacts")
     cur_path = Path(__file__).parent
-    with tempfile.TemporaryDirectory() as tempdir:
+    with tempfile.TemporaryDirectory() as tempdir, ThreadPoolExecutor(max_workers=_MAX_PACKAGING_WORKERS) as executor:
         tempdir = Path(tempdir)
-        _package_sample_code(cur_path, tempdir)
+        # the onnxruntime packages are downloaded while the candidate models are prepared
+        ort_future = executor.submit(
+            _package_onnxruntime_packages,
+            tempdir,
+            next(iter(pf_footprints.values())),
+            packaging_config.package_cache_dir,
+        )
+        candidate_futures = []
         for accelerator_spec, pf_footprint in pf_footprints.items():
             if pf_footprint.nodes and footprints[accelerator_spec].nodes:
-                _package_candidate_models(tempdir, footprints[accelerator_spec], pf_footprint, accelerator_spec)
-        _package_onnxruntime_packages(tempdir, next(iter(pf_footprints.values())))
-        shutil.make_archive(packaging_config.name, "zip", tempdir)
-        shutil.move(f"{packaging_config.name}.zip", output_dir / f"{packaging_config.name}.zip")
+                candidate_futures.extend(
+                    _package_candidate_models(
+                        tempdir, footprints[accelerator_spec], pf_footprint, accelerator_spec, executor
+                    )
+                )
+
+        # the files are streamed into the zip file from where they are, so every file is read and written once
+        output_dir.mkdir(parents=True, exist_ok=True)
+        zip_path = output_dir / f"{packaging_config.name}.zip"
+        tmp_zip_path = output_dir / f"{packaging_config.name}.zip.tmp"
+        try:
+            with zipfile.ZipFile(tmp_zip_path, "w") as zip_file:
+                _write_to_zip(zip_file, _package_sample_code(cur_path))
+                for future in candidate_futures:
+                    _write_to_zip(zip_file, future.result())
+                ort_future.result()
+                _write_to_zip(zip_file, _get_dir_entries(tempdir / "ONNXRuntimePackages", "ONNXRuntimePackages"))
+        except Exception:
+            # the zip file is not created if opening it failed
+            if tmp_zip_path.exists():
+                tmp_zip_path.unlink()
+            raise
+        os.replace(tmp_zip_path, zip_path)
+
+
+def _get_compress_type(file_name: str) -> int:
+    # model weights and packages hardly compress, so they are stored to avoid spending time deflating them
+    return zipfile.ZIP_STORED if Path(file_name).suffix.lower() in _STORED_SUFFIXES else zipfile.ZIP_DEFLATED
+
+
+def _write_to_zip(zip_file: zipfile.ZipFile, entries: List[Tuple[str, Union[Path, bytes]]]) -> None:
+    """
+    Write the entries to the zip file. An entry is an archive name and either the path of the file or its content.
+    """
+    for arcname, source in entries:
+        compress_type = _get_compress_type(arcname)
+        if isinstance(source, bytes):
+            zip_file.writestr(arcname, source, compress_type=compress_type)
+        else:
+            zip_file.write(source, arcname, compress_type=compress_type)
+
+
+def _get_dir_entries(dir_path: Path, arcname: str) -> List[Tuple[str, Path]]:
+    """
+    Get the zip entries of the files in the directory. The directories are included so that empty ones are kept.
+    """
+    if not dir_path.is_dir():
+        return []
+    entries = [(arcname, dir_path)]
+    entries.extend((f"{arcname}/{path.relative_to(dir_path).as_posix()}", path) for path in sorted(dir_path.rglob("*")))
+    return entries
 
 
-def _package_sample_code(cur_path, tempdir):
-    shutil.copytree(cur_path / "sample_code", tempdir / "SampleCode")
+def _package_sample_code(cur_path) -> List[Tuple[str, Path]]:
+    return _get_dir_entries(cur_path / "sample_code", "SampleCode")
 
 
 def _package_candidate_models(
-    tempdir, footprint: Footprint, pf_footprint: Footprint, accelerator_spec: AcceleratorSpec
-) -> None:
-    candidate_models_dir = tempdir / "CandidateModels"
-    model_rank = 1
-    for model_id, node in pf_footprint.nodes.items():
-        model_dir = candidate_models_dir / f"{accelerator_spec}" / f"BestCandidateModel_{model_rank}"
-        model_dir.mkdir(parents=True, exist_ok=True)
-        model_rank += 1
-        # Copy model file
-        model_path = pf_footprint.get_model_path(model_id)
-        model_resource_path = create_resource_path(model_path) if model_path else None
-        model_type = pf_footprint.get_model_type(model_id)
-        if model_type == "ONNXModel":
-            with tempfile.TemporaryDirectory(dir=model_dir, prefix="olive_tmp") as tempdir:
-                # save to tempdir first since model_path may be a folder
-                temp_resource_path = create_resource_path(model_resource_path.save_to_dir(tempdir, "model", True))
-                # save to model_dir
-                if temp_resource_path.type == ResourceType.LocalFile:
-                    # if model_path is a file, rename it to model_dir / model.onnx
-                    Path(temp_resource_path.get_path()).rename(model_dir / "model.onnx")
-                elif temp_resource_path.type == ResourceType.LocalFolder:
-                    # if model_path is a folder, save all files in the folder to model_dir / file_name
-                    # file_name for .onnx file is model.onnx, otherwise keep the original file name
-                    model_config = pf_footprint.get_model_config(model_id)
-                    onnx_file_name = model_config.get("onnx_file_name")
-                    onnx_model = ONNXModel(temp_resource_path, onnx_file_name)
-                    for file in Path(temp_resource_path.get_path()).iterdir():
-                        if file.name == Path(onnx_model.model_path).name:
-                            file_name = "model.onnx"
-                        else:
-                            file_name = file.name
-                        Path(file).rename(model_dir / file_name)
-        elif model_type == "OpenVINOModel":
-            model_resource_path.save_to_dir(model_dir, "model", True)
-        else:
-            raise ValueError(f"Unsupported model type: {model_type} for packaging")
-
-        # Copy inference config
-        inference_config_path = str(model_dir / "inference_config.json")
-        inference_config = pf_footprint.get_model_inference_config(model_id)
-
-        # Add use_ort_extensions to inference config if needed
-        use_ort_extensions = pf_footprint.get_use_ort_extensions(model_id)
-        if use_ort_extensions:
-            inference_config = inference_config or {}
-            inference_config["use_ort_extensions"] = True
-
-        with open(inference_config_path, "w") as f:
-            json.dump(inference_config, f)
-
-        # Copy Passes configurations
-        configuration_path = str(model_dir / "configurations.json")
-        with open(configuration_path, "w") as f:
-            json.dump(OrderedDict(reversed(footprint.trace_back_run_history(model_id).items())), f)
-
-        # Copy metrics
-        # TODO: Add target info to metrics file
-        metric_path = str(model_dir / "metrics.json")
-        with open(metric_path, "w") as f:
-            f.write(node.json())
-
-
-def _package_onnxruntime_packages(tempdir, pf_footprint: Footprint):
-    NIGHTLY_PYTHON_CPU_COMMAND = Template(
-        "python -m pip download -i "
-        "https://aiinfra.pkgs.visualstudio.com/PublicPackages/_packaging/ORT-Nightly/pypi/simple/ "
-        "ort-nightly==$ort_version --no-deps -d $python_download_path"
-    )
-    STABLE_PYTHON_CPU_COMMAND = Template(
-        "python -m pip download onnxruntime==$ort_version --no-deps -d $python_download_path"
-    )
-    NIGHTLY_PYTHON_GPU_COMMAND = Template(
-        "python -m pip download -i "
-        "https://aiinfra.pkgs.visualstudio.com/PublicPackages/_packaging/ORT-Nightly/pypi/simple/ "
-        "ort-nightly-gpu==$ort_version --no-deps -d $python_download_path"
-    )
-    STABLE_PYTHON_GPU_COMMAND = Template(
-        "python -m pip download onnxruntime-gpu==$ort_version --no-deps -d $python_download_path"
-    )
+    tempdir, footprint: Footprint, pf_footprint: Footprint, accelerator_spec: AcceleratorSpec, executor: Executor
+) -> List[Future]:
+    """
+    Prepare the candidate models concurrently. Every future returns the zip entries of a candidate model.
+    """
+    futures = []
+    for model_rank, (model_id, node) in enumerate(pf_footprint.nodes.items(), 1):
+        model_dir = f"CandidateModels/{accelerator_spec}/BestCandidateModel_{model_rank}"
+        futures.append(
+            executor.submit(
+                _package_candidate_model,
+                tempdir / f"{accelerator_spec}_{model_rank}",
+                model_dir,
+                footprint,
+                pf_footprint,
+                model_id,
+                node,
+            )
+        )
+    return futures
+
+
+def _package_candidate_model(
+    tempdir: Path, model_dir: str, footprint: Footprint, pf_footprint: Footprint, model_id: str, node
+) -> List[Tuple[str, Union[Path, bytes]]]:
+    entries = []
+    # Model files
+    model_path = pf_footprint.get_model_path(model_id)
+    model_resource_path = create_resource_path(model_path) if model_path else None
+    if model_resource_path and not model_resource_path.is_local_resource():
+        # only non-local models are saved before packaging
+        model_resource_path = create_resource_path(model_resource_path.save_to_dir(tempdir, "model", True))
+    model_type = pf_footprint.get_model_type(model_id)
+    if model_type == "ONNXModel":
+        source_path = Path(model_resource_path.get_path())
+        if model_resource_path.type == ResourceType.LocalFile:
+            # if model_path is a file, package it as model_dir / model.onnx
+            entries.append((f"{model_dir}/model.onnx", source_path))
+        elif model_resource_path.type == ResourceType.LocalFolder:
+            # if model_path is a folder, package all files in the folder as model_dir / file_name
+            # file_name for .onnx file is model.onnx, otherwise keep the original file name
+            model_config = pf_footprint.get_model_config(model_id)
+            onnx_file_name = model_config.get("onnx_file_name")
+            onnx_model = ONNXModel(model_resource_path, onnx_file_name)
+            for file in sorted(source_path.iterdir()):
+                if file.is_dir():
+                    entries.extend(_get_dir_entries(file, f"{model_dir}/{file.name}"))
+                elif file.name == Path(onnx_model.model_path).name:
+                    entries.append((f"{model_dir}/model.onnx", file))
+                else:
+                    entries.append((f"{model_dir}/{file.name}", file))
+    elif model_type == "OpenVINOModel":
+        entries.extend(_get_dir_entries(Path(model_resource_path.get_path()), f"{model_dir}/model"))
+    else:
+        raise ValueError(f"Unsupported model type: {model_type} for packaging")
+
+    # Inference config
+    inference_config = pf_footprint.get_model_inference_config(model_id)
+
+    # Add use_ort_extensions to inference config if needed
+    use_ort_extensions = pf_footprint.get_use_ort_extensions(model_id)
+    if use_ort_extensions:
+        inference_config = inference_config or {}
+        inference_config["use_ort_extensions"] = True
+
+    entries.append((f"{model_dir}/inference_config.json", json.dumps(inference_config).encode()))
 
+    # Passes configurations
+    configurations = OrderedDict(reversed(footprint.trace_back_run_history(model_id).items()))
+    entries.append((f"{model_dir}/configurations.json", json.dumps(configurations).encode()))
+
+    # Metrics
+    # TODO: Add target info to metrics file
+    entries.append((f"{model_dir}/metrics.json", node.json().encode()))
+    return entries
+
+
+def _package_onnxruntime_packages(tempdir, pf_footprint: Footprint, package_cache_dir: Optional[Path] = None):
     installed_packages = pkg_resources.working_set
     onnxruntime_pkg = [i for i in installed_packages if i.key.startswith("onnxruntime")]
     ort_nightly_pkg = [i for i in installed_packages if i.key.startswith("ort-nightly")]
@@ -154,6 +214,7 @@ def _package_onnxruntime_packages(tempdir, pf_footprint: Footprint):
 
     # If both nightly and stable are installed, use nightly
     ort_version = ort_nightly_pkg[0].version if is_nightly else onnxruntime_pkg[0].version
+    index_url = NIGHTLY_PYTHON_INDEX_URL if is_nightly else None
 
     should_package_ort_cpu = False
     should_package_ort_gpu = False
@@ -179,53 +240,66 @@ def _package_onnxruntime_packages(tempdir, pf_footprint: Footprint):
         python_download_path = tempdir / "ONNXRuntimePackages" / "Python"
         python_download_path.mkdir(parents=True, exist_ok=True)
         python_download_path = str(python_download_path)
-        _download_ort_extensions_package(use_ort_extensions, python_download_path)
+        _download_ort_extensions_package(use_ort_extensions, python_download_path, package_cache_dir)
 
         if should_package_ort_cpu:
-            if is_nightly:
-                download_command = NIGHTLY_PYTHON_CPU_COMMAND.substitute(
-                    ort_version=ort_version, python_download_path=python_download_path
-                )
-            else:
-                download_command = STABLE_PYTHON_CPU_COMMAND.substitute(
-                    ort_version=ort_version, python_download_path=python_download_path
-                )
-            run_subprocess(download_command)
-        if should_package_ort_gpu:
-            if is_nightly:
-                download_command = NIGHTLY_PYTHON_GPU_COMMAND.substitute(
-                    ort_version=ort_version, python_download_path=python_download_path
-                )
-            else:
-                download_command = STABLE_PYTHON_GPU_COMMAND.substitute(
-                    ort_version=ort_version, python_download_path=python_download_path
-                )
-            run_subprocess(download_command)
-
-        # Download CPP onnxruntime package
-        cpp_ort_download_path = tempdir / "ONNXRuntimePackages" / "cpp"
-        cpp_ort_download_path.mkdir(parents=True, exist_ok=True)
-        if should_package_ort_cpu:
-            cpp_download_path = str(cpp_ort_download_path / f"microsoft.ml.onnxruntime.{ort_version}.nupkg")
-            _download_c_packages(True, is_nightly, ort_version, cpp_download_path)
+            package_name = "ort-nightly" if is_nightly else "onnxruntime"
+            _download_python_package(
+                f"{package_name}=={ort_version}", python_download_path, package_cache_dir, index_url
+            )
         if should_package_ort_gpu:
-            cpp_download_path = str(cpp_ort_download_path / f"microsoft.ml.onnxruntime.gpu.{ort_version}.nupkg")
-            _download_c_packages(False, is_nightly, ort_version, cpp_download_path)
+            package_name = "ort-nightly-gpu" if is_nightly else "onnxruntime-gpu"
+            _download_python_package(
+                f"{package_name}=={ort_version}", python_download_path, package_cache_dir, index_url
+            )
 
-        # Download CS onnxruntime package
-        cs_ort_download_path = tempdir / "ONNXRuntimePackages" / "cs"
-        cs_ort_download_path.mkdir(parents=True, exist_ok=True)
-        if should_package_ort_cpu:
-            cs_download_path = str(cs_ort_download_path / f"microsoft.ml.onnxruntime.{ort_version}.nupkg")
-            _download_c_packages(True, is_nightly, ort_version, cs_download_path)
-        if should_package_ort_gpu:
-            _download_c_packages(False, is_nightly, ort_version, cs_download_path)
+        # Download CPP and CS onnxruntime packages
+        for language in ["cpp", "cs"]:
+            ort_download_path = tempdir / "ONNXRuntimePackages" / language
+            ort_download_path.mkdir(parents=True, exist_ok=True)
+            if should_package_ort_cpu:
+                download_path = str(ort_download_path / f"microsoft.ml.onnxruntime.{ort_version}.nupkg")
+                _download_c_packages(True, is_nightly, ort_version, download_path, package_cache_dir)
+            if should_package_ort_gpu:
+                download_path = str(ort_download_path / f"microsoft.ml.onnxruntime.gpu.{ort_version}.nupkg")
+                _download_c_packages(False, is_nightly, ort_version, download_path, package_cache_dir)
 
     except Exception as e:
         logger.error(f"Failed to download onnxruntime package. Please manually download onnxruntime package. {e}")
 
 
-def _download_ort_extensions_package(use_ort_extensions: bool, download_path: str):
+def _download_python_package(
+    package: str, download_path: str, package_cache_dir: Optional[Path] = None, index_url: Optional[str] = None
+):
+    """
+    Download the wheel of the package with pip.
+
+    With a package cache directory, the wheel is taken from the Python subdirectory of the cache without accessing the
+    package index. If it is not there, it is downloaded to the cache first.
+    """
+    index_option = f"-i {index_url} " if index_url else ""
+    if package_cache_dir is None:
+        run_subprocess(f"python -m pip download {index_option}{package} --no-deps -d {download_path}")
+        return
+
+    python_cache_dir = Path(package_cache_dir) / "Python"
+    python_cache_dir.mkdir(parents=True, exist_ok=True)
+    cached_download_command = (
+        f"python -m pip download {package} --no-deps --no-index --find-links {python_cache_dir} -d {download_path}"
+    )
+    returncode, _, _ = run_subprocess(cached_download_command)
+    if returncode == 0:
+        logger.debug(f"Packaged {package} from package cache {python_cache_dir}")
+        return
+
+    logger.info(f"{package} is not in package cache {python_cache_dir}. Downloading it to the cache.")
+    run_subprocess(f"python -m pip download {index_option}{package} --no-deps -d {python_cache_dir}", check=True)
+    run_subprocess(cached_download_command, check=True)
+
+
+def _download_ort_extensions_package(
+    use_ort_extensions: bool, download_path: str, package_cache_dir: Optional[Path] = None
+):
     if use_ort_extensions:
         try:
             import onnxruntime_extensions
@@ -239,23 +313,25 @@ def _download_ort_extensions_package(use_ort_extensions: bool, download_path: st
         if version.startswith("0.8.0."):
             system = platform.system()
             if system == "Windows":
-                download_command = (
-                    "python -m pip download -i "
-                    "https://aiinfra.pkgs.visualstudio.com/PublicPackages/_packaging/ORT-Nightly/pypi/simple/ "
-                    f"onnxruntime-extensions=={version} --no-deps -d {download_path}"
+                _download_python_package(
+                    f"onnxruntime-extensions=={version}", download_path, package_cache_dir, NIGHTLY_PYTHON_INDEX_URL
                 )
-                run_subprocess(download_command)
             elif system == "Linux":
                 logger.warning(
                     "ONNXRuntime-Extensions nightly package is not available for Linux. "
                     "Skip packaging ONNXRuntime-Extensions package. Please manually install ONNXRuntime-Extensions."
                 )
         else:
-            download_command = f"python -m pip download onnxruntime-extensions=={version} --no-deps -d {download_path}"
-            run_subprocess(download_command)
+            _download_python_package(f"onnxruntime-extensions=={version}", download_path, package_cache_dir)
 
 
-def _download_c_packages(is_cpu: bool, is_nightly: bool, ort_version: str, download_path: str):
+def _download_c_packages(
+    is_cpu: bool, is_nightly: bool, ort_version: str, download_path: str, package_cache_dir: Optional[Path] = None
+):
+    """
+    Download the NuGet package. With a package cache directory, the package is taken from the NuGet subdirectory of
+    the cache, and downloaded to the cache first if it is not there.
+    """
     NIGHTLY_C_CPU_LINK = Template(
         "https://aiinfra.visualstudio.com/PublicPackages/_artifacts/feed/ORT-Nightly/NuGet/"
         "Microsoft.ML.OnnxRuntime/overview/$ort_version"
@@ -267,12 +343,26 @@ def _download_c_packages(is_cpu: bool, is_nightly: bool, ort_version: str, downl
     )
     STABLE_C_GPU_LINK = Template("https://www.nuget.org/api/v2/package/Microsoft.ML.OnnxRuntime.Gpu/$ort_version")
     if is_cpu:
-        if is_nightly:
-            urllib.request.urlretrieve(NIGHTLY_C_CPU_LINK.substitute(ort_version=ort_version), download_path)
-        else:
-            urllib.request.urlretrieve(STABLE_C_CPU_LINK.substitute(ort_version=ort_version), download_path)
+        link = NIGHTLY_C_CPU_LINK if is_nightly else STABLE_C_CPU_LINK
     else:
-        if is_nightly:
-            urllib.request.urlretrieve(NIGHTLY_C_GPU_LINK.substitute(ort_version=ort_version), download_path)
-        else:
-            urllib.request.urlretrieve(STABLE_C_GPU_LINK.substitute(ort_version=ort_version), download_path)
+        link = NIGHTLY_C_GPU_LINK if is_nightly else STABLE_C_GPU_LINK
+    url = link.substitute(ort_version=ort_version)
+
+    if package_cache_dir is None:
+        urllib.request.urlretrieve(url, download_path)
+        return
+
+    cached_path = Path(package_cache_dir) / "NuGet" / Path(download_path).name
+    if cached_path.exists():
+        logger.debug(f"Packaged {cached_path.name} from package cache {cached_path.parent}")
+    else:
+        logger.info(f"{cached_path.name} is not in package cache {cached_path.parent}. Downloading it to the cache.")
+        cached_path.parent.mkdir(parents=True, exist_ok=True)
+        # download under a temporary name so that an interrupted download is not taken as cached
+        tmp_path = cached_path.with_name(f"{cached_path.name}.tmp")
+        urllib.request.urlretrieve(url, tmp_path)
+        os.replace(tmp_path, cached_path)
+    try:
+        os.link(cached_path, download_path)
+    except OSError:
+        shutil.copyfile(cached_path, download_path)
@@ -2,29 +2,71 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 # --------------------------------------------------------------------------
+import json
 import logging
+import threading
 from abc import abstractmethod
 from inspect import isfunction, signature
-from typing import Any, Callable, Dict, Type, Union
+from typing import Any, Callable, Dict, Optional, Type, Union
 
 import numpy as np
-import torch
-import torchmetrics
 
 from olive.common.auto_config import AutoConfigClass, ConfigBase
 from olive.common.config_utils import ConfigParam
 
+try:
+    import torchmetrics
+except ImportError:
+    # the numpy implementations of the accuracy score and auc can be used without torch
+    torchmetrics = None
+
 logger = logging.getLogger(__name__)
 
 
+def to_numpy(data) -> np.ndarray:
+    """
+    Convert the outputs or labels of a batch to a numpy array.
+    """
+    if hasattr(data, "detach"):
+        # torch tensor
+        return data.detach().cpu().numpy()
+    return np.asarray(data)
+
+
 class AccuracyBase(AutoConfigClass):
+    """
+    Base class of the accuracy metrics.
+
+    A metric object is built once per metric name and config and reused by the evaluations, see get_accuracy_metric.
+    The outputs and labels of an evaluation are fed batch by batch with update and the metric is computed over all the
+    fed data with compute. reset clears the data for the next evaluation.
+
+    The outputs and labels are compared as integer labels. With micro average, the accuracy score, f1 score, precision
+    and recall are all the rate of matching elements, which is computed with numpy. The other configs are computed
+    with torchmetrics.
+    """
+
     registry: Dict[str, Type["AccuracyBase"]] = {}
-    metric_cls_map: Dict[str, Union[torchmetrics.Metric, Callable]] = {
-        "accuracy_score": torchmetrics.Accuracy,
-        "f1_score": torchmetrics.F1Score,
-        "precision": torchmetrics.Precision,
-        "recall": torchmetrics.Recall,
-        "auc": torchmetrics.functional.auc,
+    metric_cls_map: Dict[str, Union["torchmetrics.Metric", Callable]] = (
+        {
+            "accuracy_score": torchmetrics.Accuracy,
+            "f1_score": torchmetrics.F1Score,
+            "precision": torchmetrics.Precision,
+            "recall": torchmetrics.Recall,
+            "auc": torchmetrics.functional.auc,
+        }
+        if torchmetrics
+        else {}
+    )
+    # config of the metrics when torchmetrics is not installed, only the configs supported by numpy
+    fallback_config: Dict[str, ConfigParam] = {
+        "threshold": ConfigParam(type_=float, default_value=0.5),
+        "num_classes": ConfigParam(type_=Optional[int], default_value=None),
+        "average": ConfigParam(type_=Optional[str], default_value="micro"),
+        "mdmc_average": ConfigParam(type_=Optional[str], default_value=None),
+        "ignore_index": ConfigParam(type_=Optional[int], default_value=None),
+        "top_k": ConfigParam(type_=Optional[int], default_value=None),
+        "multiclass": ConfigParam(type_=Optional[bool], default_value=None),
     }
 
     @classmethod
@@ -35,6 +77,9 @@ class AccuracyBase(AutoConfigClass):
 
     def __init__(self, config: Union[ConfigBase, Dict[str, Any]] = None) -> None:
         super().__init__(config)
+        self._torch_metric = None
+        self._numpy_supported = self._is_numpy_supported()
+        self.reset()
 
     @classmethod
     def _metric_config_from_torch_metrics(cls):
@@ -59,64 +104,144 @@ class AccuracyBase(AutoConfigClass):
 
     @classmethod
     def _default_config(cls) -> Dict[str, ConfigParam]:
+        if torchmetrics is None:
+            return dict(cls.fallback_config)
         return cls._metric_config_from_torch_metrics()
 
-    @abstractmethod
+    def _get_torch_metric(self):
+        if torchmetrics is None:
+            raise ImportError(f"Please install torchmetrics to compute {self.name} with config {self.config}.")
+        if self._torch_metric is None:
+            self._torch_metric = self.metric_cls_map[self.name](**self.config.dict())
+        return self._torch_metric
+
     def measure(self, preds, target):
-        raise NotImplementedError()
+        """
+        Compute the metric on the given outputs and labels.
+        """
+        self.reset()
+        self.update(preds, target)
+        return self.compute()
+
+    def _is_numpy_supported(self) -> bool:
+        config = self.config.dict()
+        return (
+            config.get("average") == "micro"
+            and config.get("mdmc_average") in (None, "global")
+            and config.get("ignore_index") is None
+            and config.get("top_k") is None
+            and config.get("multiclass") is None
+            and not config.get("subset_accuracy")
+            and config.get("task") is None
+            and config.get("multidim_average", "global") == "global"
+        )
+
+    def reset(self):
+        self.num_correct = 0
+        self.num_total = 0
+        if self._torch_metric is not None:
+            self._torch_metric.reset()
+
+    def update(self, preds, target):
+        # the labels are compared as integers
+        preds = to_numpy(preds).astype(np.int32)
+        target = to_numpy(target).astype(np.int32)
+        if not self._numpy_supported:
+            torch_metric = self._get_torch_metric()
+            import torch
+
+            torch_metric.update(torch.from_numpy(preds), torch.from_numpy(target))
+            self.num_total += target.size
+            return
+
+        if preds.shape != target.shape:
+            raise ValueError(f"The shape of preds {preds.shape} and target {target.shape} must be the same.")
+        if preds.ndim > 1 and self.config.mdmc_average is None:
+            raise ValueError(
+                "When your inputs are multi-dimensional multi-class, you have to set the `mdmc_average` parameter."
+            )
+        num_classes = self.config.num_classes
+        if num_classes is not None and target.size and target.max() >= num_classes:
+            raise ValueError("The highest label in `target` should be smaller than `num_classes`.")
+        self.num_correct += int(np.count_nonzero(preds == target))
+        self.num_total += target.size
+
+    def compute(self):
+        if self.num_total == 0:
+            raise ValueError(f"Cannot compute {self.name} without any samples.")
+        if not self._numpy_supported:
+            return self._get_torch_metric().compute().item()
+        return self.num_correct / self.num_total
 
 
 class AccuracyScore(AccuracyBase):
     name: str = "accuracy_score"
 
-    def measure(self, preds, target):
-        preds_tensor = torch.tensor(preds, dtype=torch.int)
-        target_tensor = torch.tensor(target, dtype=torch.int)
-        accuracy = torchmetrics.Accuracy(**self.config.dict())
-        result = accuracy(preds_tensor, target_tensor)
-        return result.item()
-
 
 class F1Score(AccuracyBase):
     name: str = "f1_score"
 
-    def measure(self, preds, target):
-        preds_tensor = torch.tensor(preds, dtype=torch.int)
-        target_tensor = torch.tensor(target, dtype=torch.int)
-        f1 = torchmetrics.F1Score(**self.config.dict())
-        result = f1(preds_tensor, target_tensor)
-        return result.item()
-
 
 class Precision(AccuracyBase):
     name: str = "precision"
 
-    def measure(self, preds, target):
-        preds_tensor = torch.tensor(preds, dtype=torch.int)
-        target_tensor = torch.tensor(target, dtype=torch.int)
-        precision = torchmetrics.Precision(**self.config.dict())
-        result = precision(preds_tensor, target_tensor)
-        return result.item()
-
 
 class Recall(AccuracyBase):
     name: str = "recall"
 
-    def measure(self, preds, target):
-        preds_tensor = torch.tensor(preds, dtype=torch.int)
-        target_tensor = torch.tensor(target, dtype=torch.int)
-        recall = torchmetrics.Recall(**self.config.dict())
-        result = recall(preds_tensor, target_tensor)
-        return result.item()
-
 
 class AUC(AccuracyBase):
     name: str = "auc"
-
-    def measure(self, preds, target):
-        preds = np.array(preds).flatten()
-        target = np.array(target).flatten()
-        preds_tensor = torch.tensor(preds, dtype=torch.int)
-        target_tensor = torch.tensor(target, dtype=torch.int)
-        result = torchmetrics.functional.auc(preds_tensor, target_tensor, self.config.reorder)
-        return result.item()
+    fallback_config: Dict[str, ConfigParam] = {"reorder": ConfigParam(type_=bool, default_value=False)}
+
+    def reset(self):
+        self.preds = []
+        self.target = []
+
+    def update(self, preds, target):
+        self.preds.append(to_numpy(preds).astype(np.int32).flatten())
+        self.target.append(to_numpy(target).astype(np.int32).flatten())
+
+    def compute(self):
+        if not self.preds:
+            raise ValueError(f"Cannot compute {self.name} without any samples.")
+        # area under the curve of y=target over x=preds, same as torchmetrics.functional.auc
+        x = np.concatenate(self.preds)
+        y = np.concatenate(self.target)
+        if self.config.reorder:
+            x_idx = np.argsort(x, kind="stable")
+            x, y = x[x_idx], y[x_idx]
+
+        direction = 1.0
+        dx = np.diff(x)
+        if np.any(dx < 0):
+            if np.all(dx <= 0):
+                direction = -1.0
+            else:
+                raise ValueError(
+                    "The `x` tensor is neither increasing or decreasing. Try setting the reorder argument to `True`."
+                )
+        trapezoid = getattr(np, "trapezoid", None) or np.trapz
+        return float(direction * trapezoid(y, x))
+
+
+# metric objects built once per metric name and config
+_accuracy_metrics: Dict[str, AccuracyBase] = {}
+_accuracy_metrics_lock = threading.Lock()
+
+
+def get_accuracy_metric(name: str, config: Union[ConfigBase, Dict[str, Any]] = None) -> AccuracyBase:
+    """
+    Get the metric object of the metric name and config, reset for a new evaluation.
+
+    The metric object is built once and reused by later evaluations in the process, so two evaluations of the same
+    metric must not be fed at the same time.
+    """
+    config_dict = config.dict() if isinstance(config, ConfigBase) else config
+    key = json.dumps([name, config_dict or {}], sort_keys=True, default=str)
+    with _accuracy_metrics_lock:
+        if key not in _accuracy_metrics:
+            _accuracy_metrics[key] = AccuracyBase.registry[name](config)
+        metric_obj = _accuracy_metrics[key]
+    metric_obj.reset()
+    return metric_obj
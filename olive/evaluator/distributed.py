@@ -0,0 +1,277 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------
+import atexit
+import json
+import logging
+import multiprocessing
+import os
+import threading
+import time
+import traceback
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from olive.hardware import Device
+
+logger = logging.getLogger(__name__)
+
+# descriptor of an array in shared memory: (shared memory name, shape, dtype)
+SharedArrayDescriptor = Tuple[str, Tuple[int, ...], str]
+
+
+class SharedTensorBuffer:
+    """
+    Shared memory block owned by one process, reused for the arrays written to it.
+
+    The block is recreated with a larger size when an array does not fit. Other processes read the arrays with
+    SharedTensorReader using the descriptor returned by write.
+    """
+
+    def __init__(self):
+        self.shm = None
+
+    def write(self, array: np.ndarray) -> SharedArrayDescriptor:
+        array = np.ascontiguousarray(array)
+        if self.shm is None or self.shm.size < array.nbytes:
+            self.close()
+            # shared memory blocks cannot be empty
+            self.shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=self.shm.buf)[...] = array
+        return self.shm.name, array.shape, array.dtype.str
+
+    def close(self):
+        if self.shm is not None:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+
+
+class SharedTensorReader:
+    """
+    Read arrays from the shared memory blocks of another process. The blocks stay attached until they are replaced.
+    """
+
+    def __init__(self):
+        self.attached: Dict[int, shared_memory.SharedMemory] = {}
+
+    def read(self, key: int, descriptor: SharedArrayDescriptor) -> np.ndarray:
+        """
+        Get a view of the array. The view is only valid until the owner writes to the block again.
+        """
+        name, shape, dtype = descriptor
+        shm = self.attached.get(key)
+        if shm is None or shm.name != name:
+            if shm is not None:
+                shm.close()
+            shm = self.attached[key] = shared_memory.SharedMemory(name=name)
+        return np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+    def close(self):
+        for shm in self.attached.values():
+            shm.close()
+        self.attached = {}
+
+
+def _rank_worker(rank: int, world_size: int, conn, barrier):
+    """
+    Loop of a rank worker process. Commands are received from the pool through the connection.
+    """
+    os.environ["OMPI_COMM_WORLD_RANK"] = str(rank)
+    os.environ["OMPI_COMM_WORLD_SIZE"] = str(world_size)
+
+    from olive.evaluator.olive_evaluator import OnnxEvaluator
+    from olive.model import ONNXModel
+
+    session, session_key = None, None
+    input_reader = SharedTensorReader()
+    output_buffers: List[SharedTensorBuffer] = []
+    while True:
+        command, args = conn.recv()
+        if command == "close":
+            break
+        try:
+            if command == "load":
+                key = json.dumps(args, sort_keys=True, default=str)
+                if key != session_key:
+                    # only the session of the latest model is kept
+                    session, session_key = None, None
+                    inference_settings = args["inference_settings"] or {}
+                    if args["device"] == Device.GPU:
+                        # TODO: EPs should be selected based on accelerator_spec param passed down from the engine
+                        inference_settings["execution_provider"] = ["CUDAExecutionProvider", "CPUExecutionProvider"]
+                        inference_settings["provider_options"] = [{"device_id": str(rank)}, {}]
+                    model = ONNXModel(args["model_paths"][rank], inference_settings=inference_settings)
+                    session = model.prepare_session(
+                        inference_settings=inference_settings, device=args["device"], rank=rank
+                    )
+                    session_key = key
+                conn.send(("ok", None))
+            elif command == "run":
+                input_dict = {name: input_reader.read(i, d) for i, (name, d) in enumerate(args["inputs"].items())}
+                ort_inputs = OnnxEvaluator.prepare_ort_inputs(session, input_dict, args["device"])
+                latencies = []
+                for i in range(args["warmup_num"] + args["repeat_test_num"]):
+                    barrier.wait()  # synchronize the ranks before starting each run
+                    start_time = time.perf_counter()
+                    outputs = OnnxEvaluator.run_ort_inputs(session, ort_inputs)
+                    if i >= args["warmup_num"]:
+                        latencies.append(time.perf_counter() - start_time)
+                    time.sleep(args["sleep_num"])
+
+                output_descriptors = None
+                # only the outputs of rank 0 are returned, the other ranks only report their latencies
+                if args["return_outputs"] and rank == 0:
+                    outputs = OnnxEvaluator.ort_outputs_to_numpy(outputs)
+                    output_buffers.extend(SharedTensorBuffer() for _ in range(len(outputs) - len(output_buffers)))
+                    output_descriptors = [buffer.write(output) for buffer, output in zip(output_buffers, outputs)]
+                conn.send(("ok", (latencies, output_descriptors)))
+        except Exception:
+            # release the other ranks waiting at the barrier
+            barrier.abort()
+            conn.send(("error", traceback.format_exc()))
+
+    input_reader.close()
+    for buffer in output_buffers:
+        buffer.close()
+
+
+class SharedMemoryRankPool:
+    """
+    Pool of persistent rank worker processes to evaluate the ranks of a DistributedOnnxModel on a single machine.
+
+    Every rank runs in its own process with an inference session for its model. The inputs are written once to shared
+    memory and read by all ranks, and the outputs of rank 0 are returned through shared memory, so the tensors are not
+    pickled. The worker processes are kept alive across metrics and models, use SharedMemoryRankPool.get to get the pool
+    of a world size. No MPI installation is needed.
+    """
+
+    _pools: Dict[int, "SharedMemoryRankPool"] = {}
+    _pools_lock = threading.Lock()
+
+    def __init__(self, world_size: int):
+        self.world_size = world_size
+        mp_context = multiprocessing.get_context("spawn")
+        self.barrier = mp_context.Barrier(world_size)
+        self.conns = []
+        self.processes = []
+        for rank in range(world_size):
+            parent_conn, child_conn = mp_context.Pipe()
+            process = mp_context.Process(
+                target=_rank_worker, args=(rank, world_size, child_conn, self.barrier), daemon=True
+            )
+            process.start()
+            self.conns.append(parent_conn)
+            self.processes.append(process)
+        self.input_buffers: Dict[str, SharedTensorBuffer] = {}
+        self.output_reader = SharedTensorReader()
+        self.device = Device.CPU
+
+    @classmethod
+    def get(cls, world_size: int) -> "SharedMemoryRankPool":
+        """
+        Get the pool of the world size. The pool is created on first use and closed at exit.
+        """
+        with cls._pools_lock:
+            pool = cls._pools.get(world_size)
+            if pool is None or not pool.is_alive():
+                if pool is not None:
+                    pool.close()
+                pool = cls._pools[world_size] = cls(world_size)
+            return pool
+
+    @classmethod
+    def close_all(cls):
+        with cls._pools_lock:
+            for pool in cls._pools.values():
+                pool.close()
+            cls._pools = {}
+
+    def is_alive(self) -> bool:
+        return all(process.is_alive() for process in self.processes)
+
+    def _call(self, command: str, args: Dict[str, Any]) -> List[Any]:
+        for conn in self.conns:
+            conn.send((command, args))
+        results = [conn.recv() for conn in self.conns]
+        errors = [result for status, result in results if status == "error"]
+        if errors:
+            # the barrier is broken if a rank failed
+            self.barrier.reset()
+            raise RuntimeError(f"Distributed evaluation failed on {len(errors)} rank(s):\n{errors[0]}")
+        return [result for _, result in results]
+
+    def load(
+        self,
+        model_paths: List[str],
+        inference_settings: Optional[Dict[str, Any]] = None,
+        device: Device = Device.CPU,
+    ):
+        """
+        Create the inference session of every rank. The sessions are reused if the model and settings are unchanged.
+        """
+        if len(model_paths) != self.world_size:
+            raise ValueError(f"Expected {self.world_size} model paths, got {len(model_paths)}")
+        self.device = device
+        self._call(
+            "load",
+            {"model_paths": [str(p) for p in model_paths], "inference_settings": inference_settings, "device": device},
+        )
+
+    def run(
+        self,
+        input_dict: Dict[str, np.ndarray],
+        warmup_num: int = 0,
+        repeat_test_num: int = 1,
+        sleep_num: Union[int, float] = 0,
+        return_outputs: bool = False,
+    ) -> Tuple[List[List[float]], Optional[List[np.ndarray]]]:
+        """
+        Run the input on all ranks warmup_num + repeat_test_num times, synchronizing the ranks before every run.
+
+        Returns the latencies of every rank, and the outputs of rank 0 if return_outputs is True.
+        """
+        inputs = {}
+        for name, value in input_dict.items():
+            if name not in self.input_buffers:
+                self.input_buffers[name] = SharedTensorBuffer()
+            inputs[name] = self.input_buffers[name].write(value)
+        results = self._call(
+            "run",
+            {
+                "inputs": inputs,
+                "device": self.device,
+                "warmup_num": warmup_num,
+                "repeat_test_num": repeat_test_num,
+                "sleep_num": sleep_num,
+                "return_outputs": return_outputs,
+            },
+        )
+        latencies = [latencies for latencies, _ in results]
+        outputs = None
+        if return_outputs:
+            # copy the outputs since the buffers are reused by the next run
+            outputs = [self.output_reader.read(i, d).copy() for i, d in enumerate(results[0][1])]
+        return latencies, outputs
+
+    def close(self):
+        for conn, process in zip(self.conns, self.processes):
+            try:
+                if process.is_alive():
+                    conn.send(("close", None))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self.processes:
+            process.join(timeout=10)
+            if process.is_alive():
+                process.terminate()
+        self.output_reader.close()
+        for buffer in self.input_buffers.values():
+            buffer.close()
+        self.input_buffers = {}
+
+
+atexit.register(SharedMemoryRankPool.close_all)
@@ -0,0 +1,117 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------
+import logging
+import math
+from statistics import NormalDist
+from typing import Optional
+
+import numpy as np
+
+from olive.evaluator.accuracy import to_numpy
+from olive.evaluator.metric import AccuracySubType, Metric, MetricResult
+
+logger = logging.getLogger(__name__)
+
+
+def get_accuracy_goal_threshold(metric: Metric) -> Optional[float]:
+    """
+    Get the threshold goal of the accuracy score of the metric. Returns None if there is none.
+
+    Relative goals are resolved into thresholds by the engine before the candidates are evaluated.
+    """
+    if metric.backend != "torch_metrics":
+        return None
+    for sub_type in metric.sub_types:
+        if (
+            sub_type.name == AccuracySubType.ACCURACY_SCORE
+            and sub_type.higher_is_better
+            and sub_type.goal is not None
+            and sub_type.goal.type == "threshold"
+        ):
+            return sub_type.goal.value
+    return None
+
+
+def accuracy_upper_bound(num_correct: int, num_samples: int, confidence: float) -> float:
+    """
+    Get the upper bound of the Wilson score interval of the accuracy at the one-sided confidence level.
+    """
+    z = NormalDist().inv_cdf(confidence)
+    p = num_correct / num_samples
+    denominator = 1 + z**2 / num_samples
+    center = p + z**2 / (2 * num_samples)
+    margin = z * math.sqrt(p * (1 - p) / num_samples + z**2 / (4 * num_samples**2))
+    return min(1.0, (center + margin) / denominator)
+
+
+class AccuracyEarlyStopper:
+    """
+    Decide whether the accuracy evaluation can stop early because the accuracy score goal cannot be met.
+
+    The outputs and labels are fed batch by batch. After every chunk of samples, the upper confidence bound of the
+    accuracy on the whole dataset is compared with the goal threshold. Only enabled if the metric has early_stop in
+    its user config and a threshold goal for the accuracy score.
+    """
+
+    def __init__(self, metric: Metric, dataloader=None):
+        self.config = getattr(metric.user_config, "early_stop", None)
+        self.threshold = get_accuracy_goal_threshold(metric) if self.config else None
+        self.enabled = self.threshold is not None
+        # number of samples in the dataset if known
+        try:
+            self.num_total_samples = len(dataloader.dataset)
+        except (AttributeError, TypeError):
+            self.num_total_samples = None
+
+        self.num_samples = 0
+        self.num_samples_at_last_check = 0
+        # accuracy is counted over the elements of the outputs and labels, same as the micro accuracy score
+        self.num_correct_elements = 0
+        self.num_elements = 0
+
+    def update(self, outputs, labels) -> bool:
+        """
+        Update with the outputs and labels of a batch. Returns True if the evaluation should stop.
+        """
+        if not self.enabled:
+            return False
+
+        # compared as integer labels, same as the accuracy score
+        outputs = to_numpy(outputs).astype(np.int32)
+        labels = to_numpy(labels).astype(np.int32)
+        if outputs.shape != labels.shape:
+            logger.debug(
+                f"Outputs of shape {outputs.shape} cannot be compared to labels of shape {labels.shape}. Disabling"
+                " accuracy early stopping."
+            )
+            self.enabled = False
+            return False
+
+        self.num_samples += len(labels)
+        self.num_correct_elements += int(np.sum(outputs == labels))
+        self.num_elements += labels.size
+        if self.num_samples - self.num_samples_at_last_check < self.config.chunk_size:
+            return False
+        self.num_samples_at_last_check = self.num_samples
+
+        upper_bound = accuracy_upper_bound(self.num_correct_elements, self.num_elements, self.config.confidence)
+        if self.num_total_samples:
+            # the accuracy of the evaluated samples is known, only the rest is estimated
+            evaluated = min(1.0, self.num_samples / self.num_total_samples)
+            upper_bound = evaluated * self.num_correct_elements / self.num_elements + (1 - evaluated) * upper_bound
+        if upper_bound >= self.threshold:
+            return False
+
+        logger.info(
+            f"Stopping accuracy evaluation after {self.num_samples} samples. The upper bound {upper_bound:.5f} of the"
+            f" accuracy score is below the goal {self.threshold}."
+        )
+        return True
+
+    @staticmethod
+    def mark_early_stopped(metric_result: MetricResult) -> MetricResult:
+        for sub_metric_result in metric_result.__root__.values():
+            sub_metric_result.is_early_stopped = True
+        return metric_result
@@ -11,7 +11,13 @@ from pydantic import validator
 from olive.common.config_utils import ConfigBase, ConfigDictBase, validate_config
 from olive.data.config import DataConfig
 from olive.evaluator.accuracy import AccuracyBase
-from olive.evaluator.metric_config import LatencyMetricConfig, MetricGoal, get_user_config_class
+from olive.evaluator.metric_config import (
+    LatencyMetricConfig,
+    MemoryMetricConfig,
+    MetricGoal,
+    ThroughputMetricConfig,
+    get_user_config_class,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +25,8 @@ logger = logging.getLogger(__name__)
 class MetricType(str, Enum):
     ACCURACY = "accuracy"
     LATENCY = "latency"
+    THROUGHPUT = "throughput"
+    MEMORY = "memory"
     CUSTOM = "custom"
 
 
@@ -42,6 +50,30 @@ class LatencySubType(str, Enum):
     P999 = "p999"
 
 
+class ThroughputSubType(str, Enum):
+    # requests per second served by the session
+    REQUESTS_PER_SEC = "requests_per_sec"
+    # latency of the requests under load, in milliseconds
+    AVG_LATENCY = "avg_latency"
+    MAX_LATENCY = "max_latency"
+    P50_LATENCY = "p50_latency"
+    P90_LATENCY = "p90_latency"
+    P95_LATENCY = "p95_latency"
+    P99_LATENCY = "p99_latency"
+
+
+class MemorySubType(str, Enum):
+    # memory attributable to the model in megabytes, measured in a separate process
+    # peak rss while loading the model and creating the inference session
+    SESSION_PEAK_RSS = "session_peak_rss"
+    # peak rss while running inference
+    INFERENCE_PEAK_RSS = "inference_peak_rss"
+    # rss after running inference
+    STEADY_STATE_RSS = "steady_state_rss"
+    # size of the model files
+    MODEL_SIZE = "model_size"
+
+
 class SubMetric(ConfigBase):
     name: Union[AccuracySubType, LatencyMetricConfig, str]
     metric_config: ConfigBase = None
@@ -112,7 +144,12 @@ class Metric(ConfigBase):
                 raise ValueError(f"higher_is_better must be specified for ranked custom metric: {v['name']}")
             return v
         # name
-        sub_type_enum = AccuracySubType if values["type"] == MetricType.ACCURACY else LatencySubType
+        sub_type_enum = {
+            MetricType.ACCURACY: AccuracySubType,
+            MetricType.LATENCY: LatencySubType,
+            MetricType.THROUGHPUT: ThroughputSubType,
+            MetricType.MEMORY: MemorySubType,
+        }[values["type"]]
         try:
             # backend joint checking
             if values["backend"] == "huggingface_metrics":
@@ -140,6 +177,12 @@ class Metric(ConfigBase):
         elif sub_type_enum is LatencySubType:
             v["higher_is_better"] = v.get("higher_is_better", False)
             metric_config_cls = LatencyMetricConfig
+        elif sub_type_enum is ThroughputSubType:
+            v["higher_is_better"] = v.get("higher_is_better", v["name"] == ThroughputSubType.REQUESTS_PER_SEC)
+            metric_config_cls = ThroughputMetricConfig
+        elif sub_type_enum is MemorySubType:
+            v["higher_is_better"] = v.get("higher_is_better", False)
+            metric_config_cls = MemoryMetricConfig
         v["metric_config"] = validate_config(v.get("metric_config", {}), ConfigBase, metric_config_cls)
 
         return v
@@ -149,14 +192,46 @@ class Metric(ConfigBase):
         if "type" not in values:
             raise ValueError("Invalid type")
 
+        early_stop = v.get("early_stop") if isinstance(v, dict) else getattr(v, "early_stop", None)
         user_config_class = get_user_config_class(values["type"])
-        return validate_config(v, ConfigBase, user_config_class)
+        v = validate_config(v, ConfigBase, user_config_class)
+
+        if early_stop:
+            # the evaluators can only stop early against the goal of the micro accuracy score, the rate of matching
+            # elements, since the bound of the score does not hold for the other sub types and averages
+            sub_types = [sub_type for sub_type in values.get("sub_types") or [] if sub_type.goal is not None]
+            if (
+                values.get("backend") != "torch_metrics"
+                or not sub_types
+                or any(
+                    sub_type.name != AccuracySubType.ACCURACY_SCORE or not _is_micro_average(sub_type.metric_config)
+                    for sub_type in sub_types
+                )
+            ):
+                raise ValueError(
+                    "early_stop is only supported for accuracy metrics with the torch_metrics backend where the only"
+                    f" sub type with a goal is {AccuracySubType.ACCURACY_SCORE.value} with micro average"
+                )
+        return v
+
+
+def _is_micro_average(metric_config) -> bool:
+    config = metric_config.dict() if isinstance(metric_config, ConfigBase) else dict(metric_config or {})
+    return (
+        config.get("average", "micro") == "micro"
+        and config.get("mdmc_average") in (None, "global")
+        and config.get("multidim_average", "global") == "global"
+        and config.get("top_k") is None
+        and config.get("ignore_index") is None
+    )
 
 
 class SubMetricResult(ConfigBase):
     value: Union[float, int]
     priority: int
     higher_is_better: bool
+    # the evaluation was stopped early since the goal could not be met, value is computed on part of the data
+    is_early_stopped: bool = False
 
 
 class MetricResult(ConfigDictBase):
@@ -168,6 +243,10 @@ class MetricResult(ConfigDictBase):
             return None
         return self.__root__[joint_metric_key(metric_name, sub_type_name)].value
 
+    def get_early_stopped_metrics(self) -> List[str]:
+        """Get the keys of the sub metric results computed on part of the data since the evaluation stopped early."""
+        return [k for k, v in self.__root__.items() if v.is_early_stopped]
+
     def get_all_sub_type_metric_value(self, metric_name):
         return {k.split(self.delimiter)[-1]: v.value for k, v in self.__root__.items() if k.startswith(metric_name)}
 
@@ -202,3 +281,33 @@ def get_latency_config_from_metric(metric: Metric):
             sleep_num = sub_type.metric_config.sleep_num
             break
     return warmup_num, repeat_test_num, sleep_num
+
+
+def get_latency_dataset_config_from_metric(metric: Metric):
+    full_dataset, max_batches = False, None
+    for sub_type in metric.sub_types:
+        if sub_type.metric_config:
+            full_dataset = sub_type.metric_config.full_dataset
+            max_batches = sub_type.metric_config.max_batches
+            break
+    return full_dataset, max_batches
+
+
+def get_throughput_config_from_metric(metric: Metric):
+    warmup_num, concurrency, duration = None, None, None
+    for sub_type in metric.sub_types:
+        if sub_type.metric_config:
+            warmup_num = sub_type.metric_config.warmup_num
+            concurrency = sub_type.metric_config.concurrency
+            duration = sub_type.metric_config.duration
+            break
+    return warmup_num, concurrency, duration
+
+
+def get_memory_config_from_metric(metric: Metric):
+    repeat_test_num = None
+    for sub_type in metric.sub_types:
+        if sub_type.metric_config:
+            repeat_test_num = sub_type.metric_config.repeat_test_num
+            break
+    return repeat_test_num
@@ -2,20 +2,30 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 # --------------------------------------------------------------------------
+import json
 from abc import abstractmethod
 from typing import Any, Dict, Type, Union
 
 from olive.common.auto_config import AutoConfigClass, ConfigBase
 from olive.common.config_utils import ConfigParam
-from olive.evaluator.accuracy import AccuracyBase
+from olive.evaluator.accuracy import AccuracyBase, get_accuracy_metric
 from olive.evaluator.metric import Metric, MetricResult, SubMetric, SubMetricResult
 
 
 class MetricBackend(AutoConfigClass):
+    """
+    Backend to compute the sub metrics of accuracy metrics.
+
+    The outputs and labels can be fed batch by batch with update and the sub metrics computed with compute, or all at
+    once with measure. A backend instance accumulates the data of one evaluation.
+    """
+
     registry: Dict[str, Type["MetricBackend"]] = {}
 
     def __init__(self, config: Union[ConfigBase, Dict[str, Any]] = None) -> None:
         super().__init__(config)
+        self._preds = []
+        self._targets = []
 
     @staticmethod
     def _default_config() -> Dict[str, ConfigParam]:
@@ -31,14 +41,55 @@ class MetricBackend(AutoConfigClass):
             metric_results_dict[sub_metric.name] = self.measure_sub_metric(preds, targets, sub_metric)
         return MetricResult.parse_obj(metric_results_dict)
 
+    def update(self, preds, targets, metrics: Metric):
+        """
+        Accumulate the outputs and labels of a batch.
+
+        By default, the outputs and labels are kept and measured in compute.
+        """
+        self._preds.extend(preds.tolist() if hasattr(preds, "tolist") else preds)
+        self._targets.extend(targets.tolist() if hasattr(targets, "tolist") else targets)
+
+    def compute(self, metrics: Metric) -> MetricResult:
+        """
+        Compute the sub metrics on the accumulated outputs and labels.
+        """
+        if not self._targets:
+            raise ValueError(f"Cannot compute {metrics.name} without any data. Please check the dataloader.")
+        return self.measure(self._preds, self._targets, metrics)
+
 
 class TorchMetrics(MetricBackend):
     name: str = "torch_metrics"
 
+    def __init__(self, config: Union[ConfigBase, Dict[str, Any]] = None) -> None:
+        super().__init__(config)
+        # metric objects used by this backend instance, the data of the evaluation is accumulated in them
+        self._metric_objs: Dict[str, AccuracyBase] = {}
+
     def measure_sub_metric(self, preds, targets, sub_metric: SubMetric) -> SubMetricResult:
-        metric_cls = AccuracyBase.registry[sub_metric.name.value]
-        metric_obj = metric_cls(sub_metric.metric_config)
-        result = metric_obj.measure(preds, targets)
+        result = get_accuracy_metric(sub_metric.name.value, sub_metric.metric_config).measure(preds, targets)
+        return self._get_sub_metric_result(result, sub_metric)
+
+    def update(self, preds, targets, metrics: Metric):
+        for sub_metric in metrics.sub_types:
+            if sub_metric.name not in self._metric_objs:
+                self._metric_objs[sub_metric.name] = get_accuracy_metric(
+                    sub_metric.name.value, sub_metric.metric_config
+                )
+            self._metric_objs[sub_metric.name].update(preds, targets)
+
+    def compute(self, metrics: Metric) -> MetricResult:
+        if not self._metric_objs:
+            raise ValueError(f"Cannot compute {metrics.name} without any data. Please check the dataloader.")
+        metric_results_dict = {}
+        for sub_metric in metrics.sub_types:
+            result = self._metric_objs[sub_metric.name].compute()
+            metric_results_dict[sub_metric.name] = self._get_sub_metric_result(result, sub_metric)
+        return MetricResult.parse_obj(metric_results_dict)
+
+    @staticmethod
+    def _get_sub_metric_result(result, sub_metric: SubMetric) -> SubMetricResult:
         return SubMetricResult(
             value=result,
             priority=sub_metric.priority,
@@ -46,6 +97,10 @@ class TorchMetrics(MetricBackend):
         )
 
 
+# evaluate modules loaded once per sub metric name and load params
+_evaluate_modules: Dict[str, Any] = {}
+
+
 class HuggingfaceMetrics(MetricBackend):
     name: str = "huggingface_metrics"
 
@@ -77,12 +132,22 @@ class HuggingfaceMetrics(MetricBackend):
             ),
         }
 
-    def measure_sub_metric(self, preds, target, sub_metric: SubMetric) -> SubMetricResult:
+    def _get_evaluate_module(self, sub_metric: SubMetric):
         load_params = sub_metric.metric_config.load_params or {}
-        evaluator = self.evaluate_module.load(sub_metric.name, **load_params)
+        key = json.dumps([sub_metric.name, load_params], sort_keys=True, default=str)
+        if key not in _evaluate_modules:
+            _evaluate_modules[key] = self.evaluate_module.load(sub_metric.name, **load_params)
+        return _evaluate_modules[key]
+
+    def measure_sub_metric(self, preds, target, sub_metric: SubMetric) -> SubMetricResult:
+        evaluator = self._get_evaluate_module(sub_metric)
 
         compute_params = sub_metric.metric_config.compute_params or {}
         result = evaluator.compute(predictions=preds, references=target, **compute_params)
+        return self._get_sub_metric_result(result, sub_metric)
+
+    @staticmethod
+    def _get_sub_metric_result(result, sub_metric: SubMetric) -> SubMetricResult:
         if not result:
             raise ValueError(
                 f"Cannot find the result for {sub_metric.name} in the metric result. Please check your parameters."
@@ -2,17 +2,48 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 # --------------------------------------------------------------------------
+from enum import Enum
 from pathlib import Path
 from typing import Callable, List, Union
 
 from pydantic import validator
 
 from olive.common.config_utils import ConfigBase, ConfigParam, create_config_class
+from olive.data.subset import DataSubsetConfig
 from olive.resource_path import OLIVE_RESOURCE_ANNOTATIONS
 
 WARMUP_NUM = 10
 REPEAT_TEST_NUM = 20
 SLEEP_NUM = 0
+CONCURRENCY = 1
+DURATION = 10
+
+
+class DistributedBackend(str, Enum):
+    # mpi4py's MPIPoolExecutor
+    MPI = "mpi"
+    # persistent local worker processes exchanging tensors through shared memory
+    SHARED_MEMORY = "shared_memory"
+
+
+class AccuracyEarlyStopConfig(ConfigBase):
+    # number of samples to evaluate between two checks of the accuracy goal
+    chunk_size: int = 1000
+    # confidence level of the upper bound of the accuracy score
+    confidence: float = 0.99
+
+    @validator("chunk_size")
+    def check_chunk_size(cls, v):
+        if v < 1:
+            raise ValueError("chunk_size must be at least 1")
+        return v
+
+    @validator("confidence")
+    def check_confidence(cls, v):
+        if not 0 < v < 1:
+            raise ValueError("confidence must be in (0, 1)")
+        return v
+
 
 user_path_config = ["data_dir"]
 _common_user_config = {
@@ -23,6 +54,8 @@ _common_user_config = {
     "input_names": ConfigParam(type_=List),
     "input_shapes": ConfigParam(type_=List),
     "input_types": ConfigParam(type_=List),
+    # only evaluate on a subset of the data
+    "subset": ConfigParam(type_=DataSubsetConfig),
 }
 
 _common_user_config_validators = {}
@@ -32,11 +65,26 @@ _type_to_user_config = {
         "dataloader_func": ConfigParam(type_=Union[Callable, str], is_object=True),
         "inference_settings": ConfigParam(type_=dict),
         "io_bind": ConfigParam(type_=bool, default_value=False),
+        # backend used to run the ranks of a DistributedOnnxModel
+        "distributed_backend": ConfigParam(type_=DistributedBackend, default_value=DistributedBackend.MPI),
+        # bind preallocated output buffers reused by every run, only used with io_bind
+        "preallocate_outputs": ConfigParam(type_=bool, default_value=False),
+    },
+    "throughput": {
+        "dataloader_func": ConfigParam(type_=Union[Callable, str], is_object=True),
+        "inference_settings": ConfigParam(type_=dict),
+    },
+    "memory": {
+        "dataloader_func": ConfigParam(type_=Union[Callable, str], is_object=True),
+        "inference_settings": ConfigParam(type_=dict),
     },
     "accuracy": {
         "dataloader_func": ConfigParam(type_=Union[Callable, str], is_object=True),
         "post_processing_func": ConfigParam(type_=Union[Callable, str], is_object=True),
         "inference_settings": ConfigParam(type_=dict),
+        "early_stop": ConfigParam(type_=AccuracyEarlyStopConfig),
+        # backend used to run the ranks of a DistributedOnnxModel
+        "distributed_backend": ConfigParam(type_=DistributedBackend, default_value=DistributedBackend.MPI),
     },
     "custom": {
         "evaluate_func": ConfigParam(type_=Union[Callable, str], required=True, is_object=True),
@@ -65,6 +113,36 @@ class LatencyMetricConfig(ConfigBase):
     warmup_num: int = WARMUP_NUM
     repeat_test_num: int = REPEAT_TEST_NUM
     sleep_num: int = SLEEP_NUM
+    # measure every batch of the dataloader once instead of repeating the first batch repeat_test_num times
+    full_dataset: bool = False
+    # only measure the first max_batches batches when full_dataset is True
+    max_batches: int = None
+
+
+class ThroughputMetricConfig(ConfigBase):
+    warmup_num: int = WARMUP_NUM
+    # number of threads sending requests to the shared inference session at the same time
+    # for OpenVINO models, the number of infer requests run asynchronously
+    concurrency: int = CONCURRENCY
+    # duration of the measurement in seconds
+    duration: float = DURATION
+
+    @validator("concurrency")
+    def check_concurrency(cls, v):
+        if v < 1:
+            raise ValueError("concurrency must be at least 1")
+        return v
+
+    @validator("duration")
+    def check_duration(cls, v):
+        if v <= 0:
+            raise ValueError("duration must be greater than 0")
+        return v
+
+
+class MemoryMetricConfig(ConfigBase):
+    # number of inference runs after the session is created
+    repeat_test_num: int = REPEAT_TEST_NUM
 
 
 class MetricGoal(ConfigBase):
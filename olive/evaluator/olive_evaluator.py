@@ -3,11 +3,13 @@
 # Licensed under the MIT License.
 # --------------------------------------------------------------------------
 import logging
+import multiprocessing
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from copy import deepcopy
 from numbers import Number
-from typing import Any, Dict, List, Tuple, Type, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 import numpy as np
 import torch
@@ -18,24 +20,40 @@ import olive.data.template as data_config_template
 from olive.cache import get_local_path
 from olive.common.config_utils import ConfigBase
 from olive.common.user_module_loader import UserModuleLoader
-from olive.common.utils import tensor_data_to_device
+from olive.common.utils import (
+    PeakRSSMonitor,
+    get_current_rss,
+    get_path_size,
+    tensor_data_to_device,
+)
 from olive.constants import Framework
+from olive.data.subset import get_subset_dataloader
+from olive.evaluator.early_stop import AccuracyEarlyStopper
 from olive.evaluator.metric import (
     LatencySubType,
+    MemorySubType,
     Metric,
     MetricResult,
     MetricType,
     SubMetricResult,
+    ThroughputSubType,
     flatten_metric_result,
     get_latency_config_from_metric,
+    get_latency_dataset_config_from_metric,
+    get_memory_config_from_metric,
+    get_throughput_config_from_metric,
     joint_metric_key,
 )
 from olive.evaluator.metric_backend import MetricBackend
+from olive.evaluator.metric_config import DistributedBackend
 from olive.hardware import Device
 from olive.model import DistributedOnnxModel, OliveModel, ONNXModel, OpenVINOModel, PyTorchModel, SNPEModel
 from olive.model.model_config import is_io_config_static
 from olive.snpe.data_loader import SNPECommonDataLoader, SNPEDataLoader
 
+if TYPE_CHECKING:
+    from olive.evaluator.distributed import SharedMemoryRankPool
+
 logger = logging.getLogger(__name__)
 
 
@@ -85,6 +103,94 @@ class OliveEvaluator(ABC):
     ) -> MetricResult:
         raise NotImplementedError()
 
+    def _evaluate_throughput(
+        self,
+        model: OliveModel,
+        metric: Metric,
+        dataloader: Dataset,
+        post_func=None,
+        device: Device = Device.CPU,
+        execution_providers: Union[str, List[str]] = None,
+    ) -> MetricResult:
+        raise NotImplementedError(f"Throughput metric is not supported for {self.framework} models")
+
+    def _evaluate_memory(
+        self,
+        model: OliveModel,
+        metric: Metric,
+        dataloader: Dataset,
+        post_func=None,
+        device: Device = Device.CPU,
+        execution_providers: Union[str, List[str]] = None,
+    ) -> MetricResult:
+        input_data, _ = next(iter(dataloader))
+        config = {
+            # the model is loaded again in the child process so it must be serializable
+            "model": model.to_json(check_object=True),
+            "inference_settings": self.get_inference_settings(metric),
+            "repeat_test_num": get_memory_config_from_metric(metric),
+            "model_size": any(sub_type.name == MemorySubType.MODEL_SIZE for sub_type in metric.sub_types),
+            "device": device,
+            "execution_providers": execution_providers,
+        }
+        # measure in a fresh process so that the memory already used by this process is not counted
+        mp_context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=1, mp_context=mp_context) as executor:
+            memory = executor.submit(OliveEvaluator._evaluate_memory_worker, config, input_data).result()
+        return OliveEvaluator.compute_memory(metric, memory)
+
+    @staticmethod
+    def _evaluate_memory_worker(config: Dict[str, Any], input_data: Any) -> Dict[str, int]:
+        from olive.model import ModelConfig
+
+        model = ModelConfig.from_json(config["model"]).create_model()
+        evaluator = OliveEvaluatorFactory.create_evaluator_for_model(model)
+
+        base_rss = get_current_rss()
+        # the process peak rss also covers importing the packages, so sample the rss instead
+        with PeakRSSMonitor() as monitor:
+            run_func = evaluator._prepare_memory_session(
+                model, config["inference_settings"], config["device"], config["execution_providers"]
+            )
+        session_peak_rss = monitor.peak_rss
+        with PeakRSSMonitor() as monitor:
+            for _ in range(config["repeat_test_num"]):
+                run_func(input_data)
+        steady_state_rss = get_current_rss()
+        inference_peak_rss = max(monitor.peak_rss, steady_state_rss)
+
+        memory = {
+            MemorySubType.SESSION_PEAK_RSS: session_peak_rss - base_rss,
+            MemorySubType.INFERENCE_PEAK_RSS: inference_peak_rss - base_rss,
+            MemorySubType.STEADY_STATE_RSS: steady_state_rss - base_rss,
+        }
+        if config["model_size"]:
+            memory[MemorySubType.MODEL_SIZE] = evaluator._get_model_size(model)
+        return memory
+
+    def _prepare_memory_session(
+        self,
+        model: OliveModel,
+        inference_settings: Dict[str, Any] = None,
+        device: Device = Device.CPU,
+        execution_providers: Union[str, List[str]] = None,
+    ) -> Callable[[Any], Any]:
+        """
+        Load the model and create the inference session for the memory metric.
+
+        Returns a function that runs inference on a batch of input data.
+        """
+        raise NotImplementedError(f"Memory metric is not supported for {self.framework} models")
+
+    def _get_model_size(self, model: OliveModel) -> int:
+        """
+        Get the size of the model files in bytes.
+        """
+        resource_path = model.model_resource_path
+        if resource_path is None or not resource_path.is_local_resource():
+            raise ValueError(f"Cannot get the model size of {type(model)} with non-local model path")
+        return get_path_size(resource_path.get_path())
+
     def _evaluate_custom(
         self,
         model: OliveModel,
@@ -144,6 +250,14 @@ class OliveEvaluator(ABC):
                 metrics_res[metric.name] = self._evaluate_latency(
                     model, metric, dataloader, post_func, device, execution_providers
                 )
+            elif metric.type == MetricType.THROUGHPUT:
+                metrics_res[metric.name] = self._evaluate_throughput(
+                    model, metric, dataloader, post_func, device, execution_providers
+                )
+            elif metric.type == MetricType.MEMORY:
+                metrics_res[metric.name] = self._evaluate_memory(
+                    model, metric, dataloader, post_func, device, execution_providers
+                )
             elif metric.type == MetricType.CUSTOM:
                 metrics_res[metric.name] = self._evaluate_custom(
                     model, metric, dataloader, eval_func, post_func, device, execution_providers
@@ -188,6 +302,9 @@ class OliveEvaluator(ABC):
         dataloader = user_module.call_object(
             dataloader_func, get_local_path(metric.user_config.data_dir), metric.user_config.batch_size
         )
+        subset = metric.user_config.subset
+        if dataloader and subset:
+            dataloader = get_subset_dataloader(dataloader, subset)
 
         evaluate_func = getattr(metric.user_config, "evaluate_func", None)
         eval_func = user_module.load_object(evaluate_func)
@@ -197,7 +314,7 @@ class OliveEvaluator(ABC):
 
             # TODO remove user_scripts dataloader: we should respect user scripts
             # dataloder to meet back compatibility for time being.
-            dataloader = dataloader or dc.create_dataloader()
+            dataloader = dataloader or dc.create_dataloader(subset)
             post_func = post_func or dc.config.post_process
 
         if metric.user_config.input_names and metric.user_config.input_shapes and not dataloader and not eval_func:
@@ -218,34 +335,139 @@ class OliveEvaluator(ABC):
         """
         Compute accuracy metrics
         """
-        evaluate_backend_cls = MetricBackend.registry[metric.backend]
-        return evaluate_backend_cls().measure(preds, targets, metric)
+        return OliveEvaluator.get_metric_backend(metric).measure(preds, targets, metric)
+
+    @staticmethod
+    def get_metric_backend(metric: Metric) -> MetricBackend:
+        """
+        Get a backend to compute the accuracy metric. Feed the outputs and labels batch by batch with its update.
+        """
+        return MetricBackend.registry[metric.backend]()
 
     @staticmethod
     def compute_latency(metric: Metric, latencies: Any) -> MetricResult:
         """
         Compute latency metrics
         """
-        latency_metrics = {
-            LatencySubType.AVG: round(sum(latencies) / len(latencies) * 1000, 5),
-            LatencySubType.MAX: round(max(latencies) * 1000, 5),
-            LatencySubType.MIN: round(min(latencies) * 1000, 5),
-            LatencySubType.P50: round(np.percentile(latencies, 50) * 1000, 5),
-            LatencySubType.P75: round(np.percentile(latencies, 75) * 1000, 5),
-            LatencySubType.P90: round(np.percentile(latencies, 90) * 1000, 5),
-            LatencySubType.P95: round(np.percentile(latencies, 95) * 1000, 5),
-            LatencySubType.P99: round(np.percentile(latencies, 99) * 1000, 5),
-            LatencySubType.P999: round(np.percentile(latencies, 99.9) * 1000, 5),
+        latencies = np.asarray(latencies) * 1000
+        percentiles = {
+            LatencySubType.P50: 50,
+            LatencySubType.P75: 75,
+            LatencySubType.P90: 90,
+            LatencySubType.P95: 95,
+            LatencySubType.P99: 99,
+            LatencySubType.P999: 99.9,
+        }
+        latency_metrics = dict(zip(percentiles, np.percentile(latencies, list(percentiles.values()))))
+        latency_metrics.update(
+            {
+                LatencySubType.AVG: latencies.mean(),
+                LatencySubType.MAX: latencies.max(),
+                LatencySubType.MIN: latencies.min(),
+            }
+        )
+        metric_res = {}
+        for sub_type in metric.sub_types:
+            metric_res[sub_type.name] = SubMetricResult(
+                value=round(float(latency_metrics[sub_type.name]), 5),
+                priority=sub_type.priority,
+                higher_is_better=sub_type.higher_is_better,
+            )
+        return MetricResult.parse_obj(metric_res)
+
+    @staticmethod
+    def compute_latency_by_shape(latencies: Any, shapes: List[str]) -> Dict[str, Dict[str, float]]:
+        """
+        Compute the latency distribution in milliseconds of each input shape.
+
+        shapes are the input shapes of the measured runs, in the same order as latencies.
+        """
+        latencies = np.asarray(latencies) * 1000
+        shapes = np.asarray(shapes)
+        latency_by_shape = {}
+        for shape in np.unique(shapes):
+            shape_latencies = latencies[shapes == shape]
+            p50, p90, p99 = np.percentile(shape_latencies, [50, 90, 99])
+            latency_by_shape[str(shape)] = {
+                "count": len(shape_latencies),
+                LatencySubType.AVG.value: round(float(shape_latencies.mean()), 5),
+                LatencySubType.P50.value: round(float(p50), 5),
+                LatencySubType.P90.value: round(float(p90), 5),
+                LatencySubType.P99.value: round(float(p99), 5),
+            }
+        return latency_by_shape
+
+    @staticmethod
+    def compute_throughput(metric: Metric, latencies: Any, elapsed_time: float) -> MetricResult:
+        """
+        Compute throughput metrics from the latencies of all requests served within elapsed_time seconds
+        """
+        if len(latencies) == 0 or elapsed_time <= 0:
+            raise ValueError(
+                f"No requests finished within {elapsed_time} seconds for metric {metric.name}. "
+                "Please increase the duration of the throughput measurement."
+            )
+        latencies = np.asarray(latencies) * 1000
+        percentiles = {
+            ThroughputSubType.P50_LATENCY: 50,
+            ThroughputSubType.P90_LATENCY: 90,
+            ThroughputSubType.P95_LATENCY: 95,
+            ThroughputSubType.P99_LATENCY: 99,
         }
+        throughput_metrics = dict(zip(percentiles, np.percentile(latencies, list(percentiles.values()))))
+        throughput_metrics.update(
+            {
+                ThroughputSubType.REQUESTS_PER_SEC: len(latencies) / elapsed_time,
+                ThroughputSubType.AVG_LATENCY: latencies.mean(),
+                ThroughputSubType.MAX_LATENCY: latencies.max(),
+            }
+        )
         metric_res = {}
         for sub_type in metric.sub_types:
             metric_res[sub_type.name] = SubMetricResult(
-                value=latency_metrics[sub_type.name],
+                value=round(float(throughput_metrics[sub_type.name]), 5),
                 priority=sub_type.priority,
                 higher_is_better=sub_type.higher_is_better,
             )
         return MetricResult.parse_obj(metric_res)
 
+    @staticmethod
+    def compute_memory(metric: Metric, memory: Dict[str, int]) -> MetricResult:
+        """
+        Compute memory metrics in megabytes from the measured memory in bytes
+        """
+        metric_res = {}
+        for sub_type in metric.sub_types:
+            metric_res[sub_type.name] = SubMetricResult(
+                value=round(memory[sub_type.name] / 1024**2, 5),
+                priority=sub_type.priority,
+                higher_is_better=sub_type.higher_is_better,
+            )
+        return MetricResult.parse_obj(metric_res)
+
+    @staticmethod
+    def measure_concurrent_latencies(run_func, concurrency: int, duration: float) -> Tuple[List[float], float]:
+        """
+        Call run_func from concurrency threads for duration seconds.
+
+        Returns the latencies of all calls and the elapsed time in seconds.
+        """
+
+        def _worker(end_time):
+            latencies = []
+            while time.perf_counter() < end_time:
+                t = time.perf_counter()
+                run_func()
+                latencies.append(time.perf_counter() - t)
+            return latencies
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            start_time = time.perf_counter()
+            futures = [executor.submit(_worker, start_time + duration) for _ in range(concurrency)]
+            latencies = [latency for future in futures for latency in future.result()]
+            elapsed_time = time.perf_counter() - start_time
+        return latencies, elapsed_time
+
 
 class OnnxEvaluator(OliveEvaluator, framework=Framework.ONNX):
     def __init__(self):
@@ -270,6 +492,121 @@ class OnnxEvaluator(OliveEvaluator, framework=Framework.ONNX):
         }
         return input_dict
 
+    @staticmethod
+    def prepare_ort_inputs(session, input_dict: Dict[str, np.ndarray], device: Device = Device.CPU) -> Dict[str, Any]:
+        """
+        Convert formatted input data to OrtValues on the device of the session.
+
+        The OrtValues can be fed to the session repeatedly without converting the data again. The input data is
+        returned as is if the onnxruntime version does not support running with OrtValues, or if the session has
+        sequence or map outputs, which cannot be converted from OrtValues to numpy.
+        """
+        if not hasattr(session, "run_with_ort_values") or not OnnxEvaluator._has_only_tensor_outputs(session):
+            return input_dict
+
+        import onnxruntime as ort
+
+        device_type, device_id = OnnxEvaluator._get_ort_device(session, device)
+        return {k: ort.OrtValue.ortvalue_from_numpy(v, device_type, device_id) for k, v in input_dict.items()}
+
+    @staticmethod
+    def _has_only_tensor_outputs(session) -> bool:
+        return all(output.type.startswith("tensor") for output in session.get_outputs())
+
+    @staticmethod
+    def _get_ort_device(session, device: Device) -> Tuple[str, int]:
+        if device == Device.GPU and "CUDAExecutionProvider" in session.get_providers():
+            return "cuda", int(session.get_provider_options()["CUDAExecutionProvider"].get("device_id", 0))
+        return "cpu", 0
+
+    @staticmethod
+    def _get_ort_shape(value) -> List[int]:
+        return list(value.shape) if isinstance(value, np.ndarray) else value.shape()
+
+    @staticmethod
+    def prepare_ort_outputs(
+        session, io_config: Dict[str, Any], ort_inputs: Dict[str, Any], device: Device = Device.CPU
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Preallocate the output buffers of the session for the inputs, to be bound to an io binding and reused by
+        every run.
+
+        The output shapes are taken from the io config. Symbolic dimensions are resolved from the input dimensions with
+        the same name, or from a run of the session otherwise. Returns None if the outputs cannot be preallocated.
+        """
+        import onnxruntime as ort
+
+        if not hasattr(ort.OrtValue, "ortvalue_from_shape_and_type"):
+            return None
+        if not OnnxEvaluator._has_only_tensor_outputs(session):
+            # sequence and map outputs cannot be preallocated
+            return None
+
+        dims = {}
+        for name, shape in zip(io_config["input_names"], io_config["input_shapes"]):
+            if name in ort_inputs:
+                dims.update(
+                    (dim, value)
+                    for dim, value in zip(shape, OnnxEvaluator._get_ort_shape(ort_inputs[name]))
+                    if isinstance(dim, str)
+                )
+        # unknown dimensions without a name are 0 in the io config
+        output_shapes = [
+            [dims.get(dim) if isinstance(dim, str) else (dim or None) for dim in shape]
+            for shape in io_config["output_shapes"]
+        ]
+        if any(dim is None for shape in output_shapes for dim in shape):
+            outputs = OnnxEvaluator.run_ort_inputs(session, ort_inputs)
+            output_shapes = [OnnxEvaluator._get_ort_shape(output) for output in outputs]
+
+        device_type, device_id = OnnxEvaluator._get_ort_device(session, device)
+        return {
+            name: ort.OrtValue.ortvalue_from_shape_and_type(shape, np.dtype(output_type).type, device_type, device_id)
+            for name, shape, output_type in zip(io_config["output_names"], output_shapes, io_config["output_types"])
+        }
+
+    @staticmethod
+    def bind_ort_outputs(io_bind_op, session, device: Device, ort_outputs: Optional[Dict[str, Any]] = None):
+        """
+        Bind the outputs of the session to the io binding. The outputs are allocated by every run unless preallocated
+        buffers from prepare_ort_outputs are given.
+        """
+        if ort_outputs:
+            for k, v in ort_outputs.items():
+                io_bind_op.bind_ortvalue_output(k, v)
+            return
+        io_bind_device = "cuda" if device == "gpu" else "cpu"
+        for item in session.get_outputs():
+            io_bind_op.bind_output(item.name, io_bind_device)
+
+    @staticmethod
+    def bind_ort_inputs(io_bind_op, ort_inputs: Dict[str, Any]):
+        """
+        Bind the inputs prepared by prepare_ort_inputs to the io binding.
+        """
+        for k, v in ort_inputs.items():
+            if isinstance(v, np.ndarray):
+                io_bind_op.bind_cpu_input(k, v)
+            else:
+                io_bind_op.bind_ortvalue_input(k, v)
+
+    @staticmethod
+    def run_ort_inputs(session, ort_inputs: Dict[str, Any]) -> List[Any]:
+        """
+        Run the session on the inputs prepared by prepare_ort_inputs. Returns OrtValues or numpy arrays.
+        """
+        if any(isinstance(v, np.ndarray) for v in ort_inputs.values()):
+            return session.run(input_feed=ort_inputs, output_names=None)
+        return session.run_with_ort_values(None, ort_inputs)
+
+    @staticmethod
+    def ort_outputs_to_numpy(outputs: List[Any]) -> List[np.ndarray]:
+        """
+        Convert the outputs returned by run_ort_inputs to numpy arrays. Outputs that are not OrtValues, such as the
+        lists and dicts of sequence and map outputs, are returned as is.
+        """
+        return [output.numpy() if hasattr(output, "numpy") else output for output in outputs]
+
     def _evaluate_onnx_accuracy(
         self,
         model: ONNXModel,
@@ -284,20 +621,36 @@ class OnnxEvaluator(OliveEvaluator, framework=Framework.ONNX):
             device=device,
             execution_providers=execution_providers,
         )
-        io_config = model.get_io_config()
 
-        preds = []
-        targets = []
+        def run(input_dict):
+            ort_inputs = OnnxEvaluator.prepare_ort_inputs(session, input_dict, device)
+            return OnnxEvaluator.ort_outputs_to_numpy(OnnxEvaluator.run_ort_inputs(session, ort_inputs))
+
+        return OnnxEvaluator._compute_onnx_accuracy(run, model.get_io_config(), metric, dataloader, post_func)
+
+    @staticmethod
+    def _compute_onnx_accuracy(
+        run: Callable[[Dict[str, np.ndarray]], List[np.ndarray]],
+        io_config: Dict[str, Any],
+        metric: Metric,
+        dataloader: Dataset,
+        post_func=None,
+    ) -> MetricResult:
+        """
+        Compute the accuracy metric over the dataloader. run returns the outputs of the model for the formatted inputs.
+        """
         output_names = io_config["output_names"]
+        metric_backend = OliveEvaluator.get_metric_backend(metric)
+        early_stopper = AccuracyEarlyStopper(metric, dataloader)
         for input_data, labels in dataloader:
-            input_dict = OnnxEvaluator.format_input(input_data, io_config)
-            res = session.run(input_feed=input_dict, output_names=None)
+            res = run(OnnxEvaluator.format_input(input_data, io_config))
             result = torch.Tensor(res[0]) if len(output_names) == 1 else torch.Tensor(res)
             outputs = post_func(result) if post_func else result
-            preds.extend(outputs.tolist())
-            targets.extend(labels.data.tolist())
+            metric_backend.update(outputs, labels, metric)
+            if early_stopper.update(outputs, labels):
+                return early_stopper.mark_early_stopped(metric_backend.compute(metric))
 
-        return OliveEvaluator.compute_accuracy(metric, preds, targets)
+        return metric_backend.compute(metric)
 
     def _evaluate_onnx_latency(
         self,
@@ -317,22 +670,31 @@ class OnnxEvaluator(OliveEvaluator, framework=Framework.ONNX):
         )
         io_config = model.get_io_config()
 
+        full_dataset, max_batches = get_latency_dataset_config_from_metric(metric)
+        if full_dataset:
+            return self._evaluate_onnx_latency_on_dataset(
+                session, io_config, metric, dataloader, device, warmup_num, sleep_num, max_batches
+            )
+
         input_data, _ = next(iter(dataloader))
-        input_dict = OnnxEvaluator.format_input(input_data, io_config)
+        # the inputs are converted once, outside of the timed runs
+        ort_inputs = OnnxEvaluator.prepare_ort_inputs(
+            session, OnnxEvaluator.format_input(input_data, io_config), device
+        )
 
         if metric.user_config.io_bind:
             io_bind_op = session.io_binding()
-            io_bind_device = "cuda" if device == "gpu" else "cpu"
-            for k, v in input_dict.items():
-                io_bind_op.bind_cpu_input(k, v)
-            for item in session.get_outputs():
-                io_bind_op.bind_output(item.name, io_bind_device)
+            OnnxEvaluator.bind_ort_inputs(io_bind_op, ort_inputs)
+            ort_outputs = None
+            if metric.user_config.preallocate_outputs:
+                ort_outputs = OnnxEvaluator.prepare_ort_outputs(session, io_config, ort_inputs, device)
+            OnnxEvaluator.bind_ort_outputs(io_bind_op, session, device, ort_outputs)
 
         for _ in range(warmup_num):
             if metric.user_config.io_bind:
                 session.run_with_iobinding(io_bind_op)
             else:
-                session.run(input_feed=input_dict, output_names=None)
+                OnnxEvaluator.run_ort_inputs(session, ort_inputs)
 
         latencies = []
         for _ in range(repeat_test_num):
@@ -342,12 +704,126 @@ class OnnxEvaluator(OliveEvaluator, framework=Framework.ONNX):
                 latencies.append(time.perf_counter() - t)
             else:
                 t = time.perf_counter()
-                session.run(input_feed=input_dict, output_names=None)
+                OnnxEvaluator.run_ort_inputs(session, ort_inputs)
                 latencies.append(time.perf_counter() - t)
             time.sleep(sleep_num)
 
         return OliveEvaluator.compute_latency(metric, latencies)
 
+    def _evaluate_onnx_latency_on_dataset(
+        self,
+        session,
+        io_config: Dict[str, Any],
+        metric: Metric,
+        dataloader: Dataset,
+        device: Device,
+        warmup_num: int,
+        sleep_num: int,
+        max_batches: int = None,
+    ) -> MetricResult:
+        """
+        Measure the latency of every batch in the dataloader, up to max_batches batches.
+
+        The percentiles are computed across all batches. The latency distribution of each input shape is logged.
+        """
+        io_bind_op = None
+        if metric.user_config.io_bind:
+            io_bind_op = session.io_binding()
+            OnnxEvaluator.bind_ort_outputs(io_bind_op, session, device)
+        # preallocated output buffers, reused by the batches with the same input shapes
+        preallocated_outputs = {}
+
+        def run(ort_inputs, shape):
+            if io_bind_op is None:
+                t = time.perf_counter()
+                OnnxEvaluator.run_ort_inputs(session, ort_inputs)
+                return time.perf_counter() - t
+            OnnxEvaluator.bind_ort_inputs(io_bind_op, ort_inputs)
+            if metric.user_config.preallocate_outputs:
+                if shape not in preallocated_outputs:
+                    preallocated_outputs[shape] = OnnxEvaluator.prepare_ort_outputs(
+                        session, io_config, ort_inputs, device
+                    )
+                OnnxEvaluator.bind_ort_outputs(io_bind_op, session, device, preallocated_outputs[shape])
+            t = time.perf_counter()
+            session.run_with_iobinding(io_bind_op)
+            return time.perf_counter() - t
+
+        latencies = []
+        shapes = []
+        for i, (input_data, _) in enumerate(dataloader):
+            if max_batches is not None and i >= max_batches:
+                break
+            input_dict = OnnxEvaluator.format_input(input_data, io_config)
+            ort_inputs = OnnxEvaluator.prepare_ort_inputs(session, input_dict, device)
+            shape = ",".join(f"{k}:{'x'.join(map(str, v.shape))}" for k, v in input_dict.items())
+            if i == 0:
+                for _ in range(warmup_num):
+                    run(ort_inputs, shape)
+            latencies.append(run(ort_inputs, shape))
+            shapes.append(shape)
+            time.sleep(sleep_num)
+
+        latency_by_shape = OliveEvaluator.compute_latency_by_shape(latencies, shapes)
+        logger.info(f"Latency (ms) by input shape for metric {metric.name}: {latency_by_shape}")
+        return OliveEvaluator.compute_latency(metric, latencies)
+
+    def _evaluate_throughput(
+        self,
+        model: OliveModel,
+        metric: Metric,
+        dataloader: Dataset,
+        post_func=None,
+        device: Device = Device.CPU,
+        execution_providers: Union[str, List[str]] = None,
+    ) -> MetricResult:
+        if not isinstance(model, ONNXModel):
+            raise TypeError(f"Cannot evaluate throughput for model of type: {type(model)}")
+
+        warmup_num, concurrency, duration = get_throughput_config_from_metric(metric)
+
+        # a single session is shared by all threads, the same as a serving process handling concurrent requests
+        session = model.prepare_session(
+            inference_settings=self.get_inference_settings(metric),
+            device=device,
+            execution_providers=execution_providers,
+        )
+        io_config = model.get_io_config()
+
+        input_data, _ = next(iter(dataloader))
+        # the inputs are converted once and shared by all requests
+        ort_inputs = OnnxEvaluator.prepare_ort_inputs(
+            session, OnnxEvaluator.format_input(input_data, io_config), device
+        )
+
+        for _ in range(warmup_num):
+            OnnxEvaluator.run_ort_inputs(session, ort_inputs)
+
+        latencies, elapsed_time = OliveEvaluator.measure_concurrent_latencies(
+            lambda: OnnxEvaluator.run_ort_inputs(session, ort_inputs), concurrency, duration
+        )
+        return OliveEvaluator.compute_throughput(metric, latencies, elapsed_time)
+
+    def _prepare_memory_session(
+        self,
+        model: OliveModel,
+        inference_settings: Dict[str, Any] = None,
+        device: Device = Device.CPU,
+        execution_providers: Union[str, List[str]] = None,
+    ) -> Callable[[Any], Any]:
+        if not isinstance(model, ONNXModel):
+            raise TypeError(f"Cannot evaluate memory for model of type: {type(model)}")
+
+        session = model.prepare_session(
+            inference_settings=inference_settings, device=device, execution_providers=execution_providers
+        )
+        io_config = model.get_io_config()
+
+        def run(input_data):
+            return session.run(input_feed=OnnxEvaluator.format_input(input_data, io_config), output_names=None)
+
+        return run
+
     @staticmethod
     def _evaluate_distributed_accuracy_worker(config) -> Tuple[List[Any], List[Any]]:
         model_path = config["model_path"]
@@ -388,7 +864,24 @@ class OnnxEvaluator(OliveEvaluator, framework=Framework.ONNX):
 
         return preds, targets
 
-    def _evaluate_distributed_accuracy(self, model: DistributedOnnxModel, metric: Metric) -> MetricResult:
+    def _evaluate_distributed_accuracy(
+        self,
+        model: DistributedOnnxModel,
+        metric: Metric,
+        dataloader: Dataset,
+        post_func=None,
+        device: Device = Device.GPU,
+    ) -> MetricResult:
+        if metric.user_config.distributed_backend == DistributedBackend.SHARED_MEMORY:
+            pool = self._prepare_shared_memory_rank_pool(model, metric, device)
+
+            def run(input_dict):
+                _, outputs = pool.run(input_dict, return_outputs=True)
+                return outputs
+
+            io_config = model.load_model(0).get_io_config()
+            return OnnxEvaluator._compute_onnx_accuracy(run, io_config, metric, dataloader, post_func)
+
         from copy import deepcopy
 
         from mpi4py.futures import MPIPoolExecutor
@@ -466,7 +959,17 @@ class OnnxEvaluator(OliveEvaluator, framework=Framework.ONNX):
 
         return latencies
 
-    def _evaluate_distributed_latency(self, model: DistributedOnnxModel, metric: Metric) -> MetricResult:
+    def _evaluate_distributed_latency(
+        self, model: DistributedOnnxModel, metric: Metric, dataloader: Dataset, device: Device = Device.GPU
+    ) -> MetricResult:
+        if metric.user_config.distributed_backend == DistributedBackend.SHARED_MEMORY:
+            pool = self._prepare_shared_memory_rank_pool(model, metric, device)
+            warmup_num, repeat_test_num, sleep_num = get_latency_config_from_metric(metric)
+            input_data, _ = next(iter(dataloader))
+            input_dict = OnnxEvaluator.format_input(input_data, model.load_model(0).get_io_config())
+            latencies, _ = pool.run(input_dict, warmup_num, repeat_test_num, sleep_num)
+            return OliveEvaluator.compute_latency(metric, [x for r in latencies for x in r])
+
         from copy import deepcopy
 
         from mpi4py.futures import MPIPoolExecutor
@@ -493,6 +996,23 @@ class OnnxEvaluator(OliveEvaluator, framework=Framework.ONNX):
         latencies = [x for r in results for x in r]
         return OliveEvaluator.compute_latency(metric, latencies)
 
+    def _prepare_shared_memory_rank_pool(
+        self, model: DistributedOnnxModel, metric: Metric, device: Device
+    ) -> "SharedMemoryRankPool":
+        """
+        Get the persistent rank worker pool of the model and load the ranked models in the workers.
+        """
+        # multiprocessing.shared_memory requires python 3.8+
+        from olive.evaluator.distributed import SharedMemoryRankPool
+
+        pool = SharedMemoryRankPool.get(model.ranks)
+        pool.load(
+            [model.ranked_model_path(rank) for rank in range(model.ranks)],
+            self.get_inference_settings(metric),
+            device,
+        )
+        return pool
+
     def _evaluate_accuracy(
         self,
         model: ONNXModel,
@@ -505,7 +1025,7 @@ class OnnxEvaluator(OliveEvaluator, framework=Framework.ONNX):
         if isinstance(model, ONNXModel):
             return self._evaluate_onnx_accuracy(model, metric, dataloader, post_func, device, execution_providers)
         elif isinstance(model, DistributedOnnxModel):
-            return self._evaluate_distributed_accuracy(model, metric)
+            return self._evaluate_distributed_accuracy(model, metric, dataloader, post_func, device)
         else:
             raise TypeError(f"Cannot evaluate accuracy for model of type: {type(model)}")
 
@@ -521,7 +1041,7 @@ class OnnxEvaluator(OliveEvaluator, framework=Framework.ONNX):
         if isinstance(model, ONNXModel):
             return self._evaluate_onnx_latency(model, metric, dataloader, post_func, device, execution_providers)
         elif isinstance(model, DistributedOnnxModel):
-            return self._evaluate_distributed_latency(model, metric)
+            return self._evaluate_distributed_latency(model, metric, dataloader, device)
         else:
             raise TypeError(f"Cannot evaluate latency for model of type: {type(model)}")
 
@@ -545,23 +1065,21 @@ class PyTorchEvaluator(OliveEvaluator, framework=Framework.PYTORCH):
     ) -> MetricResult:
         session = model.prepare_session(inference_settings=self.get_inference_settings(metric), device=device)
 
-        preds = []
-        targets = []
         device = PyTorchEvaluator._device_string_to_torch_device(device)
         if device:
             session.to(device)
+        metric_backend = OliveEvaluator.get_metric_backend(metric)
+        early_stopper = AccuracyEarlyStopper(metric, dataloader)
         for input_data, labels in dataloader:
             input_data = tensor_data_to_device(input_data, device)
             result = session(**input_data) if isinstance(input_data, dict) else session(input_data)
             outputs = post_func(result) if post_func else result
-            # use the list.extend instead of list.append to avoid the different sub-array has different size when
-            # batch size is greater than 2 so that the residue array has different size with the batch size,
-            # which will result the exception like:
-            #  ValueError: expected sequence of length 128 at dim 1 (got 3)
-            preds.extend(outputs.tolist())
-            targets.extend(labels.data.tolist())
+            # the metrics are accumulated batch by batch, so the last batch can be smaller than the batch size
+            metric_backend.update(outputs, labels, metric)
+            if early_stopper.update(outputs, labels):
+                return early_stopper.mark_early_stopped(metric_backend.compute(metric))
 
-        return OliveEvaluator.compute_accuracy(metric, preds, targets)
+        return metric_backend.compute(metric)
 
     def _evaluate_latency(
         self,
@@ -599,6 +1117,34 @@ class PyTorchEvaluator(OliveEvaluator, framework=Framework.PYTORCH):
 
         return OliveEvaluator.compute_latency(metric, latencies)
 
+    def _prepare_memory_session(
+        self,
+        model: PyTorchModel,
+        inference_settings: Dict[str, Any] = None,
+        device: Device = Device.CPU,
+        execution_providers: Union[str, List[str]] = None,
+    ) -> Callable[[Any], Any]:
+        session = model.prepare_session(inference_settings=inference_settings, device=device)
+        device = PyTorchEvaluator._device_string_to_torch_device(device)
+        if device:
+            session.to(device)
+
+        def run(input_data):
+            input_data = tensor_data_to_device(input_data, device)
+            with torch.no_grad():
+                return session(**input_data) if isinstance(input_data, dict) else session(input_data)
+
+        return run
+
+    def _get_model_size(self, model: PyTorchModel) -> int:
+        resource_path = model.model_resource_path
+        if resource_path is not None and resource_path.is_local_resource():
+            return get_path_size(resource_path.get_path())
+        # the model is created by a model loader or downloaded, use the size of its parameters and buffers
+        session = model.load_model()
+        tensors = list(session.parameters()) + list(session.buffers())
+        return sum(t.numel() * t.element_size() for t in tensors)
+
 
 class SNPEEvaluator(OliveEvaluator, framework=Framework.SNPE):
     def __init__(self):
@@ -659,6 +1205,33 @@ class OpenVINOEvaluator(OliveEvaluator, framework=Framework.OPENVINO):
     def __init__(self):
         super().__init__()
 
+    @staticmethod
+    def format_input(input_data) -> Dict[Union[int, str], Any]:
+        """
+        Map the input data to the model inputs: by name for a dict, by index for a list or tuple, else the first input.
+        """
+        if isinstance(input_data, dict):
+            return {k: np.asarray(v) for k, v in input_data.items()}
+        elif isinstance(input_data, (list, tuple)):
+            return {i: np.asarray(v) for i, v in enumerate(input_data)}
+        return {0: np.asarray(input_data)}
+
+    @staticmethod
+    def set_inputs(infer_request, inputs: Dict[Union[int, str], Any]):
+        """
+        Set the input tensors of the infer request without running the inference.
+        """
+        try:
+            from openvino.runtime import Tensor
+        except ImportError:
+            raise ImportError("Please install olive-ai[openvino] to use OpenVINO model")
+
+        for key, value in inputs.items():
+            if isinstance(key, int):
+                infer_request.set_input_tensor(key, Tensor(np.ascontiguousarray(value)))
+            else:
+                infer_request.set_tensor(key, Tensor(np.ascontiguousarray(value)))
+
     def _evaluate_accuracy(
         self,
         model: OpenVINOModel,
@@ -691,16 +1264,88 @@ class OpenVINOEvaluator(OliveEvaluator, framework=Framework.OPENVINO):
         device: Device = Device.CPU,
         execution_providers: Union[str, List[str]] = None,
     ) -> MetricResult:
+        warmup_num, repeat_test_num, sleep_num = get_latency_config_from_metric(metric)
         session = model.prepare_session(inference_settings=self.get_inference_settings(metric), device=device)
+        # the inputs are set on the infer request before the timed runs, only the inference is measured
+        infer_request = session.create_infer_request()
+
+        full_dataset, max_batches = get_latency_dataset_config_from_metric(metric)
+        if full_dataset:
+            latencies = []
+            shapes = []
+            for i, (input_data, _) in enumerate(dataloader):
+                if max_batches is not None and i >= max_batches:
+                    break
+                inputs = OpenVINOEvaluator.format_input(input_data)
+                OpenVINOEvaluator.set_inputs(infer_request, inputs)
+                if i == 0:
+                    for _ in range(warmup_num):
+                        infer_request.infer()
+                t = time.perf_counter()
+                infer_request.infer()
+                latencies.append(time.perf_counter() - t)
+                shapes.append(",".join(f"{k}:{'x'.join(map(str, v.shape))}" for k, v in inputs.items()))
+                time.sleep(sleep_num)
+
+            latency_by_shape = OliveEvaluator.compute_latency_by_shape(latencies, shapes)
+            logger.info(f"Latency (ms) by input shape for metric {metric.name}: {latency_by_shape}")
+            return OliveEvaluator.compute_latency(metric, latencies)
+
+        input_data, _ = next(iter(dataloader))
+        infer_request.infer(OpenVINOEvaluator.format_input(input_data))
+        for _ in range(warmup_num):
+            infer_request.infer()
 
         latencies = []
-        for input_data, _ in dataloader:
+        for _ in range(repeat_test_num):
             t = time.perf_counter()
-            session(input_data)
+            infer_request.infer()
             latencies.append(time.perf_counter() - t)
+            time.sleep(sleep_num)
 
         return OliveEvaluator.compute_latency(metric, latencies)
 
+    def _evaluate_throughput(
+        self,
+        model: OpenVINOModel,
+        metric: Metric,
+        dataloader: Dataset,
+        post_func=None,
+        device: Device = Device.CPU,
+        execution_providers: Union[str, List[str]] = None,
+    ) -> MetricResult:
+        try:
+            from openvino.runtime import AsyncInferQueue
+        except ImportError:
+            raise ImportError("Please install olive-ai[openvino] to use OpenVINO model")
+
+        warmup_num, concurrency, duration = get_throughput_config_from_metric(metric)
+        session = model.prepare_session(inference_settings=self.get_inference_settings(metric), device=device)
+
+        input_data, _ = next(iter(dataloader))
+        inputs = OpenVINOEvaluator.format_input(input_data)
+        # pool of concurrency infer requests run asynchronously by OpenVINO
+        infer_queue = AsyncInferQueue(session, concurrency)
+        for infer_request in infer_queue:
+            # set the inputs of every request once, this also warms up the request
+            infer_request.infer(inputs)
+        for _ in range(warmup_num):
+            infer_queue.start_async()
+        infer_queue.wait_all()
+
+        latencies = []
+        # the latency of a request is reported in milliseconds
+        infer_queue.set_callback(lambda infer_request, _: latencies.append(infer_request.latency / 1000))
+        start_time = time.perf_counter()
+        end_time = start_time + duration
+        while time.perf_counter() < end_time:
+            # blocks until one of the requests is idle
+            infer_queue.start_async()
+        infer_queue.wait_all()
+        elapsed_time = time.perf_counter() - start_time
+
+        return OliveEvaluator.compute_throughput(metric, latencies, elapsed_time)
+
 
 class OliveEvaluatorFactory:
     @staticmethod
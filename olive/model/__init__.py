@@ -6,15 +6,14 @@ import logging
 import os
 import shutil
 import tempfile
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from copy import deepcopy
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
-import onnx
-import torch
 import yaml
-from onnx import AttributeProto, GraphProto
 from pydantic import validator
 
 import olive.data.template as data_config_template
@@ -39,8 +38,12 @@ from olive.resource_path import (
     ResourceType,
     create_resource_path,
 )
-from olive.snpe import SNPEDevice, SNPEInferenceSession, SNPESessionOptions
-from olive.snpe.tools.dev import get_dlc_metrics
+
+if TYPE_CHECKING:
+    import torch
+    from onnx import GraphProto, ModelProto
+
+    from olive.snpe import SNPEInferenceSession
 
 REGISTRY = {}
 logger = logging.getLogger(__name__)
@@ -241,7 +244,7 @@ class ONNXModel(ONNXModelBase):
         self.onnx_file_name = onnx_file_name
         self.io_config = None
         self.graph = None
-        self.all_graphs: Optional[List[GraphProto]] = None
+        self.all_graphs: Optional[List["GraphProto"]] = None
         # huggingface config
         self.hf_config = validate_config(hf_config, HFConfig) if hf_config else None
 
@@ -311,7 +314,9 @@ class ONNXModel(ONNXModelBase):
                 parent_dir.mkdir(parents=True, exist_ok=True)
         return str(path)
 
-    def load_model(self, rank: int = None) -> onnx.ModelProto:
+    def load_model(self, rank: int = None) -> "ModelProto":
+        import onnx
+
         # HACK: ASSUME no external data
         return onnx.load(self.model_path)
 
@@ -360,6 +365,8 @@ class ONNXModel(ONNXModelBase):
     def get_all_graphs(self):
         if self.all_graphs is not None:
             return self.all_graphs
+        from onnx import AttributeProto, GraphProto
+
         self.all_graphs = []
         graph_queue = [self.get_graph()]
         while graph_queue:
@@ -419,6 +426,8 @@ class ONNXModel(ONNXModelBase):
         if self.io_config:
             return self.io_config
 
+        import onnx
+
         try:
             from onnx.helper import tensor_dtype_to_np_dtype
         except ImportError:
@@ -500,7 +509,9 @@ class PyTorchModel(OliveModel):
         # huggingface config
         self.hf_config = validate_config(hf_config, HFConfig) if hf_config else None
 
-    def load_model(self, rank: int = None) -> torch.nn.Module:
+    def load_model(self, rank: int = None) -> "torch.nn.Module":
+        import torch
+
         if self.model is not None:
             return self.model
 
@@ -717,7 +728,9 @@ class SNPEModel(OliveModel):
         device: Device,
         execution_providers: Union[str, List[str]] = None,
         rank: Optional[int] = None,
-    ) -> SNPEInferenceSession:
+    ) -> "SNPEInferenceSession":
+        from olive.snpe import SNPEDevice, SNPEInferenceSession, SNPESessionOptions
+
         inference_settings = inference_settings or {}
         session_options = SNPESessionOptions(**inference_settings)
         if device == Device.NPU:
@@ -731,6 +744,8 @@ class SNPEModel(OliveModel):
         return serialize_to_json(config, check_object)
 
     def get_dlc_metrics(self) -> dict:
+        from olive.snpe.tools.dev import get_dlc_metrics
+
         return get_dlc_metrics(self.model_path)
 
 
@@ -756,6 +771,12 @@ class TensorFlowModel(OliveModel):
 
 
 class OpenVINOModel(OliveModel):
+    # compiled models shared by the sessions of this process, keyed by model files and device. Only the most recently
+    # used ones are kept since every compiled model holds its weights in memory
+    _compiled_models: "OrderedDict[Tuple, Any]" = OrderedDict()
+    _max_compiled_models = 4
+    _compiled_models_lock = threading.Lock()
+
     def __init__(self, model_path: OLIVE_RESOURCE_ANNOTATIONS):
         super().__init__(
             model_path=model_path, framework=Framework.OPENVINO, model_file_format=ModelFileFormat.OPENVINO_IR
@@ -804,13 +825,37 @@ class OpenVINOModel(OliveModel):
             from openvino.runtime import Core
         except ImportError:
             raise ImportError("Please install olive-ai[openvino] to use OpenVINO model")
-        ie = Core()
-        model_pot = ie.read_model(model=self.model_config["model"])
+        model_config = self.model_config
         if device == Device.INTEL_MYRIAD:
             device = "MYRIAD"
-        compiled_model = ie.compile_model(model=model_pot, device_name=device.upper())
+        device_name = device.upper()
+        # the modification times are part of the key so that a model overwritten in place is compiled again
+        weights = model_config.get("weights")
+        key = (
+            model_config["model"],
+            os.stat(model_config["model"]).st_mtime_ns,
+            os.stat(weights).st_mtime_ns if weights and os.path.exists(weights) else None,
+            device_name,
+        )
+        with OpenVINOModel._compiled_models_lock:
+            compiled_models = OpenVINOModel._compiled_models
+            compiled_model = compiled_models.get(key)
+            if compiled_model is None:
+                ie = Core()
+                model_pot = ie.read_model(model=model_config["model"])
+                compiled_model = compiled_models[key] = ie.compile_model(model=model_pot, device_name=device_name)
+                while len(compiled_models) > OpenVINOModel._max_compiled_models:
+                    compiled_models.popitem(last=False)
+            else:
+                compiled_models.move_to_end(key)
         return compiled_model
 
+    @classmethod
+    def clear_compiled_models(cls):
+        """Release the compiled models cached by prepare_session."""
+        with cls._compiled_models_lock:
+            cls._compiled_models.clear()
+
 
 class DistributedOnnxModel(ONNXModelBase):
     EXECUTION_PROVIDERS = {
@@ -2,6 +2,8 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 # --------------------------------------------------------------------------
+import json
+import threading
 from typing import Any, Callable, Dict, List, Union
 
 from pydantic import validator
@@ -118,9 +120,32 @@ def get_hf_model_io_config(model_name: str, task: str, feature: str):
     return io_config
 
 
-def get_hf_model_dummy_input(model_name: str, task: str, feature: str):
+# tokenizers keyed by the model name and the json of the kwargs, since the kwargs can hold lists and dicts
+_tokenizer_cache = {}
+_tokenizer_cache_lock = threading.Lock()
+
+
+def get_tokenizer(model_name: str, **kwargs):
+    """
+    Get the tokenizer for a huggingface model. The tokenizer is created once per model_name and kwargs and
+    shared for the rest of the process. It is not cached if the kwargs are not json serializable.
+
+    The returned tokenizer is shared by every caller with the same arguments, so it must not be mutated
+    (e.g. by setting pad_token). Pass the change as a kwarg instead, or copy the tokenizer before changing it.
+    """
     from transformers import AutoTokenizer
 
+    try:
+        key = json.dumps([model_name, kwargs], sort_keys=True)
+    except TypeError:
+        return AutoTokenizer.from_pretrained(model_name, **kwargs)
+    with _tokenizer_cache_lock:
+        if key not in _tokenizer_cache:
+            _tokenizer_cache[key] = AutoTokenizer.from_pretrained(model_name, **kwargs)
+        return _tokenizer_cache[key]
+
+
+def get_hf_model_dummy_input(model_name: str, task: str, feature: str):
     model_config = get_onnx_config(model_name, task, feature)
-    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    tokenizer = get_tokenizer(model_name)
     return model_config.generate_dummy_inputs(tokenizer, framework="pt")
@@ -3,10 +3,14 @@
 # Licensed under the MIT License.
 # --------------------------------------------------------------------------
 from olive.passes.olive_pass import FullPassConfig, Pass
-from olive.passes.onnx import *  # noqa: F403
-from olive.passes.openvino import *  # noqa: F403
 from olive.passes.pass_config import PassParamDefault
-from olive.passes.pytorch import *  # noqa: F403
-from olive.passes.snpe import *  # noqa: F403
+from olive.passes.pass_registry import get_pass_names, import_pass
 
 REGISTRY = Pass.registry
+
+__all__ = ["FullPassConfig", "Pass", "PassParamDefault", "REGISTRY", *get_pass_names(__name__)]
+
+
+def __getattr__(name):
+    # pass classes are imported lazily to avoid loading the dependencies of every pass
+    return import_pass(__name__, name)
@@ -23,6 +23,7 @@ from olive.passes.pass_config import (
     get_data_config,
     get_user_script_config,
 )
+from olive.passes.pass_registry import PassRegistry
 from olive.resource_path import ResourcePath
 from olive.strategy.search_parameter import (
     Categorical,
@@ -43,7 +44,7 @@ class Pass(ABC):
     Each pass should derive its own configuration class that contains all information it needs to execute.
     """
 
-    registry: Dict[str, Type["Pass"]] = {}
+    registry: Dict[str, Type["Pass"]] = PassRegistry()
     # True if pass configuration requires user script for non-local host support
     _requires_user_script: bool = False
     # True if pass configuration requires data configuration which will leverage data container for pass execution
@@ -2,36 +2,10 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 # --------------------------------------------------------------------------
-from olive.passes.onnx.append_pre_post_processing_ops import AppendPrePostProcessingOps
-from olive.passes.onnx.conversion import OnnxConversion
-from olive.passes.onnx.float16_conversion import OnnxFloatToFloat16
-from olive.passes.onnx.inc_quantization import IncDynamicQuantization, IncQuantization, IncStaticQuantization
-from olive.passes.onnx.insert_beam_search import InsertBeamSearch
-from olive.passes.onnx.mixed_precision import OrtMixedPrecision
-from olive.passes.onnx.model_optimizer import OnnxModelOptimizer
-from olive.passes.onnx.optimum_conversion import OptimumConversion
-from olive.passes.onnx.optimum_merging import OptimumMerging
-from olive.passes.onnx.perf_tuning import OrtPerfTuning
-from olive.passes.onnx.quantization import OnnxDynamicQuantization, OnnxQuantization, OnnxStaticQuantization
-from olive.passes.onnx.transformer_optimization import OrtTransformersOptimization
-from olive.passes.onnx.vitis_ai_quantization import VitisAIQuantization
+from olive.passes.pass_registry import get_pass_names, import_pass
 
-__all__ = [
-    "AppendPrePostProcessingOps",
-    "OnnxConversion",
-    "OnnxDynamicQuantization",
-    "OnnxQuantization",
-    "OnnxStaticQuantization",
-    "IncDynamicQuantization",
-    "IncQuantization",
-    "IncStaticQuantization",
-    "OrtPerfTuning",
-    "OrtTransformersOptimization",
-    "OnnxModelOptimizer",
-    "OnnxFloatToFloat16",
-    "InsertBeamSearch",
-    "OrtMixedPrecision",
-    "VitisAIQuantization",
-    "OptimumConversion",
-    "OptimumMerging",
-]
+__all__ = get_pass_names(__name__)
+
+
+def __getattr__(name):
+    return import_pass(__name__, name)
@@ -2,10 +2,10 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 # --------------------------------------------------------------------------
-from olive.passes.openvino.conversion import OpenVINOConversion
-from olive.passes.openvino.quantization import OpenVINOQuantization
+from olive.passes.pass_registry import get_pass_names, import_pass
 
-__all__ = [
-    "OpenVINOConversion",
-    "OpenVINOQuantization",
-]
+__all__ = get_pass_names(__name__)
+
+
+def __getattr__(name):
+    return import_pass(__name__, name)
@@ -2,8 +2,11 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 # --------------------------------------------------------------------------
+import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Union
+from typing import Any, Callable, Dict, List, Tuple, Union
 
 import numpy as np
 
@@ -14,6 +17,8 @@ from olive.passes import Pass
 from olive.passes.pass_config import PassConfigParam
 from olive.resource_path import OLIVE_RESOURCE_ANNOTATIONS
 
+logger = logging.getLogger(__name__)
+
 
 class OpenVINOQuantization(Pass):
     """
@@ -59,6 +64,14 @@ class OpenVINOQuantization(Pass):
                     " for Metric instance to calculate the accuracy metric of the model."
                 ),
             ),
+            "prefetch_size": PassConfigParam(
+                type_=int,
+                default_value=0,
+                description=(
+                    "Number of items of the data_config dataloader to fetch ahead in a background thread during"
+                    " calibration. The items are fetched on demand if 0."
+                ),
+            ),
             "algorithms": PassConfigParam(
                 type_=List[Dict],
                 required=True,
@@ -86,13 +99,18 @@ class OpenVINOQuantization(Pass):
             )
         elif self._data_config:
             common_dataloader = self._data_config.to_data_container().create_dataloader()
-            data_loader = self._create_dataloader(common_dataloader)
+            data_loader = self._create_dataloader(common_dataloader, config["prefetch_size"])
 
         metric = self._user_module_loader.load_object(config["metric_func"])
         engine = IEEngine(config=config["engine_config"], data_loader=data_loader, metric=metric)
         self.pipeline = create_pipeline(config["algorithms"], engine)
 
-        compressed_model = self.pipeline.run(model=model.load_model())
+        try:
+            compressed_model = self.pipeline.run(model=model.load_model())
+        finally:
+            # stop the prefetch thread and drop the prefetched items
+            if isinstance(data_loader, _LazyDataLoader):
+                data_loader.close()
         compress_model_weights(compressed_model)
         compressed_model_paths = save_model(
             model=compressed_model,
@@ -104,7 +122,7 @@ class OpenVINOQuantization(Pass):
 
         return openvino_model
 
-    def _create_dataloader(self, common_dataloader):
+    def _create_dataloader(self, common_dataloader, prefetch_size: int = 0):
         """
         Create an openvino.tools.pot.api.DataLoader instance from a common dataloader.
         """
@@ -113,27 +131,94 @@ class OpenVINOQuantization(Pass):
         except ImportError:
             raise ImportError("Please install olive-ai[openvino] to use OpenVINO pass")
 
-        class _OVDataloader(DataLoader):
-            def __init__(self, dataloader):
-                self.data = []
-                self.labels = []
-                for data, label in dataloader:
-                    if isinstance(data, dict):
-                        data = {k: np.array(v) for k, v in data.items()}
-                    elif isinstance(data, tuple):
-                        data = tuple(np.array(v) for v in data)
-                    else:
-                        data = np.array(data)
-                    self.data.append(data)
-                    self.labels.append(label)
-
-            def __len__(self):
-                return len(self.data)
-
-            def __getitem__(self, index):
-                if index >= len(self):
-                    raise IndexError
-
-                return self.data[index], self.labels[index]
-
-        return _OVDataloader(common_dataloader)
+        class _OVDataloader(_LazyDataLoader, DataLoader):
+            pass
+
+        return _OVDataloader(common_dataloader, prefetch_size)
+
+
+def _to_numpy(data):
+    if isinstance(data, dict):
+        return {k: np.array(v) for k, v in data.items()}
+    elif isinstance(data, tuple):
+        return tuple(np.array(v) for v in data)
+    return np.array(data)
+
+
+class _LazyDataLoader:
+    """
+    Data loader implementing __len__ and __getitem__ of openvino.tools.pot.api.DataLoader over a common dataloader.
+
+    If the dataloader is a torch DataLoader over an indexable dataset with a sequential sampler, or is indexable
+    itself, the items are fetched on demand so that the memory used does not grow with the size of the dataset. With
+    prefetch_size > 0, the next prefetch_size items are fetched in a background thread and at most prefetch_size
+    items are cached. The thread is stopped by close(). Other dataloaders are loaded into memory up front.
+    """
+
+    def __init__(self, dataloader, prefetch_size: int = 0):
+        self.get_item, self.num_items = self._get_item_func(dataloader)
+        self.prefetch_size = prefetch_size
+        self._prefetched = OrderedDict()
+        self._executor = ThreadPoolExecutor(max_workers=1) if prefetch_size > 0 else None
+
+    @staticmethod
+    def _get_item_func(dataloader) -> Tuple[Callable[[int], Any], int]:
+        """
+        Get the function to fetch the item at an index and the number of items.
+        """
+        from torch.utils.data import DataLoader, IterableDataset, SequentialSampler
+
+        if isinstance(dataloader, DataLoader):
+            dataset = dataloader.dataset
+            if not isinstance(dataset, IterableDataset) and isinstance(dataloader.sampler, SequentialSampler):
+                batch_size = dataloader.batch_size
+                if batch_size is None:
+                    # automatic batching is disabled
+                    return (lambda index: dataloader.collate_fn(dataset[index])), len(dataset)
+
+                def get_batch(index):
+                    indices = range(index * batch_size, min((index + 1) * batch_size, len(dataset)))
+                    return dataloader.collate_fn([dataset[i] for i in indices])
+
+                return get_batch, len(dataloader)
+        elif hasattr(dataloader, "__getitem__") and hasattr(dataloader, "__len__"):
+            return dataloader.__getitem__, len(dataloader)
+
+        logger.debug(f"Dataloader of type {type(dataloader)} is not indexable. Loading it into memory.")
+        items = list(dataloader)
+        return items.__getitem__, len(items)
+
+    def _fetch(self, index):
+        data, label = self.get_item(index)
+        return _to_numpy(data), label
+
+    def __len__(self):
+        return self.num_items
+
+    def __getitem__(self, index):
+        if index >= len(self):
+            raise IndexError
+
+        if self._executor is None:
+            return self._fetch(index)
+
+        future = self._prefetched.pop(index, None)
+        item = future.result() if future is not None else self._fetch(index)
+        # prefetch the next items, evicting the oldest ones beyond prefetch_size
+        for next_index in range(index + 1, min(index + 1 + self.prefetch_size, len(self))):
+            if next_index not in self._prefetched:
+                self._prefetched[next_index] = self._executor.submit(self._fetch, next_index)
+        while len(self._prefetched) > self.prefetch_size:
+            self._prefetched.popitem(last=False)[1].cancel()
+        return item
+
+    def close(self):
+        """
+        Cancel the pending prefetches and shut down the prefetch thread. Items are fetched on demand afterwards.
+        """
+        for future in self._prefetched.values():
+            future.cancel()
+        self._prefetched.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
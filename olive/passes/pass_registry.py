@@ -0,0 +1,84 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------
+import importlib
+from typing import List
+
+# manifest of the built-in passes: pass class name -> module that defines it
+# the modules pull in heavy dependencies (onnxruntime, torch, openvino, ...) so they are only imported when the pass
+# is used. Please keep this in sync when adding a new pass.
+PASS_MODULES = {
+    # onnx
+    "AppendPrePostProcessingOps": "olive.passes.onnx.append_pre_post_processing_ops",
+    "OnnxConversion": "olive.passes.onnx.conversion",
+    "OnnxFloatToFloat16": "olive.passes.onnx.float16_conversion",
+    "IncQuantization": "olive.passes.onnx.inc_quantization",
+    "IncDynamicQuantization": "olive.passes.onnx.inc_quantization",
+    "IncStaticQuantization": "olive.passes.onnx.inc_quantization",
+    "InsertBeamSearch": "olive.passes.onnx.insert_beam_search",
+    "OrtMixedPrecision": "olive.passes.onnx.mixed_precision",
+    "OnnxModelOptimizer": "olive.passes.onnx.model_optimizer",
+    "OptimumConversion": "olive.passes.onnx.optimum_conversion",
+    "OptimumMerging": "olive.passes.onnx.optimum_merging",
+    "OrtPerfTuning": "olive.passes.onnx.perf_tuning",
+    "OnnxQuantization": "olive.passes.onnx.quantization",
+    "OnnxDynamicQuantization": "olive.passes.onnx.quantization",
+    "OnnxStaticQuantization": "olive.passes.onnx.quantization",
+    "OrtTransformersOptimization": "olive.passes.onnx.transformer_optimization",
+    "VitisAIQuantization": "olive.passes.onnx.vitis_ai_quantization",
+    # openvino
+    "OpenVINOConversion": "olive.passes.openvino.conversion",
+    "OpenVINOQuantization": "olive.passes.openvino.quantization",
+    # pytorch
+    "QuantizationAwareTraining": "olive.passes.pytorch.quantization_aware_training",
+    # snpe
+    "SNPEConversion": "olive.passes.snpe.conversion",
+    "SNPEQuantization": "olive.passes.snpe.quantization",
+    "SNPEtoONNXConversion": "olive.passes.snpe.snpe_to_onnx",
+}
+
+_LOWER_NAME_TO_MODULE = {name.lower(): module for name, module in PASS_MODULES.items()}
+
+
+def get_pass_names(package: str = "olive.passes") -> List[str]:
+    """
+    Get the names of the built-in passes defined under the package.
+    """
+    return [name for name, module in PASS_MODULES.items() if module.startswith(f"{package}.")]
+
+
+def import_pass(package: str, name: str):
+    """
+    Import a built-in pass class by name. Used as the module level __getattr__ of the pass packages.
+    """
+    if name not in get_pass_names(package):
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+    module = importlib.import_module(PASS_MODULES[name])
+    return getattr(module, name)
+
+
+class PassRegistry(dict):
+    """
+    Registry of pass classes keyed by lower-cased class name.
+
+    Passes register themselves when their module is imported. Built-in passes are listed in the manifest and their
+    module is imported the first time they are looked up.
+    """
+
+    def __missing__(self, key: str):
+        module = _LOWER_NAME_TO_MODULE.get(key)
+        if module is None:
+            raise KeyError(key)
+        # importing the module registers the pass through Pass.__init_subclass__
+        importlib.import_module(module)
+        return super().__getitem__(key)
+
+    def __contains__(self, key: object) -> bool:
+        return super().__contains__(key) or key in _LOWER_NAME_TO_MODULE
+
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
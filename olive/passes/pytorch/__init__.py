@@ -2,6 +2,10 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 # --------------------------------------------------------------------------
-from olive.passes.pytorch.quantization_aware_training import QuantizationAwareTraining
+from olive.passes.pass_registry import get_pass_names, import_pass
 
-__all__ = ["QuantizationAwareTraining"]
+__all__ = get_pass_names(__name__)
+
+
+def __getattr__(name):
+    return import_pass(__name__, name)
@@ -2,8 +2,10 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 # --------------------------------------------------------------------------
-from olive.passes.snpe.conversion import SNPEConversion
-from olive.passes.snpe.quantization import SNPEQuantization
-from olive.passes.snpe.snpe_to_onnx import SNPEtoONNXConversion
+from olive.passes.pass_registry import get_pass_names, import_pass
 
-__all__ = ["SNPEConversion", "SNPEQuantization", "SNPEtoONNXConversion"]
+__all__ = get_pass_names(__name__)
+
+
+def __getattr__(name):
+    return import_pass(__name__, name)
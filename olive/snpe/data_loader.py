@@ -3,19 +3,54 @@
 # Licensed under the MIT License.
 # --------------------------------------------------------------------------
 import logging
+import os
 import shutil
 import tempfile
+import threading
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Tuple
+from typing import Any, Dict, Tuple
 
 import numpy as np
 import torch
 
 import olive.snpe.utils.input_list as input_list_utils
+from olive.common.utils import hash_file
 
 logger = logging.getLogger(__name__)
 
+# batches staged from data directories that outlive their dataloader, shared by all the dataloaders in the process.
+# keyed by the data directory, the hash of the input list and the batch size
+_shared_staged_batches: Dict[Tuple[str, str, int], Tuple[Path, Dict[int, Tuple[str, str, tuple]]]] = {}
+_shared_staging_dir = None
+_staged_batches_lock = threading.Lock()
+
+
+def _get_shared_staged_batches(data_dir: str, input_list: str, batch_size: int):
+    """
+    Get the root directory and the staged batches shared by the dataloaders of the data directory, input list and
+    batch size.
+    """
+    global _shared_staging_dir
+    key = (data_dir, hash_file(input_list), batch_size)
+    with _staged_batches_lock:
+        if _shared_staging_dir is None:
+            _shared_staging_dir = tempfile.TemporaryDirectory(prefix="olive_snpe_batches_")
+        if key not in _shared_staged_batches:
+            batch_root_dir = Path(_shared_staging_dir.name) / str(len(_shared_staged_batches))
+            _shared_staged_batches[key] = (batch_root_dir, {})
+        return _shared_staged_batches[key]
+
+
+def link_or_copy(src: str, dst: str):
+    """
+    Hardlink src to dst, falling back to copying if the file cannot be linked.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy(src, dst)
+
 
 class SNPEDataLoader(ABC):
     """
@@ -47,36 +82,95 @@ class SNPEDataLoader(ABC):
 
         if self.tmp_dir is None:
             self.tmp_dir = tempfile.TemporaryDirectory(prefix="olive_tmp_")
-        self.batch_dir = str(Path(self.tmp_dir.name) / "batch")
-
-        batch_input_list = input_list_utils.resolve_input_list(
-            self.batch_dir, self.input_list, self.tmp_dir.name, self.data_dir, "batch_input_list.txt"
-        )
-
+        # every batch is staged once in its own directory and reused by every iteration over the dataloader
+        data_dir = Path(self.data_dir).resolve()
+        try:
+            data_dir.relative_to(Path(self.tmp_dir.name).resolve())
+            # the data is deleted with the dataloader, so are its batches
+            self.batch_root_dir = Path(self.tmp_dir.name) / f"batches_{self.batch_size}"
+            self.staged_batches = {}
+        except ValueError:
+            # the batches are also reused by the later dataloaders of the same data, such as in other evaluations
+            self.batch_root_dir, self.staged_batches = _get_shared_staged_batches(
+                str(data_dir), self.input_list, self.batch_size
+            )
+
+        # header lines of the input list and the (input name, input path) pairs of every sample
         self.batch_input_list_headers = []
-        self.batch_input_list_contents = []
-        with open(self.input_list, "r") as f, open(batch_input_list, "r") as f_batch:
-            for line, line_batch in zip(f, f_batch):
+        samples = []
+        with open(self.input_list, "r") as f:
+            for line in f:
                 if line.startswith("#") or line.startswith("%"):
                     self.batch_input_list_headers.append(line.strip())
-                else:
-                    self.batch_input_list_contents.append((line.strip(), line_batch.strip()))
-
-        self.batch_input_list_metadata = []
-        for line, line_batch in self.batch_input_list_contents:
-            to_copy = []
-            for input, input_batch in zip(line.split(), line_batch.split()):
-                if ":=" in input:
-                    to_copy.append((input.split(":=")[1], input_batch.split(":=")[1]))
-                else:
-                    to_copy.append((input, input_batch))
-            self.batch_input_list_metadata.append((line_batch, to_copy))
+                elif line.strip():
+                    inputs = line.split()
+                    input_list_utils.check_input_line(inputs)
+                    sample = [tuple(input.split(":=")) if ":=" in input else (None, input) for input in inputs]
+                    for _, input_path in sample:
+                        # the batches are staged with the same layout as the data directory
+                        try:
+                            Path(input_path).relative_to(Path(self.data_dir))
+                        except ValueError:
+                            raise ValueError(
+                                f"Invalid input list. Input path {input_path} is not in the data directory"
+                                f" {self.data_dir}"
+                            ) from None
+                    samples.append(sample)
 
         self.batches = []
-        for i in range(0, len(self.batch_input_list_metadata), self.batch_size):
-            self.batches.append(self.batch_input_list_metadata[i : i + self.batch_size])  # noqa: E203
+        for i in range(0, len(samples), self.batch_size):
+            self.batches.append(samples[i : i + self.batch_size])  # noqa: E203
         self.num_batches = len(self.batches)
 
+    def _get_source_ids(self, batch_id: int) -> tuple:
+        """
+        Get the size, mtime and inode of the input files of the batch, to know if a staged batch is out of date.
+        """
+        source_ids = []
+        for sample in self.batches[batch_id]:
+            for _, input_path in sample:
+                stat = os.stat(input_path)
+                source_ids.append((stat.st_size, stat.st_mtime_ns, stat.st_ino))
+        return tuple(source_ids)
+
+    def _stage_batch(self, batch_id: int) -> Tuple[str, str, tuple]:
+        """
+        Stage the input files of the batch in a batch directory with the same layout as the data directory.
+
+        The files are hardlinked and only copied if they cannot be linked, for instance across file systems. Symlinks
+        are not used since the batch directory is pushed as is to android targets.
+        """
+        batch_dir = self.batch_root_dir / str(batch_id)
+        if batch_dir.exists():
+            # the input files changed since the batch was staged
+            shutil.rmtree(batch_dir)
+        source_ids = self._get_source_ids(batch_id)
+        lines = []
+        for sample in self.batches[batch_id]:
+            inputs = []
+            for input_name, input_path in sample:
+                input_batch = batch_dir / Path(input_path).relative_to(Path(self.data_dir))
+                input_batch.parent.mkdir(parents=True, exist_ok=True)
+                link_or_copy(input_path, input_batch)
+                input_batch = input_batch.as_posix()
+                inputs.append(f"{input_name}:={input_batch}" if input_name is not None else input_batch)
+            lines.append(" ".join(inputs))
+
+        batch_input_list = str(batch_dir / "input_list.txt")
+        with open(batch_input_list, "w") as f:
+            for line in self.batch_input_list_headers + lines:
+                f.write(f"{line}\n")
+
+        return str(batch_dir), batch_input_list, source_ids
+
+    def _get_staged_batch(self, batch_id: int) -> Tuple[str, str]:
+        with _staged_batches_lock:
+            staged_batch = self.staged_batches.get(batch_id)
+            if staged_batch is None or staged_batch[2] != self._get_source_ids(batch_id):
+                staged_batch = self._stage_batch(batch_id)
+                self.staged_batches[batch_id] = staged_batch
+        return staged_batch[:2]
+
     def get_batch(self, batch_id):
         if batch_id >= self.num_batches:
             raise ValueError("batch_id should be less than {}".format(self.num_batches))
@@ -89,23 +183,9 @@ class SNPEDataLoader(ABC):
                 annotation = self.annotation[
                     self.batch_size * batch_id : self.batch_size * (batch_id + 1)  # noqa: E203
                 ]
-            batch = self.batches[batch_id]
-
-            shutil.rmtree(self.batch_dir, ignore_errors=True)
-            for _, to_copy in batch:
-                for input, input_batch in to_copy:
-                    Path(input_batch).parent.mkdir(parents=True, exist_ok=True)
-                    # Path(input_batch).symlink_to(input)
-                    shutil.copy(input, input_batch)
-
-            batch_input_list = str(Path(self.batch_dir) / "input_list.txt")
-            with open(batch_input_list, "w") as f:
-                for header in self.batch_input_list_headers:
-                    f.write(f"{header}\n")
-                for line_batch, _ in batch:
-                    f.write(f"{line_batch}\n")
-
-            return self.batch_dir, batch_input_list, annotation
+            batch_dir, batch_input_list = self._get_staged_batch(batch_id)
+
+            return batch_dir, batch_input_list, annotation
 
     def __len__(self):
         return self.num_batches
@@ -6,8 +6,9 @@ import logging
 import platform
 import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Tuple, Union
 
 import numpy as np
 
@@ -28,14 +29,49 @@ def init_snpe_net_adb(dlc_path: str, android_target: str, snpe_adb_prepared: boo
     android_target: The target Android device
     snpe_adb_prepared: Whether the SNPE SDK has been pushed to the target Android device
     """
-    adb_utils.run_adb_command("root", android_target)
+    adb_session = adb_utils.AdbDeviceSession.get(android_target)
+    adb_session.root()
 
     if not snpe_adb_prepared:
         adb_utils.prepare_snpe_adb(android_target)
 
-    # Push the DLC to target
+    # Push the DLC to a clean target workspace
     target_ws = "/data/local/tmp/olive-snpe/ws"
-    adb_utils.adb_push(dlc_path, target_ws, android_target, True)
+    adb_session.run_shell_script([f"rm -rf {target_ws}", f"mkdir -p {target_ws}"])
+    adb_session.run(f"push {Path(dlc_path).resolve().as_posix()} {target_ws}")
+
+
+def read_raw_file(raw_file: Union[str, Path], out: np.ndarray) -> np.ndarray:
+    """
+    Read a raw float32 file directly into the preallocated array out. The file size must match the size of out.
+    """
+    with open(raw_file, "rb") as f:
+        num_bytes = f.readinto(memoryview(out).cast("B"))
+        if num_bytes != out.nbytes or f.read(1):
+            raise ValueError(f"Size of {raw_file} does not match the output shape {list(out.shape)}")
+    return out
+
+
+def _get_diag_log(output_dir: Path, run: int) -> Dict[str, float]:
+    """
+    Get the init and average total inference time in seconds from the SNPE DiagLog of the run.
+    """
+    SNPE_diag_log = output_dir / f"SNPEDiag_{run}.log"
+    SNPE_diag_csv = output_dir / f"SNPEDiag_{run}.csv"
+
+    cmd = f"snpe-diagview --input_log {SNPE_diag_log} --output {SNPE_diag_csv}"
+    run_snpe_command(cmd)
+
+    diag_log = {"init": None, "avg_total_inference_time": None}
+    with open(SNPE_diag_csv, "r") as f:
+        for line in f:
+            message_name = line.split(",")[1].lower()
+            message_value = line.split(",")[3]
+            if message_name in diag_log and diag_log[message_name] is None:
+                diag_log[message_name] = float(message_value) / 1000000
+                if all(value is not None for value in diag_log.values()):
+                    break
+    return diag_log
 
 
 def _snpe_net_run_adb(
@@ -68,15 +104,17 @@ def _snpe_net_run_adb(
     target_output_dir = f"{target_ws}/output"
     target_data_dir = f"{target_ws}/data"
 
+    adb_session = adb_utils.AdbDeviceSession.get(android_target)
     try:
-        adb_utils.run_adb_command("root", android_target)
+        adb_session.root()
 
         # create clean target workspace
-        if not initialized:
-            adb_utils.run_adb_command(f"rm -rf {target_ws}", android_target, True)
-        else:
-            adb_utils.run_adb_command(f"rm -rf {target_data_dir} {target_output_dir}", android_target, True)
-        adb_utils.run_adb_command(f"mkdir -p {target_ws} {target_data_dir} {target_output_dir}", android_target, True)
+        adb_session.run_shell_script(
+            [
+                f"rm -rf {target_ws}" if not initialized else f"rm -rf {target_data_dir} {target_output_dir}",
+                f"mkdir -p {target_ws} {target_data_dir} {target_output_dir}",
+            ]
+        )
 
         # create new input list with target paths
         target_input_list = resolve_input_list(target_data_dir, input_list, str(Path(output_dir).parent), data_dir)
@@ -110,7 +148,7 @@ def _snpe_net_run_adb(
     finally:
         if not persist_ws:
             # clean target workspace
-            adb_utils.run_adb_command(f"rm -rf {target_ws}", android_target, True)
+            adb_session.run_shell_script([f"rm -rf {target_ws}"])
 
 
 def snpe_net_run(
@@ -220,86 +258,78 @@ def snpe_net_run(
     elif platform.system() == "Windows":
         delimiter = "_"
 
-    # dictionary to store the results as numpy arrays
+    # Result_N directories sorted by N
+    result_dirs = sorted(
+        (int(member.name.split("_")[1]), member) for member in tmp_dir_path.iterdir() if "Result_" in member.name
+    )
+    # Note if we are doing the perf test with inferences_per_duration then the Result_N
+    # folders do not match the inputs, instead we get one Result_N folder per duration.
+    inferences_per_duration = 0 if inferences_per_duration is None else inferences_per_duration
+    result_input_ids = [
+        f"result_{result_idx}" if inferences_per_duration > 0 else input_ids[result_idx]
+        for result_idx, _ in result_dirs
+    ]
+
+    # output file name in the Result_N directories, the same for all results
+    output_file_names = {}
+    for output_name in output_names:
+        # output names for dlcs converted from tensorflow models contain ":"
+        # try adding `:0` or `_0` to output file name in case original model was tensorflow and
+        # user provided original output names
+        output_file_name = f"{output_name}{delimiter}0.raw"
+        if not result_dirs or not (result_dirs[0][1] / output_file_name).exists():
+            # `:0` is already in the output name or source model was not tensorflow
+            output_file_name = f"{output_name}.raw"
+        if platform.system() == "Windows":
+            # replace ":" with "_" in the file name.
+            output_file_name = output_file_name.replace(":", "_")
+        output_file_names[output_name] = output_file_name
+
+    # the results are read directly into preallocated arrays
     results = {}
     result_files = {}
-    for output_name in output_names:
-        results[output_name] = []
-        result_files[output_name] = []
-
-    for member in tmp_dir_path.iterdir():
-        if "Result_" not in member.name:
-            continue
-        result_idx = int(member.name.split("_")[1])
-        # Note if we are doing the perf test with inferences_per_duration then the Result_N
-        # folders do not match the inputs, instead we get one Result_N folder per duration.
-        inferences_per_duration = 0 if inferences_per_duration is None else inferences_per_duration
-        input_id = f"result_{result_idx}" if inferences_per_duration > 0 else input_ids[result_idx]
-        for output_name, output_shape in zip(output_names, output_shapes):
-            # output names for dlcs converted from tensorflow models contain ":"
-            # try adding `:0` or `_0` to output file name in case original model was tensorflow and
-            # user provided original output names
-            output_file_name = f"{output_name}{delimiter}0.raw"
-            if not (member / output_file_name).exists():
-                # `:0` is already in the output name or source model was not tensorflow
-                output_file_name = f"{output_name}.raw"
-            if platform.system() == "Windows":
-                # replace ":" with "_" in the file name.
-                output_file_name = output_file_name.replace(":", "_")
-            raw_file = member / output_file_name
-
-            # copy the raw file to the workspace and rename it
+    for output_name, output_shape in zip(output_names, output_shapes):
+        if return_numpy_results:
+            results[output_name] = np.empty((len(result_dirs), *output_shape), dtype=np.float32)
+        result_files[output_name] = [None] * len(result_dirs)
+
+    def process_result(idx: int):
+        result_dir = result_dirs[idx][1]
+        for output_name in output_names:
+            raw_file = result_dir / output_file_names[output_name]
+
+            # move the raw file to the workspace and rename it
             if output_dir is not None:
-                output_file = output_dir / f"{input_id}.{output_name}.raw"
+                output_file = output_dir / f"{result_input_ids[idx]}.{output_name}.raw"
                 if platform.system() == "Windows":
                     # replace ":" with "_" in the file name.
-                    output_file = output_dir / f"{input_id}.{output_name}.raw".replace(":", "_")
+                    output_file = output_dir / f"{result_input_ids[idx]}.{output_name}.raw".replace(":", "_")
                 if len(output_names) == 1:
                     # no need to encode the output name in the file name
-                    output_file = output_dir / f"{input_id}.raw"
+                    output_file = output_dir / f"{result_input_ids[idx]}.raw"
                 raw_file.rename(output_file)
-                result_files[output_name].append((result_idx, output_file))
+                raw_file = output_file
+                result_files[output_name][idx] = output_file
 
-            # read the raw file and convert it to a numpy array
+            # read the raw file into the results array
             if return_numpy_results:
-                float_array = np.fromfile(raw_file, dtype=np.float32)
-                float_array = float_array.reshape(output_shape)
-                results[output_name].append((result_idx, float_array))
-
-    if return_numpy_results:
-        # sort the results by the input id and stack them into a single numpy array
-        for output_name in output_names:
-            results[output_name].sort(key=lambda x: x[0])
-            results[output_name] = [x[1] for x in results[output_name]]
-            results[output_name] = np.stack(results[output_name])
-
-    if workspace is not None:
-        # sort the result files by the input id
-        for output_name in output_names:
-            result_files[output_name].sort(key=lambda x: x[0])
-            result_files[output_name] = [x[1] for x in result_files[output_name]]
-
-    latencies = {"init": [], "total_inference_time": []}
-    for run in range(runs):
-        # SNPE DiagLog
-        SNPE_diag_log = tmp_dir_path / f"SNPEDiag_{run}.log"
-        SNPE_diag_csv = tmp_dir_path / f"SNPEDiag_{run}.csv"
-
-        cmd = f"snpe-diagview --input_log {SNPE_diag_log} --output {SNPE_diag_csv}"
-        run_snpe_command(cmd)
-
-        diag_log = {"init": None, "avg_total_inference_time": None}
-        with open(SNPE_diag_csv, "r") as f:
-            for line in f:
-                message_name = line.split(",")[1].lower()
-                message_value = line.split(",")[3]
-                if message_name in ["init", "avg_total_inference_time"] and diag_log[message_name] is None:
-                    diag_log[message_name] = float(message_value) / 1000000
-        latencies["init"].append(diag_log["init"])
-        latencies["total_inference_time"].append(diag_log["avg_total_inference_time"])
-
-        if output_dir is not None:
-            SNPE_diag_csv.rename(output_dir / f"perf_results_{run}.csv")
+                read_raw_file(raw_file, results[output_name][idx])
+
+    # reading the files is mostly io, so the results are processed in parallel
+    with ThreadPoolExecutor() as executor:
+        # consume the iterator to raise the exceptions of the workers
+        list(executor.map(process_result, range(len(result_dirs))))
+
+    # get the timing of every run from the SNPE DiagLogs in parallel
+    with ThreadPoolExecutor() as executor:
+        diag_logs = list(executor.map(lambda run: _get_diag_log(tmp_dir_path, run), range(runs)))
+    latencies = {
+        "init": [diag_log["init"] for diag_log in diag_logs],
+        "total_inference_time": [diag_log["avg_total_inference_time"] for diag_log in diag_logs],
+    }
+    if output_dir is not None:
+        for run in range(runs):
+            (tmp_dir_path / f"SNPEDiag_{run}.csv").rename(output_dir / f"perf_results_{run}.csv")
 
     # explicitly delete the tmp directory just to be safe
     tmp_dir.cleanup()
@@ -332,15 +362,17 @@ def _snpe_throughput_net_run_adb(
     target_ws = "/data/local/tmp/olive-snpe/ws"
     target_data_dir = f"{target_ws}/data"
 
+    adb_session = adb_utils.AdbDeviceSession.get(android_target)
     try:
-        adb_utils.run_adb_command("root", android_target)
+        adb_session.root()
 
         # create clean target workspace
-        if not initialized:
-            adb_utils.run_adb_command(f"rm -rf {target_ws}", android_target, True)
-        else:
-            adb_utils.run_adb_command(f"rm -rf {target_data_dir}", android_target, True)
-        adb_utils.run_adb_command(f"mkdir -p {target_ws} {target_data_dir}", android_target, True)
+        adb_session.run_shell_script(
+            [
+                f"rm -rf {target_ws}" if not initialized else f"rm -rf {target_data_dir}",
+                f"mkdir -p {target_ws} {target_data_dir}",
+            ]
+        )
 
         # create input_raw with target paths
         inputs = input_raw.split(",")
@@ -368,7 +400,7 @@ def _snpe_throughput_net_run_adb(
         stdout, stderr = adb_utils.run_snpe_adb_command(cmd, android_target, push_snpe=push_snpe)
     finally:
         if not persist_ws:
-            adb_utils.run_adb_command(f"rm -rf {target_ws}", android_target, True)
+            adb_session.run_shell_script([f"rm -rf {target_ws}"])
 
     return stdout, stderr
 
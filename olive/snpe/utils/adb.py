@@ -1,11 +1,12 @@
 import logging
 import os
 import platform
+import shlex
 import time
 from pathlib import Path
-from typing import Tuple
+from typing import Dict, List, Optional, Tuple
 
-from olive.common.utils import run_subprocess
+from olive.common.utils import hash_io_stream, run_subprocess
 
 logger = logging.getLogger(__name__)
 
@@ -121,12 +122,180 @@ def adb_push(src: str, dst: str, android_target: str, clean: bool = False):
         run_adb_command(f"push {src_path.as_posix()} {dst}", android_target)
 
 
-def get_snpe_adb_env(android_target: str, push_snpe: bool = True) -> dict:
+class AdbDeviceSession:
     """
-    Get the environment variables for running SNPE on the target Android device.
+    Session with a target Android device, shared by all the SNPE runs on the device in this process.
 
-    android_target: The target Android device
-    push_snpe: Whether to push the SNPE SDK to the target Android device
+    The device is rooted and the SNPE SDK is pushed once per session. The SDK directories are synced incrementally:
+    only the files whose checksums differ from the remote files are pushed and the remote files that no longer exist
+    locally are removed. Shell commands are batched into a single adb shell call.
+
+    Since the device can be rebooted or wiped while the process is running, the checksum of one pushed SDK file is
+    checked on the device before the pushed SDK is reused. If it does not match, the device is rooted and the SDK is
+    synced again.
+    """
+
+    _sessions: Dict[str, "AdbDeviceSession"] = {}
+
+    def __init__(self, android_target: str):
+        self.android_target = android_target
+        self.rooted = False
+        self.snpe_env = None
+        # (remote path, checksum) of a pushed SDK file, checked before the pushed SDK is reused
+        self._snpe_sentinel: Tuple[str, str] = None
+        # local checksums memoized by (path, size, mtime)
+        self._local_checksums: Dict[Tuple[str, int, int], str] = {}
+
+    @classmethod
+    def get(cls, android_target: str) -> "AdbDeviceSession":
+        """
+        Get the session of the target Android device. The session is created on first use.
+        """
+        if android_target not in cls._sessions:
+            cls._sessions[android_target] = cls(android_target)
+        return cls._sessions[android_target]
+
+    def run(self, cmd: str, shell_cmd: bool = False, **kwargs) -> Tuple[str, str]:
+        return run_adb_command(cmd, self.android_target, shell_cmd=shell_cmd, **kwargs)
+
+    def run_shell_script(self, cmds: List[str], **kwargs) -> Tuple[str, str]:
+        """
+        Run the shell commands in a single adb shell call. Stops at the first failing command.
+
+        The paths in the commands must be quoted with shlex.quote.
+        """
+        return self.run(" && ".join(cmds), shell_cmd=True, **kwargs)
+
+    def root(self):
+        """
+        Restart adbd with root permissions, once per session.
+        """
+        if not self.rooted:
+            self.run("root")
+            self.rooted = True
+
+    def get_local_checksums(self, src_dir: str) -> Dict[str, str]:
+        """
+        Get the md5 checksums of the files in the local directory, keyed by their posix path relative to src_dir.
+        """
+        checksums = {}
+        for path in sorted(Path(src_dir).rglob("*")):
+            if not path.is_file():
+                continue
+            stat = path.stat()
+            key = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+            if key not in self._local_checksums:
+                with open(path, "rb") as f:
+                    self._local_checksums[key] = hash_io_stream(f)
+            checksums[path.relative_to(src_dir).as_posix()] = self._local_checksums[key]
+        return checksums
+
+    def get_remote_checksums(self, dst_dir: str) -> Dict[str, str]:
+        """
+        Get the md5 checksums of the files in the remote directory, keyed by their posix path relative to dst_dir.
+        Returns an empty dict if the directory does not exist.
+        """
+        quoted_dst_dir = shlex.quote(dst_dir)
+        stdout, _ = self.run_shell_script(
+            [f"if [ -d {quoted_dst_dir} ]; then cd {quoted_dst_dir} && find . -type f -exec md5sum {{}} +; fi"]
+        )
+        checksums = {}
+        for line in stdout.splitlines():
+            if not line.strip():
+                continue
+            checksum, path = line.split(maxsplit=1)
+            checksums[path.strip()[2:]] = checksum
+        return checksums
+
+    def get_remote_checksum(self, path: str) -> Optional[str]:
+        """
+        Get the md5 checksum of the remote file. Returns None if the checksum cannot be computed, for example if the
+        file does not exist.
+        """
+        try:
+            stdout, _ = self.run_shell_script([f"md5sum {shlex.quote(path)}"], log_error=False)
+        except RuntimeError:
+            return None
+        return stdout.split()[0] if stdout.strip() else None
+
+    def sync_dir(self, src_dir: str, dst_dir: str, executable: bool = False) -> Dict[str, str]:
+        """
+        Sync the remote directory with the local directory, only pushing the files that changed. Returns the checksums
+        of the local files, keyed by their posix path relative to src_dir.
+
+        src_dir: The local source directory
+        dst_dir: The remote destination directory
+        executable: Whether to make the remote files executable
+        """
+        if not Path(src_dir).is_dir():
+            raise FileNotFoundError(f"Path {src_dir} does not exist")
+
+        local_checksums = self.get_local_checksums(src_dir)
+        try:
+            remote_checksums = self.get_remote_checksums(dst_dir)
+        except RuntimeError:
+            # md5sum is not available on the device, push the whole directory to a clean destination
+            logger.debug(f"Cannot get the checksums of {dst_dir}. Pushing {src_dir} to a clean destination.")
+            self.run_shell_script([f"rm -rf {shlex.quote(dst_dir)}"])
+            remote_checksums = {}
+        changed = [path for path, checksum in local_checksums.items() if remote_checksums.get(path) != checksum]
+        removed = [path for path in remote_checksums if path not in local_checksums]
+
+        cmds = [f"mkdir -p {shlex.quote(dst_dir)}"]
+        if removed:
+            cmds.append("rm -f " + " ".join(shlex.quote(f"{dst_dir}/{path}") for path in removed))
+        remote_parents = {Path(f"{dst_dir}/{path}").parent.as_posix() for path in changed}
+        if remote_parents:
+            cmds.append("mkdir -p " + " ".join(shlex.quote(parent) for parent in sorted(remote_parents)))
+        self.run_shell_script(cmds)
+
+        if not remote_checksums:
+            # nothing to diff against, push the whole directory at once
+            self.run(f"push {shlex.quote(Path(src_dir).resolve().as_posix() + '/.')} {shlex.quote(dst_dir)}")
+        else:
+            for path in changed:
+                src_path = (Path(src_dir).resolve() / path).as_posix()
+                self.run(f"push {shlex.quote(src_path)} {shlex.quote(f'{dst_dir}/{path}')}")
+        logger.debug(f"Synced {src_dir} to {dst_dir}: pushed {len(changed)} files, removed {len(removed)} files")
+
+        if executable and changed:
+            self.run_shell_script(["chmod u+x " + " ".join(shlex.quote(f"{dst_dir}/{path}") for path in changed)])
+        return local_checksums
+
+    def prepare_snpe(self) -> dict:
+        """
+        Push the SNPE SDK to the device, once per session. Returns the environment variables for running SNPE.
+        """
+        if self.snpe_env is not None:
+            if self._snpe_sentinel is None:
+                return self.snpe_env
+            remote_path, checksum = self._snpe_sentinel
+            if self.get_remote_checksum(remote_path) == checksum:
+                return self.snpe_env
+            # the device was rebooted or wiped since the sdk was pushed
+            logger.debug(f"SNPE SDK on Android target {self.android_target} changed. Pushing it again.")
+            self.rooted = False
+            self.snpe_env = None
+
+        self.root()
+        self._snpe_sentinel = None
+        snpe_dirs = get_snpe_adb_dirs()
+        for src, dst, executable in [
+            (snpe_dirs["bin_dir"], snpe_dirs["adb_bin_dir"], True),
+            (snpe_dirs["lib_dir"], snpe_dirs["adb_lib_dir"], False),
+            (snpe_dirs["dsp_lib_dir"], snpe_dirs["adb_dsp_lib_dir"], False),
+        ]:
+            checksums = self.sync_dir(src, dst, executable)
+            if dst == snpe_dirs["adb_bin_dir"] and checksums:
+                path, checksum = next(iter(checksums.items()))
+                self._snpe_sentinel = (f"{dst}/{path}", checksum)
+        self.snpe_env = get_snpe_adb_env(self.android_target, push_snpe=False)
+        return self.snpe_env
+
+
+def get_snpe_adb_dirs() -> Dict[str, str]:
+    """
+    Get the local SNPE SDK directories for android and their paths on the target Android device.
     """
     # get snpe android root
     snpe_android_root = get_snpe_android_root()
@@ -134,32 +303,38 @@ def get_snpe_adb_env(android_target: str, push_snpe: bool = True) -> dict:
     # get android arch name
     android_arch = get_snpe_android_arch(snpe_android_root)
 
-    # snpe dirs
-    bin_dir = f"{snpe_android_root}/bin/{android_arch}"
-    lib_dir = f"{snpe_android_root}/lib/{android_arch}"
-    dsp_lib_dir = f"{snpe_android_root}/lib/dsp"
-
     # abd snpe dirs
     adb_snpe_root = f"/data/local/tmp/olive-snpe/{android_arch}"
-    adb_bin_dir = f"{adb_snpe_root}/bin"
-    adb_lib_dir = f"{adb_snpe_root}/lib"
-    adb_dsp_lib_dir = f"{adb_snpe_root}/dsp"
+    return {
+        "bin_dir": f"{snpe_android_root}/bin/{android_arch}",
+        "lib_dir": f"{snpe_android_root}/lib/{android_arch}",
+        "dsp_lib_dir": f"{snpe_android_root}/lib/dsp",
+        "adb_bin_dir": f"{adb_snpe_root}/bin",
+        "adb_lib_dir": f"{adb_snpe_root}/lib",
+        "adb_dsp_lib_dir": f"{adb_snpe_root}/dsp",
+    }
+
 
+def get_snpe_adb_env(android_target: str, push_snpe: bool = True) -> dict:
+    """
+    Get the environment variables for running SNPE on the target Android device.
+
+    android_target: The target Android device
+    push_snpe: Whether to push the SNPE SDK to the target Android device. The SDK is only pushed once per session,
+        see AdbDeviceSession.
+    """
     if push_snpe:
-        # push snpe dirs to android target
-        push_pairs = [(bin_dir, adb_bin_dir), (lib_dir, adb_lib_dir), (dsp_lib_dir, adb_dsp_lib_dir)]
-        for src, dst in push_pairs:
-            adb_push(src, dst, android_target, clean=True)
+        return AdbDeviceSession.get(android_target).prepare_snpe()
 
-        # change permissions for executables
-        for file in Path(bin_dir).iterdir():
-            run_adb_command(f"chmod u+x {adb_bin_dir}/{file.name}", android_target, shell_cmd=True)
+    snpe_dirs = get_snpe_adb_dirs()
 
     # environment variables
     env = {
-        "LD_LIBRARY_PATH": f"$LD_LIBRARY_PATH:{adb_lib_dir}",
-        "PATH": f"$PATH:{adb_bin_dir}",
-        "ADSP_LIBRARY_PATH": f"'{adb_dsp_lib_dir};/system/lib/rfsa/adsp;/system/vendor/lib/rfsa/adsp;/dsp'",
+        "LD_LIBRARY_PATH": f"$LD_LIBRARY_PATH:{snpe_dirs['adb_lib_dir']}",
+        "PATH": f"$PATH:{snpe_dirs['adb_bin_dir']}",
+        "ADSP_LIBRARY_PATH": (
+            f"'{snpe_dirs['adb_dsp_lib_dir']};/system/lib/rfsa/adsp;/system/vendor/lib/rfsa/adsp;/dsp'"
+        ),
     }
 
     return env
@@ -2,6 +2,17 @@ from pathlib import Path
 from typing import List, Union
 
 
+def check_input_line(inputs: list):
+    """
+    Check the inputs of a line of an input list file. Raises a ValueError if the line is invalid.
+    """
+    if len(inputs) > 1 and not all([":=" in x for x in inputs]):
+        raise ValueError(
+            "Invalid input list. For multiple inputs, input lines must be of the form:"
+            " <input_layer_name>:=<input_layer_path>[<space><input_layer_name>:=<input_layer_path>]"
+        )
+
+
 def resolve_input_list(
     data_dir: str,
     input_list_file: str,
@@ -32,11 +43,7 @@ def resolve_input_list(
 
             # split the line into inputs
             inputs = line.strip().split(" ")
-            if len(inputs) > 1 and not all([":=" in x for x in inputs]):
-                raise ValueError(
-                    "Invalid input list. For multiple inputs, input lines must be of the form:"
-                    " <input_layer_name>:=<input_layer_path>[<space><input_layer_name>:=<input_layer_path>]"
-                )
+            check_input_line(inputs)
             # line to write to the resolved input list
             inputs_line = ""
             for input in inputs:
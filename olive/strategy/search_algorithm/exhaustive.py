@@ -4,6 +4,7 @@
 # --------------------------------------------------------------------------
 from typing import Any, Dict
 
+from olive.common.utils import hash_dict
 from olive.strategy.search_algorithm.search_algorithm import SearchAlgorithm
 
 
@@ -23,15 +24,22 @@ class ExhaustiveSearchAlgorithm(SearchAlgorithm):
         Initialize the searcher.
         """
         self._iterator = self._search_space.iterate()
+        # hashes of the suggested warm start points
+        self._warm_started_hashes = set()
 
     def suggest(self) -> Dict[str, Dict[str, Any]]:
         """
         Suggest a new configuration to try.
         """
-        try:
-            return next(self._iterator)
-        except StopIteration:
-            return None
+        # the warm start points are suggested first and skipped in the grid
+        if self._warm_start_points:
+            search_point = self._warm_start_points.pop(0)
+            self._warm_started_hashes.add(hash_dict(search_point))
+            return search_point
+        for search_point in self._iterator:
+            if hash_dict(search_point) not in self._warm_started_hashes:
+                return search_point
+        return None
 
     def report(self, search_point: Dict[str, Dict[str, Any]], result: Dict[str, Any], should_prune: bool = False):
         """
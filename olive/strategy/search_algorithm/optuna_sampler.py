@@ -2,8 +2,11 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 # --------------------------------------------------------------------------
+import logging
+import os
+import socket
 from abc import abstractmethod
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import optuna
 
@@ -11,11 +14,37 @@ from olive.common.config_utils import ConfigParam
 from olive.common.utils import hash_dict
 from olive.evaluator.metric import MetricResult
 from olive.strategy.search_algorithm.search_algorithm import SearchAlgorithm
-from olive.strategy.search_parameter import Categorical, Conditional, SpecialParamValue
+from olive.strategy.search_parameter import Categorical, Conditional, SearchParameter, SpecialParamValue
+
+logger = logging.getLogger(__name__)
 
 optuna.logging.set_verbosity(optuna.logging.WARNING)
 
 
+def _is_process_alive(pid: Optional[int]) -> bool:
+    if pid is None:
+        return False
+    if pid == os.getpid():
+        # trials of this process are only left running if the process restarted the search
+        return False
+    try:
+        import psutil
+
+        return psutil.pid_exists(pid)
+    except ImportError:
+        pass
+    if os.name == "nt":
+        # cannot check without psutil, assume the process is alive
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
 class OptunaSearchAlgorithm(SearchAlgorithm):
     """
     Optuna sampler for search algorithms.
@@ -28,6 +57,23 @@ class OptunaSearchAlgorithm(SearchAlgorithm):
         return {
             "num_samples": ConfigParam(type_=int, default_value=1, description="Number of samples to suggest."),
             "seed": ConfigParam(type_=int, default_value=1, description="Seed for the rng."),
+            "storage": ConfigParam(
+                type_=str,
+                default_value=None,
+                description=(
+                    "Storage to persist the study in so that the search can be resumed or shared by several"
+                    " processes. Either a database URL such as 'sqlite:///study.db' or the path to a journal file."
+                    " The study is kept in memory if not provided."
+                ),
+            ),
+            "study_name": ConfigParam(
+                type_=str,
+                default_value=None,
+                description=(
+                    "Name of the study in the storage. Defaults to a name derived from the search id, the search"
+                    " space and the objectives."
+                ),
+            ),
         }
 
     def initialize(self):
@@ -36,14 +82,85 @@ class OptunaSearchAlgorithm(SearchAlgorithm):
         """
         self._sampler = self._create_sampler()
         directions = ["maximize" if higher_is_better else "minimize" for higher_is_better in self._higher_is_betters]
-        self._study = optuna.create_study(directions=directions, sampler=self._sampler)
+        storage = self._create_storage()
+        self._study = optuna.create_study(
+            directions=directions,
+            sampler=self._sampler,
+            storage=storage,
+            study_name=self._get_study_name() if storage else None,
+            load_if_exists=True,
+        )
+        if storage:
+            logger.info(
+                f"Using study {self._study.study_name} with {len(self._study.trials)} trials in {self._config.storage}"
+            )
+            self._retry_orphaned_trials()
         self._trial_ids = {}
-        self._num_samples_suggested = 0
+        # completed trials of this host in the persisted study, suggested again so that the resumed search has the
+        # results of all its trials. Their runs and evaluations are loaded from the cache.
+        self._replay_points = []
+        if storage:
+            hostname = socket.gethostname()
+            for trial in self._study.get_trials(deepcopy=False, states=(optuna.trial.TrialState.COMPLETE,)):
+                if (trial.user_attrs.get("owner") or {}).get("hostname") == hostname:
+                    self._replay_points.append(self._params_to_search_point(trial.params))
+
+    def _create_storage(self) -> Optional[optuna.storages.BaseStorage]:
+        """
+        Create the storage of the study from the storage config.
+        """
+        if not self._config.storage:
+            return None
+        if "://" in self._config.storage:
+            return optuna.storages.RDBStorage(self._config.storage)
+        # journal file storage, the backend was renamed in optuna 4.0
+        if hasattr(optuna.storages, "journal") and hasattr(optuna.storages.journal, "JournalFileBackend"):
+            backend = optuna.storages.journal.JournalFileBackend(self._config.storage)
+        else:
+            backend = optuna.storages.JournalFileStorage(self._config.storage)
+        return optuna.storages.JournalStorage(backend)
+
+    def _get_study_name(self) -> str:
+        if self._config.study_name:
+            return self._config.study_name
+        return "olive_" + hash_dict(
+            {
+                "search_id": self._search_id,
+                "search_space": {
+                    f"{space_name}___{param_name}": repr(param)
+                    for space_name, param_name, param in self._search_space.iter_params()
+                },
+                "objectives": self._objectives,
+                "higher_is_betters": self._higher_is_betters,
+            }
+        )
+
+    def _retry_orphaned_trials(self):
+        """
+        Retry the trials left running by searches on this host that did not finish, such as a crashed search.
+        """
+        hostname = socket.gethostname()
+        for trial in self._study.get_trials(deepcopy=False, states=(optuna.trial.TrialState.RUNNING,)):
+            owner = trial.user_attrs.get("owner") or {}
+            if owner.get("hostname") != hostname or _is_process_alive(owner.get("pid")):
+                continue
+            logger.debug(f"Retrying trial {trial.number} of a search that did not finish")
+            self._study.tell(trial.number, state=optuna.trial.TrialState.FAIL)
+            self._study.enqueue_trial(trial.params)
+
+    @property
+    def _num_samples_suggested(self) -> int:
+        # count the trials of the study so that the samples of resumed or shared searches are included
+        states = (optuna.trial.TrialState.COMPLETE, optuna.trial.TrialState.PRUNED, optuna.trial.TrialState.RUNNING)
+        return sum(
+            not trial.user_attrs.get("invalid") for trial in self._study.get_trials(deepcopy=False, states=states)
+        )
 
     def should_stop(self):
+        num_samples_suggested = self._num_samples_suggested
         should_stop = (
-            (self._search_space.empty() and self._num_samples_suggested > 0)
-            or (self._num_samples_suggested >= self._config.num_samples)
+            (self._search_space.empty() and num_samples_suggested > 0)
+            or (num_samples_suggested >= self._config.num_samples)
             or super().should_stop()
         )
         return should_stop
@@ -59,11 +176,16 @@ class OptunaSearchAlgorithm(SearchAlgorithm):
         """
         Suggest a new configuration to try.
         """
+        if self._replay_points:
+            return self._replay_points.pop(0)
+
         if self.should_stop():
             return None
 
         trial, search_point, invalid = self._get_trial()
         if invalid:
+            # invalid trials are not counted as samples
+            trial.set_user_attr("invalid", True)
             self._study.tell(trial.number, state=optuna.trial.TrialState.PRUNED)
             return self.suggest()
 
@@ -71,8 +193,42 @@ class OptunaSearchAlgorithm(SearchAlgorithm):
         search_point_hash = hash_dict(search_point)
         self._trial_ids[search_point_hash] = trial.number
 
-        self._num_samples_suggested += 1
+        return search_point
+
+    def warm_start(self, search_points: List[Dict[str, Dict[str, Any]]]):
+        """
+        Enqueue the search points so that they are the first trials of the study.
+        """
+        super().warm_start(search_points)
+        for search_point in self._warm_start_points:
+            params = {}
+            for space_name, param_name, param in self._search_space.iter_params():
+                suggestion_name = self._get_suggestion_name(space_name, param_name, param, search_point)
+                params[suggestion_name] = search_point[space_name][param_name]
+            self._study.enqueue_trial(params, skip_if_exists=True)
+        self._warm_start_points = []
 
+    @staticmethod
+    def _get_suggestion_name(
+        space_name: str, param_name: str, param: SearchParameter, search_point: Dict[str, Dict[str, Any]]
+    ) -> str:
+        """
+        Get the name of the parameter in the optuna trial.
+        """
+        if isinstance(param, Conditional):
+            parent_vals = {parent: search_point[space_name][parent] for parent in param.parents}
+            parent_vals_name = "_".join([f"{v}" for _, v in parent_vals.items()])
+            return f"{space_name}___{param_name}___{parent_vals_name}"
+        return f"{space_name}___{param_name}"
+
+    def _params_to_search_point(self, params: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the search point of the params of a trial.
+        """
+        search_point = self._search_space.empty_search_point()
+        for space_name, param_name, param in self._search_space.iter_params():
+            suggestion_name = self._get_suggestion_name(space_name, param_name, param, search_point)
+            search_point[space_name][param_name] = params[suggestion_name]
         return search_point
 
     def _get_trial(self) -> Tuple[optuna.trial.Trial, Dict[str, Dict[str, Any]]]:
@@ -80,19 +236,19 @@ class OptunaSearchAlgorithm(SearchAlgorithm):
         Get a trial from the study.
         """
         trial = self._study.ask()
+        # owner of the trial to find the trials left running by a search that did not finish
+        trial.set_user_attr("owner", {"hostname": socket.gethostname(), "pid": os.getpid()})
         search_point = self._search_space.empty_search_point()
         invalid_trial = False
         for space_name, param_name, param in self._search_space.iter_params():
             if space_name not in search_point:
                 search_point[space_name] = {}
-            suggestion_name = f"{space_name}___{param_name}"
+            suggestion_name = self._get_suggestion_name(space_name, param_name, param, search_point)
             if isinstance(param, Categorical):
                 search_point[space_name][param_name] = trial.suggest_categorical(suggestion_name, param.get_support())
             elif isinstance(param, Conditional):
                 parent_vals = {parent: search_point[space_name][parent] for parent in param.parents}
                 options = param.get_support(parent_vals)
-                parent_vals_name = "_".join([f"{v}" for _, v in parent_vals.items()])
-                suggestion_name = f"{space_name}___{param_name}___{parent_vals_name}"
                 search_point[space_name][param_name] = trial.suggest_categorical(suggestion_name, options)
             else:
                 raise ValueError(f"Unsupported parameter type: {type(param)}")
@@ -101,7 +257,10 @@ class OptunaSearchAlgorithm(SearchAlgorithm):
 
     def report(self, search_point: Dict[str, Dict[str, Any]], result: MetricResult, should_prune: bool = False):
         search_point_hash = hash_dict(search_point)
-        trial_id = self._trial_ids[search_point_hash]
+        trial_id = self._trial_ids.get(search_point_hash)
+        if trial_id is None:
+            # replayed trial of a resumed study, the result is already in the study
+            return
         if should_prune:
             self._study.tell(trial_id, state=optuna.trial.TrialState.PRUNED)
         else:
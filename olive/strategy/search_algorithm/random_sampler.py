@@ -47,7 +47,11 @@ class RandomSearchAlgorithm(SearchAlgorithm):
         if self.should_stop():
             return None
 
-        if self._config.with_replacement:
+        if self._warm_start_points:
+            search_point = self._warm_start_points.pop(0)
+            if not self._config.with_replacement and search_point in self._options:
+                self._options.remove(search_point)
+        elif self._config.with_replacement:
             # sample a randrom point from the search space with replacement
             search_point = self._search_space.random_sample()
         else:
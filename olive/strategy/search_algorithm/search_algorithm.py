@@ -30,6 +30,7 @@ class SearchAlgorithm(AutoConfigClass):
         objectives: Optional[List[str]] = None,
         higher_is_betters: Optional[List[bool]] = None,
         config: Optional[Union[Dict[str, Any], ConfigBase]] = None,
+        search_id: Optional[str] = None,
     ):
         # search space
         self._search_space = SearchSpace(search_space)
@@ -43,9 +44,14 @@ class SearchAlgorithm(AutoConfigClass):
         self._objectives = objectives
         self._higher_is_betters = higher_is_betters
 
+        # identifies the search, used to find the persisted state of the search
+        self._search_id = search_id
+
         super().__init__(config)
         # TODO: Stop using _ private methods like _objectives, _config, etc
         self._config = self.config
+        # search points to suggest first
+        self._warm_start_points = []
         self.initialize()
 
     @abstractmethod
@@ -55,6 +61,17 @@ class SearchAlgorithm(AutoConfigClass):
         """
         pass
 
+    def warm_start(self, search_points: List[Dict[str, Dict[str, Any]]]):
+        """
+        Seed the searcher with search points to suggest first, such as the best points of a previous search.
+
+        Search points that are not in the search space are ignored.
+        """
+        self._warm_start_points = []
+        for search_point in search_points:
+            if self._search_space.contains(search_point) and search_point not in self._warm_start_points:
+                self._warm_start_points.append(search_point)
+
     def should_stop(self):
         """
         Check if the searcher should prune the current trial.
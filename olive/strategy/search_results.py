@@ -113,6 +113,9 @@ class SearchResults:
             result = self.results[search_point_hash]
             if not result:
                 continue
+            if result.get_early_stopped_metrics():
+                # the metrics of an early stopped evaluation are computed on part of the data
+                continue
             if apply_goals and not self.check_goals(result):
                 continue
             search_point_hashes.append(search_point_hash)
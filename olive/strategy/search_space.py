@@ -117,6 +117,26 @@ class SearchSpace:
             size += 1
         return size
 
+    def contains(self, search_point: Dict[str, Dict[str, Any]]) -> bool:
+        """
+        Check if the search point is a valid point in the search space.
+        """
+        if set(search_point.keys()) != set(self._search_space.keys()):
+            return False
+        for space_name, param_name in self._iter_order:
+            if param_name not in search_point[space_name]:
+                return False
+            param = self._search_space[space_name][param_name]
+            if isinstance(param, Conditional):
+                parent_vals = {parent: search_point[space_name][parent] for parent in param.parents}
+                options = param.get_support(parent_vals)
+            elif isinstance(param, Categorical):
+                options = param.get_support()
+            value = search_point[space_name][param_name]
+            if value == SpecialParamValue.INVALID or value not in options:
+                return False
+        return True
+
     def empty_search_point(self) -> Dict[str, Dict[str, Any]]:
         """
         Get an empty search point.
@@ -3,13 +3,16 @@
 # Licensed under the MIT License.
 # --------------------------------------------------------------------------
 import logging
+import math
 from abc import ABC
 from copy import deepcopy
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 from pydantic import validator
 
 from olive.common.config_utils import ConfigBase, validate_config
+from olive.data.subset import DataSubsetConfig
 from olive.evaluator.metric import MetricResult
 from olive.strategy.search_algorithm import REGISTRY, SearchAlgorithm
 from olive.strategy.search_parameter import SearchParameter
@@ -20,6 +23,40 @@ logger = logging.getLogger(__name__)
 _VALID_EXECUTION_ORDERS = ["joint", "pass-by-pass"]
 
 
+class SuccessiveHalvingConfig(ConfigBase):
+    # fraction of the evaluation data used to evaluate all candidates in the first rung
+    min_fraction: float = 0.1
+    # only the best 1 / reduction_factor candidates of a rung are promoted to the next rung, which uses
+    # reduction_factor times more evaluation data. The last rung uses the full evaluation data.
+    reduction_factor: int = 3
+    # strategy to select the evaluation data subset. Refer to DataSubsetConfig for the options.
+    subset_strategy: str = "prefix"
+
+    @validator("min_fraction")
+    def _validate_min_fraction(cls, v):
+        if not 0 < v <= 1:
+            raise ValueError(f"min_fraction must be in (0, 1], got {v}")
+        return v
+
+    @validator("reduction_factor")
+    def _validate_reduction_factor(cls, v):
+        if v < 2:
+            raise ValueError(f"reduction_factor must be at least 2, got {v}")
+        return v
+
+    def get_rung_subsets(self) -> List[Optional[DataSubsetConfig]]:
+        """
+        Get the evaluation data subset of each rung. The last rung uses the full data, its subset is None.
+        """
+        subsets = []
+        fraction = self.min_fraction
+        while fraction < 1:
+            subsets.append(DataSubsetConfig(fraction=fraction, strategy=self.subset_strategy))
+            fraction *= self.reduction_factor
+        subsets.append(None)
+        return subsets
+
+
 class SearchStrategyConfig(ConfigBase):
     execution_order: str
     search_algorithm: str
@@ -28,6 +65,10 @@ class SearchStrategyConfig(ConfigBase):
     stop_when_goals_met: bool = False
     max_iter: int = None
     max_time: int = None
+    # evaluate the candidates on subsets of the evaluation data with successive halving
+    successive_halving: SuccessiveHalvingConfig = None
+    # footprint json files of previous runs. The search points of their candidates are suggested first, best first
+    warm_start_footprints: List[Union[str, Path]] = None
 
     @validator("execution_order", pre=True)
     def _validate_execution_order(cls, v):
@@ -49,7 +90,9 @@ class SearchStrategyConfig(ConfigBase):
         config_class = REGISTRY[values["search_algorithm"]].get_config_class()
         return validate_config(v, ConfigBase, config_class)
 
-    @validator("stop_when_goals_met", "max_iter", "max_time", pre=True)
+    @validator(
+        "stop_when_goals_met", "max_iter", "max_time", "successive_halving", "warm_start_footprints", pre=True
+    )
     def _validate_stop_when_goals_met(cls, v, values, field):
         if "execution_order" not in values:
             raise ValueError("Invalid execution_order")
@@ -98,6 +141,17 @@ class SearchStrategy(ABC):
         self._init_model_ids: Dict[Any, str] = {}
         self._best_search_points = {}
 
+        # successive halving state of the active search group
+        self._rung_subsets = (
+            self._config.successive_halving.get_rung_subsets() if self._config.successive_halving else [None]
+        )
+        # search points waiting to be evaluated in a higher rung, list of (rung, search_point)
+        self._promotion_queue: List[Tuple[int, Dict[str, Any]]] = []
+        # results of the candidates in each rung that is not the last rung
+        self._rung_results: Dict[int, SearchResults] = {}
+        # rung of the last step
+        self._active_rung = 0
+
         # initialize the first search space
         self._next_search_group(init_model_id)
 
@@ -161,27 +215,94 @@ class SearchStrategy(ABC):
             )
 
         self._active_spaces_group = self._spaces_groups.pop(0)
-        self._searchers[tuple(self._active_spaces_group)] = self._create_searcher(self._active_spaces_group)
+        self._promotion_queue = []
+        self._rung_results = {}
+        self._searchers[tuple(self._active_spaces_group)] = self._create_searcher(
+            self._active_spaces_group, init_model_id
+        )
+        if self._config.warm_start_footprints:
+            warm_start_points = self._get_warm_start_points(self._active_spaces_group)
+            logger.info(f"Warm starting the search with {len(warm_start_points)} search points of previous runs")
+            self._searchers[tuple(self._active_spaces_group)].warm_start(warm_start_points)
         self._search_results[tuple(self._active_spaces_group)] = SearchResults(self._objective_dict)
         self._init_model_ids[tuple(self._active_spaces_group)] = init_model_id
 
         return self._active_spaces_group
 
-    def _create_searcher(self, search_space_names: List[str]) -> SearchAlgorithm:
+    def _create_searcher(self, search_space_names: List[str], init_model_id: str) -> SearchAlgorithm:
         """
         Create a search algorithm.
+
+        The search is identified by the input model and the search spaces so that persisted searches can be resumed.
         """
         search_spaces_dict = {space_name: deepcopy(self._spaces_dict[space_name]) for space_name in search_space_names}
         objectives = list(self._objective_dict.keys())
         higher_is_betters = [self._objective_dict[objective]["higher_is_better"] for objective in objectives]
         if self._config.search_algorithm in REGISTRY:
             searcher = REGISTRY[self._config.search_algorithm](
-                search_spaces_dict, objectives, higher_is_betters, self._config.search_algorithm_config
+                search_spaces_dict,
+                objectives,
+                higher_is_betters,
+                self._config.search_algorithm_config,
+                search_id=f"{init_model_id}_{'-'.join(search_space_names)}",
             )
         else:
             raise ValueError(f"Unknown search algorithm: {self._config.search_algorithm}")
         return searcher
 
+    def _get_warm_start_points(self, search_space_names: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get the search points of the evaluated candidates in the warm start footprints, ranked by their results.
+
+        A candidate matches if it was created by one pass per search space and its pass configs contain all the
+        search parameters. Candidates whose results do not include all the objectives are ranked last.
+        """
+        # olive.engine imports this module
+        from olive.engine.footprint import Footprint
+
+        search_results = SearchResults(self._objective_dict)
+        unranked_points = []
+        for footprint_path in self._config.warm_start_footprints:
+            nodes = Footprint.from_file(footprint_path).nodes
+            for node in nodes.values():
+                result = node.metrics.value if node.metrics else None
+                if not result:
+                    continue
+
+                # the chain of pass runs from the input model to the candidate
+                chain = [node]
+                while chain[0].from_pass and chain[0].parent_model_id in nodes:
+                    chain.insert(0, nodes[chain[0].parent_model_id])
+                chain = [n for n in chain if n.from_pass]
+                if len(chain) != len(search_space_names):
+                    continue
+
+                search_point = {}
+                for space_name, pass_node in zip(search_space_names, chain):
+                    pass_config = pass_node.pass_run_config or {}
+                    param_names = self._spaces_dict[space_name].keys()
+                    if not all(param_name in pass_config for param_name in param_names):
+                        break
+                    search_point[space_name] = {param_name: pass_config[param_name] for param_name in param_names}
+                else:
+                    if all(objective in result.__root__ for objective in self._objective_dict):
+                        search_results.record(search_point, result, [n.model_id for n in chain])
+                    else:
+                        unranked_points.append(search_point)
+
+        ranked_points = self._rank_search_points(search_results)
+        return ranked_points + [p for p in unranked_points if p not in ranked_points]
+
+    @staticmethod
+    def _rank_search_points(search_results: SearchResults) -> List[Dict[str, Any]]:
+        """
+        Rank the search points of the results, the ones that meet the goals first.
+        """
+        _, goal_met_points, _ = search_results.sort_search_points(apply_goals=True)
+        _, all_points, _ = search_results.sort_search_points(apply_goals=False)
+        goal_met_points = goal_met_points or []
+        return goal_met_points + [p for p in all_points or [] if p not in goal_met_points]
+
     def next_step(self) -> Optional[Dict[str, Any]]:
         """
         Get the next step in the search
@@ -196,19 +317,49 @@ class SearchStrategy(ABC):
         if self._active_spaces_group is None:
             return None
 
-        # get the next search point from the active searcher
-        search_point = self._searchers[tuple(self._active_spaces_group)].suggest()
-        # if there are no more search points, move to the next search space group
-        if search_point is None:
-            self._next_search_group()
-            return self.next_step()
+        if self._promotion_queue:
+            # evaluate a promoted search point in the next rung
+            self._active_rung, search_point = self._promotion_queue.pop(0)
+        else:
+            # get the next search point from the active searcher
+            self._active_rung = 0
+            search_point = self._searchers[tuple(self._active_spaces_group)].suggest()
+            # if there are no more search points, promote the best ones to the next rung or
+            # move to the next search space group
+            if search_point is None:
+                if not self._promote():
+                    self._next_search_group()
+                return self.next_step()
 
         return {
             "search_point": search_point,
             "model_id": self._init_model_ids[tuple(self._active_spaces_group)],
             "passes": [(space_name, search_point[space_name]) for space_name in self._active_spaces_group],
+            "subset": self._rung_subsets[self._active_rung],
         }
 
+    def _is_last_rung(self) -> bool:
+        return self._active_rung == len(self._rung_subsets) - 1
+
+    def _promote(self) -> bool:
+        """
+        Promote the best search points of the highest finished rung to the next rung.
+
+        Returns True if any search point is promoted.
+        """
+        # rungs are evaluated one after the other, so only the highest rung can have unpromoted results
+        if not self._rung_results:
+            return False
+        rung = max(self._rung_results)
+        rung_results = self._rung_results.pop(rung)
+
+        ranked_points = self._rank_search_points(rung_results)
+
+        num_promoted = math.ceil(len(ranked_points) / self._config.successive_halving.reduction_factor)
+        self._promotion_queue = [(rung + 1, search_point) for search_point in ranked_points[:num_promoted]]
+        logger.info(f"Promoting {len(self._promotion_queue)} of {len(ranked_points)} candidates to rung {rung + 1}")
+        return len(self._promotion_queue) > 0
+
     def record_feedback_signal(
         self,
         search_point: Dict[str, Dict[str, Any]],
@@ -221,8 +372,14 @@ class SearchStrategy(ABC):
         """
         if not self._initialized:
             raise ValueError("Search strategy is not initialized")
-        self._search_results[tuple(self._active_spaces_group)].record(search_point, signal, model_ids)
-        self._searchers[tuple(self._active_spaces_group)].report(search_point, signal, should_prune)
+        if self._active_rung == 0:
+            # the searcher only sees the first evaluation of each search point
+            self._searchers[tuple(self._active_spaces_group)].report(search_point, signal, should_prune)
+        if self._is_last_rung():
+            self._search_results[tuple(self._active_spaces_group)].record(search_point, signal, model_ids)
+        else:
+            rung_results = self._rung_results.setdefault(self._active_rung, SearchResults(self._objective_dict))
+            rung_results.record(search_point, signal, model_ids)
 
     def check_exit_criteria(self, iter_num, time_diff, metric_signal):
         """
@@ -243,6 +400,9 @@ class SearchStrategy(ABC):
             return
         if metric_signal == {}:
             return
+        # the signal of a data subset is not reliable enough to stop the search
+        if not self._is_last_rung():
+            return
         self.exit_criteria_met = self._config.stop_when_goals_met and self._search_results[
             tuple(self._active_spaces_group)
         ].check_goals(metric_signal)
@@ -13,12 +13,12 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 from azure.ai.ml import Input, Output, command
 from azure.ai.ml.constants import AssetTypes
 from azure.ai.ml.dsl import pipeline
-from azure.ai.ml.entities import BuildContext, Environment, Model
-from azure.core.exceptions import HttpResponseError, ServiceResponseError
+from azure.ai.ml.entities import BuildContext, Data, Environment, Model
+from azure.core.exceptions import HttpResponseError, ResourceNotFoundError, ServiceResponseError
 
 from olive.azureml.azureml_client import AzureMLClientConfig
 from olive.common.config_utils import validate_config
-from olive.common.utils import retry_func
+from olive.common.utils import FileHashMemo, hash_path_content, hash_string, retry_func
 from olive.constants import Framework
 from olive.evaluator.metric import Metric, MetricResult
 from olive.hardware.accelerator import AcceleratorSpec
@@ -82,6 +82,9 @@ class AzureMLSystem(OliveSystem):
         self.environment = self._create_environment(aml_docker_config)
         self.instance_count = instance_count
         self.is_dev = is_dev
+        # data assets registered for local inputs, keyed by asset type and content hash
+        self._registered_inputs: Dict[Tuple[str, str], str] = {}
+        self._file_hash_memo = FileHashMemo()
 
     def _create_environment(self, docker_config: AzureMLDockerConfig):
         if docker_config.build_context_path:
@@ -202,21 +205,69 @@ class AzureMLSystem(OliveSystem):
                     }
                 )
             )
+        if model_resource_path.type in LOCAL_RESOURCE_TYPES:
+            return self._create_local_input(asset_type, model_resource_path.get_path())
+
         # we keep the model path as a string in the config file
         if model_resource_path.type != ResourceType.StringName:
             return Input(type=asset_type, path=model_resource_path.get_path())
 
         return None
 
+    def _create_local_input(self, asset_type: str, path: Union[str, Path]) -> Input:
+        """
+        Create the input for a local file or folder.
+
+        The local input is registered as a data asset versioned by the hash of its content, and of its name for a file,
+        so that it is only uploaded once.
+        Later inputs with the same content, for instance the same model in every pass and evaluation of a search, reuse
+        the registered asset.
+        """
+        if not Path(path).exists():
+            # not a local path, let aml resolve it
+            return Input(type=asset_type, path=path)
+
+        version = hash_path_content(path, self._file_hash_memo)
+        if asset_type == AssetTypes.URI_FILE:
+            # the job sees the file by its name, e.g. user scripts are imported by name
+            version = hash_string(f"{Path(path).name}:{version}")
+        key = (asset_type, version)
+        if key not in self._registered_inputs:
+            ml_client = self.azureml_client_config.create_client()
+            name = f"olive-backend-{asset_type.replace('_', '-')}"
+            try:
+                # the asset might have been registered by a previous run
+                data = ml_client.data.get(name=name, version=key[1])
+                logger.debug(f"Reusing data asset {name}:{key[1]} for {path}")
+            except ResourceNotFoundError:
+                logger.debug(f"Creating data asset {name}:{key[1]} for {path}")
+                data = retry_func(
+                    ml_client.data.create_or_update,
+                    [
+                        Data(
+                            path=str(path),
+                            name=name,
+                            version=key[1],
+                            description="Data created by Olive backend. Ignore this data.",
+                            type=asset_type,
+                        )
+                    ],
+                    max_tries=self.azureml_client_config.max_operation_retries,
+                    delay=self.azureml_client_config.operation_retry_interval,
+                    exceptions=ServiceResponseError,
+                )
+            self._registered_inputs[key] = f"azureml:{data.name}:{data.version}"
+        return Input(type=asset_type, path=self._registered_inputs[key])
+
     def _create_model_args(self, model_json: dict, tmp_dir: Path):
         model_script = None
         if model_json["config"].get("model_script"):
-            model_script = Input(type=AssetTypes.URI_FILE, path=model_json["config"]["model_script"])
+            model_script = self._create_local_input(AssetTypes.URI_FILE, model_json["config"]["model_script"])
             model_json["config"]["model_script"] = None
 
         model_script_dir = None
         if model_json["config"].get("script_dir"):
-            model_script_dir = Input(type=AssetTypes.URI_FOLDER, path=model_json["config"]["script_dir"])
+            model_script_dir = self._create_local_input(AssetTypes.URI_FOLDER, model_json["config"]["script_dir"])
             model_json["config"]["script_dir"] = None
 
         model_path = None
@@ -405,12 +456,12 @@ class AzureMLSystem(OliveSystem):
     def _create_metric_args(self, metric_config: dict, tmp_dir: Path) -> Tuple[List[str], dict]:
         metric_user_script = metric_config["user_config"]["user_script"]
         if metric_user_script:
-            metric_user_script = Input(type=AssetTypes.URI_FILE, path=metric_user_script)
+            metric_user_script = self._create_local_input(AssetTypes.URI_FILE, metric_user_script)
             metric_config["user_config"]["user_script"] = None
 
         metric_script_dir = metric_config["user_config"]["script_dir"]
         if metric_script_dir:
-            metric_script_dir = Input(type=AssetTypes.URI_FOLDER, path=metric_script_dir)
+            metric_script_dir = self._create_local_input(AssetTypes.URI_FOLDER, metric_script_dir)
             metric_config["user_config"]["script_dir"] = None
 
         metric_data_dir = metric_config["user_config"]["data_dir"]
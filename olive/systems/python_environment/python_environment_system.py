@@ -86,6 +86,10 @@ class PythonEnvironmentSystem(OliveSystem):
         # check if custom metric is present
         if any(metric.type == MetricType.CUSTOM for metric in metrics):
             raise ValueError("PythonEnvironmentSystem does not support custom metrics.")
+        if any(metric.type == MetricType.THROUGHPUT for metric in metrics):
+            raise ValueError("PythonEnvironmentSystem does not support throughput metrics.")
+        if any(metric.type == MetricType.MEMORY for metric in metrics):
+            raise ValueError("PythonEnvironmentSystem does not support memory metrics.")
 
         metrics_res = {}
         for original_metric in metrics:
@@ -0,0 +1,96 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------
+import hashlib
+import os
+from unittest.mock import patch
+
+import pytest
+
+from olive.common.utils import FileHashMemo, hash_file_content, hash_path_content
+
+
+def test_hash_file_content(tmp_path):
+    # setup
+    content = os.urandom(3 * 1024 * 1024 + 5)
+    file = tmp_path / "model.onnx.data"
+    file.write_bytes(content)
+
+    # execute
+    # the chunks are smaller than the file so that it is read in several chunks
+    with patch("olive.common.utils.HASH_CHUNK_SIZE", 1024 * 1024):
+        file_hash = hash_file_content(file)
+
+    # assert
+    assert file_hash == hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def test_hash_path_content(tmp_path):
+    # setup
+    model_dir = tmp_path / "model"
+    (model_dir / "weights").mkdir(parents=True)
+    (model_dir / "model.onnx").write_bytes(b"model")
+    (model_dir / "weights" / "weight_0.data").write_bytes(b"weight_0")
+    (model_dir / "weights" / "weight_1.data").write_bytes(b"weight_1")
+
+    # execute
+    dir_hash = hash_path_content(model_dir, max_workers=2)
+    same_dir_hash = hash_path_content(tmp_path / "model" / "weights" / "..")
+    (model_dir / "weights" / "weight_1.data").rename(model_dir / "weight_1.data")
+    moved_dir_hash = hash_path_content(model_dir)
+
+    # assert
+    assert dir_hash == same_dir_hash
+    # the relative paths of the files are part of the hash
+    assert moved_dir_hash != dir_hash
+
+
+def test_file_hash_memo(tmp_path):
+    # setup
+    memo_path = tmp_path / "hashes.json"
+    file = tmp_path / "model.onnx"
+    file.write_bytes(b"model")
+    file_hash = hash_path_content(file, FileHashMemo(memo_path))
+
+    # execute
+    # the memo is loaded from the memo file and the unchanged file is not hashed again
+    memo = FileHashMemo(memo_path)
+    with patch("olive.common.utils.hashlib.blake2b") as mock_blake2b:
+        memo_hash = hash_file_content(file, memo)
+    file.write_bytes(b"modified model")
+    modified_hash = hash_file_content(file, memo)
+
+    # assert
+    mock_blake2b.assert_not_called()
+    assert memo_hash == file_hash
+    assert modified_hash != file_hash
+    assert modified_hash == hash_file_content(file)
+
+
+def test_hash_path_content_missing_path(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        hash_path_content(tmp_path / "missing_model")
+
+
+def test_file_hash_memo_file_changed_while_hashing(tmp_path):
+    # setup
+    file = tmp_path / "model.onnx"
+    file.write_bytes(b"model")
+    memo = FileHashMemo()
+    blake2b_hash = hashlib.blake2b(digest_size=16)
+
+    def hexdigest():
+        # the file is modified after it is read but before its hash is stored
+        file.write_bytes(b"modified model")
+        return blake2b_hash.hexdigest()
+
+    # execute
+    with patch("olive.common.utils.hashlib.blake2b") as mock_blake2b:
+        mock_blake2b.return_value.update.side_effect = blake2b_hash.update
+        mock_blake2b.return_value.hexdigest.side_effect = hexdigest
+        hash_file_content(file, memo)
+
+    # assert
+    # the hash is stored under the file id from before the read, so the modified file is hashed again
+    assert hash_file_content(file, memo) == hash_file_content(file)
@@ -106,3 +106,22 @@ def test_import_user_module_user_script_exception():
     # assert
     user_script_path = Path(user_script).resolve()
     assert str(errinfo.value) == f"{user_script_path} doesn't exist"
+
+
+def test_import_user_module_is_cached(tmp_path):
+    # setup
+    user_script = tmp_path / "cached_user_script.py"
+    user_script.write_text("import random\nvalue = random.random()\n")
+
+    # execute
+    module = import_user_module(user_script)
+
+    # assert
+    assert import_user_module(user_script) is module
+    reloaded_module = import_user_module(user_script, reload=True)
+    assert reloaded_module is not module
+    assert import_user_module(user_script) is reloaded_module
+
+    # modified script is re-imported
+    user_script.write_text("value = 'modified'\n")
+    assert import_user_module(user_script).value == "modified"
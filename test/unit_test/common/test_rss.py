@@ -0,0 +1,34 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------
+import time
+from unittest.mock import patch
+
+import pytest
+
+from olive.common.utils import PeakRSSMonitor, get_current_rss
+
+
+def test_peak_rss_monitor():
+    size = 64 * 1024**2
+
+    # execute
+    with PeakRSSMonitor() as monitor:
+        base_rss = get_current_rss()
+        data = bytearray(size)
+        time.sleep(0.1)
+        del data
+        time.sleep(0.1)
+
+    # assert
+    # the peak is kept after the memory is released
+    assert monitor.peak_rss - base_rss >= size * 0.9
+    assert monitor.peak_rss > get_current_rss()
+
+
+def test_get_current_rss_without_psutil():
+    # /proc is not available and neither is psutil, like on macOS without psutil installed
+    with patch("builtins.open", side_effect=OSError), patch.dict("sys.modules", {"psutil": None}):
+        with pytest.raises(ImportError, match="Please install psutil"):
+            get_current_rss()
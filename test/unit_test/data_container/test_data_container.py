@@ -10,11 +10,30 @@ from test.unit_test.utils import (
     get_glue_huggingface_data_config,
 )
 
+from unittest.mock import patch
+
 import numpy as np
 import pytest
 
-from olive.data.config import DataConfig
+from olive.data.component.dataset import BaseDataset
+from olive.data.config import DataComponentConfig, DataConfig
 from olive.data.container.data_container import DataContainer
+from olive.data.registry import Registry
+from olive.data.subset import DataSubsetConfig
+
+
+@Registry.register_dataset()
+def _test_cache_dataset(num_samples=4):
+    from datasets import Dataset
+
+    return Dataset.from_dict({"input": list(range(num_samples)), "label": [i % 2 for i in range(num_samples)]})
+
+
+@Registry.register_pre_process()
+def _test_cache_pre_process(_dataset, scale=1):
+    dataset = _dataset.map(lambda example: {"input": example["input"] * scale})
+    dataset.set_format("torch", output_all_columns=True)
+    return BaseDataset(dataset, label_cols=["label"])
 
 
 class TestDataConfig:
@@ -88,3 +107,56 @@ class TestDataConfig:
             self.dc.pre_process(dataset)
         except Exception as e:
             pytest.fail(f"Failed to run get pre_process from data config: {e}")
+
+    @pytest.mark.parametrize("scale", [1, 3])
+    def test_pre_process_cache(self, tmpdir, scale):
+        def get_dc(scale):
+            return DataConfig(
+                components={
+                    "load_dataset": DataComponentConfig(type="_test_cache_dataset"),
+                    "pre_process_data": DataComponentConfig(type="_test_cache_pre_process", params={"scale": scale}),
+                },
+                cache_dir=str(tmpdir),
+            ).to_data_container()
+
+        dc = get_dc(scale)
+        dataset = dc.create_pre_processed_dataset()
+        assert len(tmpdir.listdir()) == 1
+
+        # second call is served from the cache without loading the dataset again
+        with patch.object(DataContainer, "load_dataset") as mock_load_dataset:
+            cached_dataset = get_dc(scale).create_pre_processed_dataset()
+            mock_load_dataset.assert_not_called()
+        assert isinstance(cached_dataset, BaseDataset)
+        assert cached_dataset.label_cols == ["label"]
+        assert len(cached_dataset) == len(dataset)
+        for i in range(len(dataset)):
+            data, label = cached_dataset[i]
+            assert data["input"].item() == i * scale
+            assert label.item() == dataset[i][1].item()
+
+        # different params get a different cache entry
+        get_dc(scale + 1).create_pre_processed_dataset()
+        assert len(tmpdir.listdir()) == 2
+
+    @pytest.mark.parametrize(
+        "strategy,expected_inputs",
+        [
+            # first 3 samples of the dataset
+            ("prefix", [0, 1, 2]),
+            # first 2 samples of each label
+            ("stratified", [0, 1, 2, 3]),
+        ],
+    )
+    def test_create_subset_dataloader(self, strategy, expected_inputs):
+        dc = DataConfig(
+            components={
+                "load_dataset": DataComponentConfig(type="_test_cache_dataset", params={"num_samples": 10}),
+                "pre_process_data": DataComponentConfig(type="_test_cache_pre_process"),
+            },
+        ).to_data_container()
+
+        dataloader = dc.create_dataloader(DataSubsetConfig(fraction=0.25, strategy=strategy))
+
+        inputs = [data["input"].item() for data, _ in dataloader]
+        assert inputs == expected_inputs
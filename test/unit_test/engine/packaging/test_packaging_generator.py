@@ -6,11 +6,15 @@ import tempfile
 import zipfile
 from pathlib import Path
 from test.unit_test.utils import get_accuracy_metric, get_pytorch_model
+from unittest.mock import patch
+
+import onnxruntime
+import pytest
 
 from olive.engine import Engine
-from olive.engine.footprint import Footprint
+from olive.engine.footprint import Footprint, FootprintNode
 from olive.engine.packaging.packaging_config import PackagingConfig, PackagingType
-from olive.engine.packaging.packaging_generator import generate_output_artifacts
+from olive.engine.packaging.packaging_generator import _package_onnxruntime_packages, generate_output_artifacts
 from olive.evaluator.metric import AccuracySubType
 from olive.evaluator.olive_evaluator import OliveEvaluatorConfig
 from olive.hardware import DEFAULT_CPU_ACCELERATOR
@@ -129,3 +133,138 @@ def test_generate_zipfile_artifacts_zero_len_nodes():
     # assert
     artifacts_path = output_dir / "OutputModels.zip"
     assert not artifacts_path.exists()
+
+
+def test_generate_zipfile_artifacts_streams_model_files(tmp_path):
+    # setup
+    model_file = tmp_path / "model_file.onnx"
+    model_file.write_bytes(b"model")
+    model_folder = tmp_path / "model_folder"
+    model_folder.mkdir()
+    (model_folder / "custom.onnx").write_bytes(b"model")
+    (model_folder / "weights.data").write_bytes(b"weights")
+    nodes = {
+        "model_0": FootprintNode(
+            model_id="model_0", model_config={"type": "ONNXModel", "config": {"model_path": str(model_file)}}
+        ),
+        "model_1": FootprintNode(
+            model_id="model_1",
+            model_config={
+                "type": "ONNXModel",
+                "config": {"model_path": str(model_folder), "onnx_file_name": "custom.onnx"},
+            },
+        ),
+    }
+    footprint = Footprint(nodes=nodes)
+    pf_footprint = Footprint(nodes=nodes)
+    output_dir = tmp_path / "outputs"
+
+    # execute
+    with patch("olive.engine.packaging.packaging_generator._package_onnxruntime_packages"):
+        generate_output_artifacts(
+            PackagingConfig(), {DEFAULT_CPU_ACCELERATOR: footprint}, {DEFAULT_CPU_ACCELERATOR: pf_footprint}, output_dir
+        )
+
+    # assert
+    assert [path.name for path in output_dir.iterdir()] == ["OutputModels.zip"]
+    with zipfile.ZipFile(output_dir / "OutputModels.zip", "r") as zip_ref:
+        infos = {info.filename: info for info in zip_ref.infolist()}
+        candidates_dir = f"CandidateModels/{DEFAULT_CPU_ACCELERATOR}"
+        assert zip_ref.read(f"{candidates_dir}/BestCandidateModel_1/model.onnx") == b"model"
+        assert zip_ref.read(f"{candidates_dir}/BestCandidateModel_2/model.onnx") == b"model"
+        assert zip_ref.read(f"{candidates_dir}/BestCandidateModel_2/weights.data") == b"weights"
+        # the model files are stored, the other files are deflated
+        assert infos[f"{candidates_dir}/BestCandidateModel_2/weights.data"].compress_type == zipfile.ZIP_STORED
+        assert infos[f"{candidates_dir}/BestCandidateModel_1/metrics.json"].compress_type == zipfile.ZIP_DEFLATED
+    assert any(name.startswith("SampleCode/") for name in infos)
+    # the source models are left in place
+    assert model_file.exists()
+    assert (model_folder / "weights.data").exists()
+
+
+def test_generate_zipfile_artifacts_zip_file_not_created(tmp_path):
+    # setup
+    model_file = tmp_path / "model_file.onnx"
+    model_file.write_bytes(b"model")
+    nodes = {
+        "model_0": FootprintNode(
+            model_id="model_0", model_config={"type": "ONNXModel", "config": {"model_path": str(model_file)}}
+        ),
+    }
+    footprint = Footprint(nodes=nodes)
+    output_dir = tmp_path / "outputs"
+
+    # execute
+    with patch("olive.engine.packaging.packaging_generator._package_onnxruntime_packages"), patch(
+        "olive.engine.packaging.packaging_generator.zipfile.ZipFile", side_effect=PermissionError("denied")
+    ):
+        # the original error is raised since there is no partial zip file to remove
+        with pytest.raises(PermissionError, match="denied"):
+            generate_output_artifacts(
+                PackagingConfig(),
+                {DEFAULT_CPU_ACCELERATOR: footprint},
+                {DEFAULT_CPU_ACCELERATOR: footprint},
+                output_dir,
+            )
+
+    # assert
+    assert list(output_dir.iterdir()) == []
+
+
+def create_wheel(wheelhouse: Path, name: str, version: str):
+    """
+    Create an empty wheel of the package in the wheelhouse.
+    """
+    dist_info = f"{name}-{version}.dist-info"
+    with zipfile.ZipFile(wheelhouse / f"{name}-{version}-py3-none-any.whl", "w") as wheel:
+        wheel.writestr(f"{dist_info}/METADATA", f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n")
+        wheel.writestr(f"{dist_info}/WHEEL", "Wheel-Version: 1.0\nRoot-Is-Purelib: true\nTag: py3-none-any\n")
+        wheel.writestr(f"{dist_info}/RECORD", "")
+
+
+def test_package_onnxruntime_packages_from_cache(tmp_path):
+    # setup
+    # the cache is pre-populated, standing in for the package indexes
+    ort_version = onnxruntime.__version__
+    cache_dir = tmp_path / "cache"
+    (cache_dir / "Python").mkdir(parents=True)
+    create_wheel(cache_dir / "Python", "onnxruntime", ort_version)
+    (cache_dir / "NuGet").mkdir()
+    (cache_dir / "NuGet" / f"microsoft.ml.onnxruntime.{ort_version}.nupkg").write_bytes(b"nupkg")
+    pf_footprint = Footprint(nodes={"model_0": FootprintNode(model_id="model_0", model_config={"config": {}})})
+    package_dir = tmp_path / "package"
+
+    # execute
+    with patch("urllib.request.urlretrieve", side_effect=AssertionError("no download expected")):
+        _package_onnxruntime_packages(package_dir, pf_footprint, cache_dir)
+
+    # assert
+    packages_dir = package_dir / "ONNXRuntimePackages"
+    assert [path.name for path in (packages_dir / "Python").iterdir()] == [
+        f"onnxruntime-{ort_version}-py3-none-any.whl"
+    ]
+    for language in ["cpp", "cs"]:
+        assert (packages_dir / language / f"microsoft.ml.onnxruntime.{ort_version}.nupkg").read_bytes() == b"nupkg"
+
+
+def test_package_onnxruntime_packages_fills_cache(tmp_path):
+    # setup
+    ort_version = onnxruntime.__version__
+    cache_dir = tmp_path / "cache"
+    (cache_dir / "Python").mkdir(parents=True)
+    create_wheel(cache_dir / "Python", "onnxruntime", ort_version)
+    pf_footprint = Footprint(nodes={"model_0": FootprintNode(model_id="model_0", model_config={"config": {}})})
+
+    # execute
+    with patch("urllib.request.urlretrieve", side_effect=lambda url, path: Path(path).write_bytes(b"nupkg")) as mock:
+        for i in range(2):
+            _package_onnxruntime_packages(tmp_path / f"package_{i}", pf_footprint, cache_dir)
+
+    # assert
+    # the nuget package is downloaded to the cache once and shared by the languages and runs
+    mock.assert_called_once()
+    assert [path.name for path in (cache_dir / "NuGet").iterdir()] == [f"microsoft.ml.onnxruntime.{ort_version}.nupkg"]
+    for i in range(2):
+        for language in ["cpp", "cs"]:
+            nupkg_path = tmp_path / f"package_{i}" / "ONNXRuntimePackages" / language
+            assert (nupkg_path / f"microsoft.ml.onnxruntime.{ort_version}.nupkg").read_bytes() == b"nupkg"
@@ -2,11 +2,13 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 # --------------------------------------------------------------------------
+import inspect
 import json
 import logging
 import tempfile
 from pathlib import Path
 from test.unit_test.utils import (
+    create_dataloader,
     get_accuracy_metric,
     get_onnx_model,
     get_onnxconversion_pass,
@@ -17,12 +19,14 @@ from unittest.mock import patch
 
 import pytest
 
+from olive.cache import get_local_path
 from olive.common.utils import hash_dict
 from olive.engine import Engine
 from olive.evaluator.metric import AccuracySubType, MetricResult, joint_metric_key
 from olive.evaluator.olive_evaluator import OliveEvaluatorConfig
 from olive.hardware import DEFAULT_CPU_ACCELERATOR
 from olive.model import PyTorchModel
+from olive.passes.olive_pass import create_pass_from_dict
 from olive.passes.onnx import OnnxConversion, OnnxDynamicQuantization, OnnxStaticQuantization
 from olive.systems.common import SystemType
 from olive.systems.local import LocalSystem
@@ -293,6 +297,73 @@ class TestEngine:
         assert result_json_path.is_file()
         assert MetricResult.parse_file(result_json_path) == actual_res
 
+    @pytest.mark.parametrize("is_early_stopped", [True, False])
+    @patch("olive.systems.local.LocalSystem")
+    def test_evaluation_cache_early_stopped(self, mock_local_system, is_early_stopped, tmp_path):
+        # setup
+        pytorch_model = get_pytorch_model()
+        metric = get_accuracy_metric(AccuracySubType.ACCURACY_SCORE)
+        evaluator_config = OliveEvaluatorConfig(metrics=[metric])
+        options = {
+            "cache_dir": str(tmp_path / "cache"),
+            "search_strategy": None,
+        }
+        metric_result_dict = {
+            joint_metric_key(metric.name, sub_metric.name): {
+                "value": 0.5,
+                "priority": sub_metric.priority,
+                "higher_is_better": sub_metric.higher_is_better,
+                "is_early_stopped": is_early_stopped,
+            }
+            for sub_metric in metric.sub_types
+        }
+        mock_local_system.evaluate_model.return_value = MetricResult.parse_obj(metric_result_dict)
+        mock_local_system.accelerators = ["CPU"]
+
+        # execute
+        for _ in range(2):
+            engine = Engine(
+                options, host=mock_local_system, target=mock_local_system, evaluator_config=evaluator_config
+            )
+            engine.run(pytorch_model, output_dir=tmp_path / "output", evaluation_only=True)
+
+        # assert
+        # the partial results of an early stopped evaluation are not reused by the next run
+        assert mock_local_system.evaluate_model.call_count == (2 if is_early_stopped else 1)
+
+    @patch("olive.systems.local.LocalSystem")
+    def test_early_stop_disabled_for_input_model(self, mock_local_system, tmp_path):
+        # setup
+        pytorch_model = get_pytorch_model()
+        user_config = {"dataloader_func": create_dataloader, "early_stop": {"chunk_size": 10, "confidence": 0.99}}
+        metric = get_accuracy_metric(AccuracySubType.ACCURACY_SCORE, user_config=user_config)
+        evaluator_config = OliveEvaluatorConfig(metrics=[metric])
+        options = {
+            "cache_dir": str(tmp_path / "cache"),
+            "search_strategy": None,
+        }
+        mock_local_system.evaluate_model.return_value = MetricResult.parse_obj(
+            {
+                joint_metric_key(metric.name, sub_metric.name): {
+                    "value": 0.5,
+                    "priority": sub_metric.priority,
+                    "higher_is_better": sub_metric.higher_is_better,
+                }
+                for sub_metric in metric.sub_types
+            }
+        )
+        mock_local_system.accelerators = ["CPU"]
+        engine = Engine(options, host=mock_local_system, target=mock_local_system, evaluator_config=evaluator_config)
+
+        # execute
+        engine.run(pytorch_model, output_dir=tmp_path / "output", evaluation_only=True)
+
+        # assert
+        # the input model is the baseline of the goals, so it is evaluated over the whole data
+        evaluated_metric = mock_local_system.evaluate_model.call_args[0][1][0]
+        assert evaluated_metric.user_config.early_stop is None
+        assert metric.user_config.early_stop is not None
+
     @patch.object(Path, "glob", return_value=[Path("cache") / "output" / "100_model.json"])
     @patch.object(Path, "unlink")
     def test_model_path_suffix(self, mock_unlink, mock_glob):
@@ -498,3 +569,42 @@ class TestEngine:
                 mock_quantize_dynamic.side_effect = AttributeError("test")
                 actual_res = engine.run(onnx_model, output_dir=output_dir)
                 assert actual_res == {}, "Expect empty dict when quantization fails"
+
+    def test_get_non_local_resources(self):
+        # setup
+        datastore_url = "azureml://subscriptions/sub/resourcegroups/rg/workspaces/ws/datastores/ds/paths/{}"
+        azureml_client = {"subscription_id": "sub", "resource_group": "rg", "workspace_name": "ws"}
+        input_model = PyTorchModel(
+            model_path={
+                "type": "azureml_model",
+                "config": {"azureml_client": azureml_client, "name": "model", "version": "1"},
+            }
+        )
+        metric = get_accuracy_metric(
+            AccuracySubType.ACCURACY_SCORE,
+            user_config={"dataloader_func": create_dataloader, "data_dir": datastore_url.format("metric_data")},
+        )
+        engine = Engine({"cache_dir": "./cache"}, evaluator_config=OliveEvaluatorConfig(metrics=[metric]))
+        engine.register(OnnxStaticQuantization, config={"data_dir": datastore_url.format("calibration_data")})
+        # the same resource is only downloaded once
+        engine.register(OnnxStaticQuantization, config={"data_dir": datastore_url.format("calibration_data")})
+        engine.register(OnnxConversion, config={"target_opset": 13})
+        # passes registered directly are included too
+        engine.register_pass(
+            create_pass_from_dict(
+                OnnxStaticQuantization, {"data_dir": datastore_url.format("pass_data")}, disable_search=True
+            )
+        )
+
+        # execute
+        resources = engine._get_non_local_resources(input_model)
+
+        # assert
+        # the data resources are downloaded to the cache directory where get_local_path looks them up
+        data_cache_dir = inspect.signature(get_local_path).parameters["cache_dir"].default
+        assert [(resource_path.get_path(), cache_dir) for resource_path, cache_dir in resources] == [
+            ("azureml:model:1", engine._config.cache_dir),
+            (datastore_url.format("calibration_data"), data_cache_dir),
+            (datastore_url.format("pass_data"), data_cache_dir),
+            (datastore_url.format("metric_data"), data_cache_dir),
+        ]
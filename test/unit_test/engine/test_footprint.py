@@ -35,6 +35,25 @@ class TestFootprint:
         assert len(pareto_frontier_fp.nodes) == 2
         assert all([v.is_pareto_frontier for v in pareto_frontier_fp.nodes.values()])
 
+    def test_pareto_frontier_early_stopped(self):
+        # setup
+        model_id = next(k for k, v in self.fp.nodes.items() if v.parent_model_id is not None)
+        for sub_metric_result in self.fp.nodes[model_id].metrics.value.__root__.values():
+            sub_metric_result.is_early_stopped = True
+
+        # execute
+        self.fp.resolve_metrics()
+        pareto_frontier_fp = self.fp.get_pareto_frontier()
+
+        # assert
+        # the partial metrics of the early stopped node are not compared
+        assert model_id not in pareto_frontier_fp.nodes
+        assert len(pareto_frontier_fp.nodes) == 1
+        metrics = self.fp.nodes[model_id].metrics
+        assert metrics.is_early_stopped
+        assert not metrics.is_goals_met
+        assert "stopped early" in metrics.early_stop_reason
+
     def test_trace_back_run_history(self):
         for model_id in self.fp.nodes:
             run_history = self.fp.trace_back_run_history(model_id)
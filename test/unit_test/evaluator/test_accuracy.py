@@ -2,111 +2,170 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 # --------------------------------------------------------------------------
+from test.unit_test.utils import get_accuracy_metric as get_accuracy_metric_config
 from unittest.mock import MagicMock, patch
 
-from olive.evaluator.accuracy import AUC, AccuracyScore, F1Score, Precision, Recall
+import pytest
+import torch
+import torchmetrics
+
+from olive.evaluator.accuracy import AUC, AccuracyScore, F1Score, Precision, Recall, get_accuracy_metric
+from olive.evaluator.metric_backend import TorchMetrics
+
+
+@pytest.mark.parametrize(
+    "accuracy_cls,torchmetrics_cls",
+    [(AccuracyScore, "Accuracy"), (F1Score, "F1Score"), (Precision, "Precision"), (Recall, "Recall")],
+)
+@pytest.mark.parametrize(
+    "preds,targets",
+    [
+        # binary labels
+        ([1, 0, 1, 1], [1, 1, 1, 1]),
+        ([1, 0, 0, 1, 0], [1, 1, 0, 0, 0]),
+        # multiclass labels
+        ([0, 2, 1, 2], [0, 1, 1, 2]),
+    ],
+)
+def test_evaluate_accuracy_default_config(accuracy_cls, torchmetrics_cls, preds, targets):
+    # setup
+    acc = accuracy_cls()
+    expected_res = getattr(torchmetrics, torchmetrics_cls)()(torch.tensor(preds), torch.tensor(targets)).item()
+
+    # execute
+    actual_res = acc.measure(preds, targets)
+
+    # assert
+    # the default configs are computed with numpy and give the same results as torchmetrics
+    assert acc._numpy_supported
+    assert actual_res == pytest.approx(expected_res)
+
+
+@pytest.mark.parametrize("accuracy_cls", [AccuracyScore, F1Score, Precision, Recall])
+def test_evaluate_accuracy_without_torchmetrics(accuracy_cls):
+    with patch("olive.evaluator.accuracy.torchmetrics", None):
+        # setup
+        acc = accuracy_cls()
+
+        # execute
+        actual_res = acc.measure([1, 0, 0, 1, 0], [1, 1, 0, 0, 0])
+
+    # assert
+    assert actual_res == pytest.approx(0.6)
+
+
+@pytest.mark.parametrize(
+    "accuracy_cls,torchmetrics_cls",
+    [(AccuracyScore, "Accuracy"), (F1Score, "F1Score"), (Precision, "Precision"), (Recall, "Recall")],
+)
+def test_evaluate_accuracy_torchmetrics(accuracy_cls, torchmetrics_cls):
+    with patch("olive.evaluator.accuracy.torchmetrics") as mock_torchmetrics:
+        # setup
+        mock_metric = MagicMock()
+        mock_metric.compute.return_value = torch.tensor(0.99)
+        getattr(mock_torchmetrics, torchmetrics_cls).return_value = mock_metric
+        # configs other than micro average are computed with torchmetrics
+        acc = accuracy_cls({"average": "macro", "num_classes": 2})
+        acc.metric_cls_map = {accuracy_cls.name: getattr(mock_torchmetrics, torchmetrics_cls)}
+        preds = [1, 0, 1, 1]
+        targets = [1, 1, 1, 1]
+
+        # execute
+        actual_res = acc.measure(preds, targets)
+
+    # assert
+    mock_metric.update.assert_called_once()
+    assert actual_res == pytest.approx(0.99)
 
 
-@patch("olive.evaluator.accuracy.torch")
-@patch("olive.evaluator.accuracy.torchmetrics")
-def test_evaluate_accuracyscore(mock_torchmetrics, mock_torch):
+def test_evaluate_accuracy_batches():
     # setup
-    acc = AccuracyScore()
-    preds = [1, 0, 1, 1]
-    targets = [1, 1, 1, 1]
-    expected_res = 0.99
-    mock_res = MagicMock()
-    mock_res.item.return_value = expected_res
-    mock_torchmetrics.Accuracy().return_value = mock_res
+    acc = AccuracyScore({"mdmc_average": "global"})
+    batches = [([[1, 0], [1, 1]], [[1, 1], [1, 1]]), ([[0, 0]], [[0, 0]])]
 
     # execute
-    actual_res = acc.measure(preds, targets)
+    acc.reset()
+    for preds, targets in batches:
+        acc.update(torch.tensor(preds), torch.tensor(targets))
+    actual_res = acc.compute()
 
     # assert
-    mock_torch.tensor.called_once_with(preds)
-    mock_torch.tensor.called_once_with(targets)
-    assert actual_res == expected_res
+    assert actual_res == 5 / 6
 
 
-@patch("olive.evaluator.accuracy.torch")
-@patch("olive.evaluator.accuracy.torchmetrics")
-def test_evaluate_f1score(mock_torchmetrics, mock_torch):
+def test_evaluate_auc():
     # setup
-    acc = F1Score()
-    preds = [1, 0, 1, 1]
+    acc = AUC()
+    preds = [0, 1, 2, 3]
     targets = [1, 1, 1, 1]
-    expected_res = 0.99
-    mock_res = MagicMock()
-    mock_res.item.return_value = expected_res
-    mock_torchmetrics.F1Score().return_value = mock_res
 
     # execute
     actual_res = acc.measure(preds, targets)
 
     # assert
-    mock_torch.tensor.called_once_with(preds)
-    mock_torch.tensor.called_once_with(targets)
-    assert actual_res == expected_res
+    assert actual_res == 3.0
 
 
-@patch("olive.evaluator.accuracy.torch")
-@patch("olive.evaluator.accuracy.torchmetrics")
-def test_evaluate_precision(mock_torchmetrics, mock_torch):
+def test_get_accuracy_metric():
     # setup
-    acc = Precision()
-    preds = [1, 0, 1, 1]
-    targets = [1, 1, 1, 1]
-    expected_res = 0.99
-    mock_res = MagicMock()
-    mock_res.item.return_value = expected_res
-    mock_torchmetrics.Precision().return_value = mock_res
+    first_metric = get_accuracy_metric("accuracy_score", {"num_classes": 2})
+    first_metric.update([1], [1])
 
     # execute
-    actual_res = acc.measure(preds, targets)
+    second_metric = get_accuracy_metric("accuracy_score", {"num_classes": 2})
 
     # assert
-    mock_torch.tensor.called_once_with(preds)
-    mock_torch.tensor.called_once_with(targets)
-    assert actual_res == expected_res
+    # the metric object is reused by the next evaluation after it is reset
+    assert second_metric is first_metric
+    assert get_accuracy_metric("accuracy_score", {"num_classes": 3}) is not first_metric
+    with pytest.raises(ValueError, match="without any samples"):
+        second_metric.compute()
 
 
-@patch("olive.evaluator.accuracy.torch")
-@patch("olive.evaluator.accuracy.torchmetrics")
-def test_evaluate_recall(mock_torchmetrics, mock_torch):
+def test_get_accuracy_metric_torchmetrics():
     # setup
-    acc = Recall()
-    preds = [1, 0, 1, 1]
-    targets = [1, 1, 1, 1]
-    expected_res = 0.99
-    mock_res = MagicMock()
-    mock_res.item.return_value = expected_res
-    mock_torchmetrics.Recall().return_value = mock_res
+    config = {"average": "macro", "num_classes": 2}
+    first_metric = get_accuracy_metric("f1_score", config)
+    first_metric.measure([0, 1, 1], [0, 1, 0])
+    torch_metric = first_metric._torch_metric
 
     # execute
-    actual_res = acc.measure(preds, targets)
+    second_metric = get_accuracy_metric("f1_score", config)
+    actual_res = second_metric.measure([1, 1], [1, 1])
 
     # assert
-    mock_torch.tensor.called_once_with(preds)
-    mock_torch.tensor.called_once_with(targets)
-    assert actual_res == expected_res
+    # the torchmetrics object is built once and reset for the next evaluation
+    assert second_metric._torch_metric is torch_metric
+    expected_res = torchmetrics.F1Score(**config)(torch.tensor([1, 1]), torch.tensor([1, 1])).item()
+    assert actual_res == pytest.approx(expected_res)
 
 
-@patch("olive.evaluator.accuracy.torch")
-@patch("olive.evaluator.accuracy.torchmetrics")
-def test_evaluate_auc(mock_torchmetrics, mock_torch):
+def test_torch_metrics_backend_batches():
     # setup
-    acc = AUC()
-    preds = [1, 0, 1, 1]
-    targets = [1, 1, 1, 1]
-    expected_res = 0.99
-    mock_res = MagicMock()
-    mock_res.item.return_value = expected_res
-    mock_torchmetrics.functional.auc.return_value = mock_res
+    metric = get_accuracy_metric_config("accuracy_score", "f1_score")
+    backend = TorchMetrics()
 
     # execute
-    actual_res = acc.measure(preds, targets)
+    backend.update(torch.tensor([1, 0]), torch.tensor([1, 1]), metric)
+    backend.update(torch.tensor([1]), torch.tensor([1]), metric)
+    actual_res = backend.compute(metric)
 
     # assert
-    mock_torch.tensor.called_once_with(preds)
-    mock_torch.tensor.called_once_with(targets)
-    assert actual_res == expected_res
+    preds, targets = torch.tensor([1, 0, 1]), torch.tensor([1, 1, 1])
+    assert actual_res["accuracy_score"].value == pytest.approx(torchmetrics.Accuracy()(preds, targets).item())
+    assert actual_res["f1_score"].value == pytest.approx(torchmetrics.F1Score()(preds, targets).item())
+
+
+def test_torch_metrics_backend_separate_evaluations():
+    # setup
+    metric = get_accuracy_metric_config("accuracy_score")
+    failed_backend = TorchMetrics()
+    # an evaluation that failed after its first batch
+    failed_backend.update(torch.tensor([0, 0]), torch.tensor([1, 1]), metric)
+    backend = TorchMetrics()
+
+    # execute and assert
+    with pytest.raises(ValueError, match="without any data"):
+        backend.compute(metric)
+    backend.update(torch.tensor([1]), torch.tensor([1]), metric)
+    assert backend.compute(metric)[metric.sub_types[0].name].value == 1.0
@@ -0,0 +1,108 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------
+from test.unit_test.utils import ONNX_MODEL_PATH, create_dataloader, get_accuracy_metric, get_latency_metric
+
+import numpy as np
+import onnx
+import pytest
+
+from olive.evaluator.distributed import SharedMemoryRankPool, SharedTensorBuffer, SharedTensorReader
+from olive.evaluator.metric import AccuracySubType, LatencySubType
+from olive.hardware import DEFAULT_CPU_ACCELERATOR
+from olive.model import DistributedOnnxModel
+from olive.systems.local import LocalSystem
+
+
+@pytest.fixture(scope="module", autouse=True)
+def close_rank_pools():
+    yield
+    SharedMemoryRankPool.close_all()
+
+
+def test_shared_tensor_buffer():
+    # setup
+    buffer = SharedTensorBuffer()
+    reader = SharedTensorReader()
+
+    try:
+        for shape in [(2, 3), (1, 3), (8, 16)]:
+            array = np.random.rand(*shape).astype(np.float32)
+
+            # execute
+            descriptor = buffer.write(array)
+
+            # assert
+            assert np.array_equal(reader.read(0, descriptor), array)
+    finally:
+        reader.close()
+        buffer.close()
+
+
+def test_evaluate_shared_memory_backend():
+    # setup
+    model = DistributedOnnxModel([str(ONNX_MODEL_PATH), str(ONNX_MODEL_PATH)])
+    user_config = {"dataloader_func": create_dataloader, "distributed_backend": "shared_memory"}
+    metrics = [
+        get_accuracy_metric(AccuracySubType.ACCURACY_SCORE, user_config=user_config),
+        get_latency_metric(LatencySubType.AVG, user_config=user_config),
+    ]
+    system = LocalSystem()
+
+    # execute
+    actual_res = system.evaluate_model(model, metrics, DEFAULT_CPU_ACCELERATOR)
+    pids = [process.pid for process in SharedMemoryRankPool.get(model.ranks).processes]
+    system.evaluate_model(model, metrics, DEFAULT_CPU_ACCELERATOR)
+
+    # assert
+    assert 0 <= actual_res.get_value("accuracy", AccuracySubType.ACCURACY_SCORE.value) <= 1
+    assert actual_res.get_value("latency", LatencySubType.AVG.value) > 0
+    # the rank workers are kept alive across evaluations
+    assert pids == [process.pid for process in SharedMemoryRankPool.get(model.ranks).processes]
+
+
+def test_shared_memory_rank_pool_error():
+    # setup
+    pool = SharedMemoryRankPool.get(2)
+
+    # execute and assert
+    with pytest.raises(RuntimeError, match="Distributed evaluation failed"):
+        pool.load(["missing_model.onnx", "missing_model.onnx"])
+    assert pool.is_alive()
+
+
+def test_shared_memory_rank_pool_outputs_of_rank_0(tmp_path):
+    # setup
+    graph = onnx.helper.make_graph(
+        [onnx.helper.make_node("Relu", ["input"], ["output"])],
+        "relu",
+        [onnx.helper.make_tensor_value_info("input", onnx.TensorProto.FLOAT, [1, 4])],
+        [onnx.helper.make_tensor_value_info("output", onnx.TensorProto.FLOAT, [1, 4])],
+    )
+    model_path = tmp_path / "relu.onnx"
+    onnx.save(onnx.helper.make_model(graph, ir_version=8, opset_imports=[onnx.helper.make_opsetid("", 13)]), model_path)
+    input_data = np.array([[-1, 0, 1, 2]], dtype=np.float32)
+    pool = SharedMemoryRankPool.get(2)
+    pool.load([model_path, model_path])
+
+    # execute
+    latencies, outputs = pool.run({"input": input_data}, repeat_test_num=2, return_outputs=True)
+
+    # assert
+    assert [len(rank_latencies) for rank_latencies in latencies] == [2, 2]
+    assert np.array_equal(outputs[0], np.maximum(input_data, 0))
+    # only rank 0 writes its outputs to shared memory
+    results = pool._call(
+        "run",
+        {
+            "inputs": {"input": pool.input_buffers["input"].write(input_data)},
+            "device": pool.device,
+            "warmup_num": 0,
+            "repeat_test_num": 1,
+            "sleep_num": 0,
+            "return_outputs": True,
+        },
+    )
+    assert results[0][1] is not None
+    assert results[1][1] is None
@@ -0,0 +1,112 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------
+from test.unit_test.utils import create_dataloader, get_accuracy_metric, get_latency_metric
+
+import pytest
+
+from olive.evaluator.early_stop import AccuracyEarlyStopper, accuracy_upper_bound
+from olive.evaluator.metric import AccuracySubType, LatencySubType, Metric, MetricResult, MetricType
+
+
+def get_early_stop_metric(early_stop=True):
+    user_config = {"dataloader_func": create_dataloader}
+    if early_stop:
+        user_config["early_stop"] = {"chunk_size": 10, "confidence": 0.99}
+    # goal of accuracy_score is threshold 0.99
+    return get_accuracy_metric("accuracy_score", user_config=user_config)
+
+
+def test_accuracy_upper_bound():
+    assert accuracy_upper_bound(50, 100, 0.99) > 0.5
+    assert accuracy_upper_bound(100, 100, 0.99) == 1.0
+    # more samples give a tighter bound
+    assert accuracy_upper_bound(500, 1000, 0.99) < accuracy_upper_bound(50, 100, 0.99)
+
+
+@pytest.mark.parametrize(
+    "early_stop,correct,expected_stop",
+    [
+        (True, False, True),
+        (True, True, False),
+        (False, False, False),
+    ],
+)
+def test_accuracy_early_stopper(early_stop, correct, expected_stop):
+    stopper = AccuracyEarlyStopper(get_early_stop_metric(early_stop))
+
+    stopped = False
+    for _ in range(10):
+        labels = [1] * 5
+        outputs = labels if correct else [0] * 5
+        stopped = stopper.update(outputs, labels)
+        if stopped:
+            break
+
+    assert stopped == expected_stop
+    if expected_stop:
+        # stops after the first chunk
+        assert stopper.num_samples == 10
+
+
+def test_accuracy_early_stopper_shape_mismatch():
+    stopper = AccuracyEarlyStopper(get_early_stop_metric())
+
+    assert not stopper.update([[0, 1]] * 10, [1] * 10)
+    assert not stopper.enabled
+
+
+def test_mark_early_stopped():
+    metric_result = MetricResult.parse_obj(
+        {"accuracy-accuracy_score": {"value": 0.5, "priority": 1, "higher_is_better": True}}
+    )
+
+    AccuracyEarlyStopper.mark_early_stopped(metric_result)
+
+    assert metric_result["accuracy-accuracy_score"].is_early_stopped
+
+
+def test_early_stop_config_validation():
+    user_config = {"dataloader_func": create_dataloader, "early_stop": {"chunk_size": 10}}
+
+    # the evaluation can only stop early against the goal of the accuracy score
+    with pytest.raises(ValueError, match="early_stop is only supported"):
+        get_accuracy_metric(AccuracySubType.F1_SCORE, user_config=user_config)
+    with pytest.raises(ValueError):
+        get_latency_metric(LatencySubType.AVG, user_config=user_config)
+    # the bound of the accuracy does not hold for the other sub types with goals
+    with pytest.raises(ValueError, match="early_stop is only supported"):
+        get_accuracy_metric(AccuracySubType.ACCURACY_SCORE, AccuracySubType.F1_SCORE, user_config=user_config)
+
+
+@pytest.mark.parametrize(
+    "metric_config,supported",
+    [
+        ({"mdmc_average": "global"}, True),
+        ({"mdmc_average": "global", "average": "macro", "num_classes": 2}, False),
+        ({"mdmc_average": "samplewise"}, False),
+        ({"mdmc_average": "global", "top_k": 1}, False),
+    ],
+)
+def test_early_stop_config_validation_average(metric_config, supported):
+    def get_metric():
+        return Metric(
+            name="accuracy",
+            type=MetricType.ACCURACY,
+            sub_types=[
+                {
+                    "name": AccuracySubType.ACCURACY_SCORE,
+                    "metric_config": metric_config,
+                    "goal": {"type": "threshold", "value": 0.99},
+                }
+            ],
+            user_config={"dataloader_func": create_dataloader, "early_stop": {"chunk_size": 10}},
+        )
+
+    # only the micro accuracy score is the rate of matching elements that is bounded
+    if supported:
+        assert get_metric().user_config.early_stop
+    else:
+        with pytest.raises(ValueError, match="early_stop is only supported"):
+            get_metric()
@@ -40,6 +40,28 @@ class TestMetricBackend:
         for _, v in actual_res.items():
             assert v.value == 0.999
 
+    @patch("evaluate.load")
+    def test_huggingface_metric_loaded_once(self, loader):
+        loader.return_value.compute.return_value = self.compute_res
+        metric = get_accuracy_metric("seqeval", backend="huggingface_metrics")
+        for idx, _ in enumerate(metric.sub_types):
+            metric.sub_types[idx].metric_config.load_params = {"experiment_id": "test_loaded_once"}
+            metric.sub_types[idx].metric_config.result_key = "MISC.precision"
+
+        # measure all at once and batch by batch
+        HuggingfaceMetrics().measure(self.preds, self.targets, metric)
+        backend = HuggingfaceMetrics()
+        for preds, targets in zip(self.preds, self.targets):
+            backend.update([preds], [targets], metric)
+        actual_res = backend.compute(metric)
+
+        loader.assert_called_once()
+        # the batches are kept by the backend instance, not added to the shared evaluate module
+        loader.return_value.add_batch.assert_not_called()
+        loader.return_value.compute.assert_called_with(predictions=self.preds, references=self.targets)
+        for _, v in actual_res.items():
+            assert v.value == 0.999
+
     HF_ACCURACY_TEST_CASE = [
         (get_pytorch_model(), get_accuracy_metric("accuracy", "f1", backend="huggingface_metrics"), 0.99),
         (get_onnx_model(), get_accuracy_metric("accuracy", "f1", backend="huggingface_metrics"), 0.99),
@@ -2,13 +2,28 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 # --------------------------------------------------------------------------
-from test.unit_test.utils import get_accuracy_metric, get_latency_metric, get_onnx_model, get_pytorch_model
-from unittest.mock import patch
+from pathlib import Path
+from test.unit_test import utils
+from test.unit_test.utils import (
+    create_dataloader,
+    get_accuracy_metric,
+    get_latency_metric,
+    get_memory_metric,
+    get_onnx_model,
+    get_pytorch_model,
+    get_throughput_metric,
+)
+from unittest.mock import MagicMock, patch
 
+import numpy as np
+import onnx
 import pytest
+from onnx import TensorProto, helper
 
-from olive.evaluator.metric import AccuracySubType, LatencySubType
-from olive.hardware import DEFAULT_CPU_ACCELERATOR
+from olive.evaluator.metric import AccuracySubType, LatencySubType, MemorySubType, ThroughputSubType
+from olive.evaluator.olive_evaluator import OliveEvaluator, OnnxEvaluator, OpenVINOEvaluator
+from olive.hardware import DEFAULT_CPU_ACCELERATOR, Device
+from olive.model import ONNXModel, OpenVINOModel, PyTorchModel
 from olive.systems.local import LocalSystem
 
 
@@ -66,14 +81,16 @@ class TestOliveEvaluator:
     )
     def test_evaluate_accuracy(self, olive_model, metric, acc_subtype, expected_res):
         # setup
-        with patch(f"{acc_subtype}.measure") as mock_acc:
-            mock_acc.return_value = expected_res
+        with patch(f"{acc_subtype}.update") as mock_update, patch(f"{acc_subtype}.compute") as mock_compute:
+            mock_compute.return_value = expected_res
 
             # execute
             actual_res = self.system.evaluate_model(olive_model, [metric], DEFAULT_CPU_ACCELERATOR)
 
             # assert
-            mock_acc.assert_called_once()
+            # the batches are accumulated and the metric is computed once
+            mock_update.assert_called()
+            mock_compute.assert_called_once()
             for sub_type in metric.sub_types:
                 assert expected_res == actual_res.get_value(metric.name, sub_type.name)
 
@@ -110,6 +127,292 @@ class TestOliveEvaluator:
         for sub_type in metric.sub_types:
             assert expected_res > actual_res.get_value(metric.name, sub_type.name)
 
+    def test_evaluate_latency_full_dataset(self):
+        metric = get_latency_metric(LatencySubType.AVG, LatencySubType.P90)
+        for sub_type in metric.sub_types:
+            sub_type.metric_config.full_dataset = True
+            sub_type.metric_config.warmup_num = 1
+
+        # execute
+        actual_res = self.system.evaluate_model(get_onnx_model(), [metric], DEFAULT_CPU_ACCELERATOR)
+
+        # assert
+        for sub_type in metric.sub_types:
+            assert actual_res.get_value(metric.name, sub_type.name) > 0
+
+    @pytest.mark.parametrize("full_dataset", [True, False])
+    def test_evaluate_latency_preallocate_outputs(self, full_dataset):
+        metric = get_latency_metric(
+            LatencySubType.AVG,
+            user_config={"dataloader_func": create_dataloader, "io_bind": True, "preallocate_outputs": True},
+        )
+        for sub_type in metric.sub_types:
+            sub_type.metric_config.full_dataset = full_dataset
+
+        # execute
+        with patch.object(
+            OnnxEvaluator, "prepare_ort_outputs", wraps=OnnxEvaluator.prepare_ort_outputs
+        ) as mock_prepare_ort_outputs:
+            actual_res = self.system.evaluate_model(get_onnx_model(), [metric], DEFAULT_CPU_ACCELERATOR)
+
+        # assert
+        # the output buffers are allocated once and reused by every run
+        mock_prepare_ort_outputs.assert_called_once()
+        for sub_type in metric.sub_types:
+            assert actual_res.get_value(metric.name, sub_type.name) > 0
+
+    def test_prepare_ort_outputs(self):
+        # setup
+        model = get_onnx_model()
+        session = model.prepare_session(inference_settings=None, device=Device.CPU)
+        ort_inputs = OnnxEvaluator.prepare_ort_inputs(session, {"input": np.random.rand(1, 1).astype(np.float32)})
+
+        # execute
+        ort_outputs = OnnxEvaluator.prepare_ort_outputs(session, model.get_io_config(), ort_inputs)
+        io_bind_op = session.io_binding()
+        OnnxEvaluator.bind_ort_inputs(io_bind_op, ort_inputs)
+        OnnxEvaluator.bind_ort_outputs(io_bind_op, session, Device.CPU, ort_outputs)
+        session.run_with_iobinding(io_bind_op)
+
+        # assert
+        expected = OnnxEvaluator.ort_outputs_to_numpy(OnnxEvaluator.run_ort_inputs(session, ort_inputs))
+        assert np.allclose(ort_outputs["output"].numpy(), expected[0])
+
+    def test_compute_latency(self):
+        metric = get_latency_metric(*LatencySubType)
+        latencies = np.random.rand(100)
+
+        # execute
+        actual_res = OliveEvaluator.compute_latency(metric, latencies)
+
+        # assert
+        expected_res = {
+            "avg": np.mean(latencies),
+            "max": np.max(latencies),
+            "min": np.min(latencies),
+            "p50": np.percentile(latencies, 50),
+            "p75": np.percentile(latencies, 75),
+            "p90": np.percentile(latencies, 90),
+            "p95": np.percentile(latencies, 95),
+            "p99": np.percentile(latencies, 99),
+            "p999": np.percentile(latencies, 99.9),
+        }
+        for sub_type, expected_value in expected_res.items():
+            assert actual_res[sub_type].value == round(expected_value * 1000, 5)
+
+    def test_compute_latency_by_shape(self):
+        latencies = [0.001, 0.002, 0.003, 0.010]
+        shapes = ["input:1x8", "input:1x8", "input:1x8", "input:1x128"]
+
+        # execute
+        latency_by_shape = OliveEvaluator.compute_latency_by_shape(latencies, shapes)
+
+        # assert
+        assert latency_by_shape["input:1x8"]["count"] == 3
+        assert latency_by_shape["input:1x8"]["p50"] == 2
+        assert latency_by_shape["input:1x128"]["count"] == 1
+        assert latency_by_shape["input:1x128"]["avg"] == 10
+
+    @pytest.mark.parametrize("concurrency", [1, 2])
+    def test_evaluate_throughput(self, concurrency):
+        metric = get_throughput_metric(
+            ThroughputSubType.REQUESTS_PER_SEC,
+            ThroughputSubType.P99_LATENCY,
+            metric_config={"warmup_num": 1, "concurrency": concurrency, "duration": 0.5},
+        )
+
+        # execute
+        actual_res = self.system.evaluate_model(get_onnx_model(), [metric], DEFAULT_CPU_ACCELERATOR)
+
+        # assert
+        assert actual_res.get_value(metric.name, ThroughputSubType.REQUESTS_PER_SEC.value) > 0
+        assert actual_res.get_value(metric.name, ThroughputSubType.P99_LATENCY.value) > 0
+        assert metric.sub_types[0].higher_is_better
+        assert not metric.sub_types[1].higher_is_better
+
+    def test_evaluate_throughput_not_supported(self):
+        metric = get_throughput_metric(ThroughputSubType.REQUESTS_PER_SEC)
+        with pytest.raises(NotImplementedError):
+            self.system.evaluate_model(get_pytorch_model(), [metric], DEFAULT_CPU_ACCELERATOR)
+
+    @pytest.mark.parametrize("duration", [0, -1])
+    def test_throughput_invalid_duration(self, duration):
+        with pytest.raises(ValueError, match="duration must be greater than 0"):
+            get_throughput_metric(ThroughputSubType.REQUESTS_PER_SEC, metric_config={"duration": duration})
+
+    def test_compute_throughput_no_requests(self):
+        metric = get_throughput_metric(ThroughputSubType.REQUESTS_PER_SEC)
+        with pytest.raises(ValueError, match="No requests finished"):
+            OliveEvaluator.compute_throughput(metric, [], 0.1)
+
+    def test_run_ort_inputs(self):
+        # setup
+        session = get_onnx_model().prepare_session(inference_settings=None, device=Device.CPU)
+        input_dict = {"input": np.random.rand(1, 1).astype(np.float32)}
+
+        # execute
+        ort_inputs = OnnxEvaluator.prepare_ort_inputs(session, input_dict)
+        # the converted inputs can be fed repeatedly
+        outputs = [
+            OnnxEvaluator.ort_outputs_to_numpy(OnnxEvaluator.run_ort_inputs(session, ort_inputs)) for _ in range(2)
+        ]
+
+        # assert
+        expected = session.run(input_feed=input_dict, output_names=None)
+        for output in outputs:
+            assert np.allclose(output[0], expected[0])
+
+    def test_run_ort_inputs_sequence_output(self, tmp_path):
+        # setup
+        # model with a sequence output, like the zipmap output of classifiers
+        graph = helper.make_graph(
+            [helper.make_node("SequenceConstruct", ["input"], ["output"])],
+            "sequence_output",
+            [helper.make_tensor_value_info("input", TensorProto.FLOAT, [1, 2])],
+            [helper.make_tensor_sequence_value_info("output", TensorProto.FLOAT, [1, 2])],
+        )
+        model_path = tmp_path / "sequence_output.onnx"
+        onnx.save(helper.make_model(graph, opset_imports=[helper.make_opsetid("", 13)], ir_version=8), model_path)
+        session = ONNXModel(model_path=str(model_path)).prepare_session(inference_settings=None, device=Device.CPU)
+        input_dict = {"input": np.random.rand(1, 2).astype(np.float32)}
+
+        # execute
+        ort_inputs = OnnxEvaluator.prepare_ort_inputs(session, input_dict)
+        outputs = OnnxEvaluator.ort_outputs_to_numpy(OnnxEvaluator.run_ort_inputs(session, ort_inputs))
+
+        # assert
+        # the session is run with the numpy inputs since sequence outputs cannot be returned as OrtValues
+        assert ort_inputs is input_dict
+        assert isinstance(outputs[0], list)
+        assert np.allclose(outputs[0][0], input_dict["input"])
+
+    # the models are created in the test since the onnx model file only exists once the session fixture has run
+    MEMORY_TEST_CASE = [
+        get_onnx_model,
+        # the model is loaded again in a separate process, so the model loader must come from a script
+        lambda: PyTorchModel(model_loader="pytorch_model_loader", model_script=str(Path(utils.__file__))),
+    ]
+
+    @pytest.mark.parametrize("get_model", MEMORY_TEST_CASE)
+    def test_evaluate_memory(self, get_model):
+        olive_model = get_model()
+        metric = get_memory_metric(
+            MemorySubType.SESSION_PEAK_RSS,
+            MemorySubType.INFERENCE_PEAK_RSS,
+            MemorySubType.STEADY_STATE_RSS,
+            MemorySubType.MODEL_SIZE,
+            metric_config={"repeat_test_num": 2},
+        )
+
+        # execute
+        actual_res = self.system.evaluate_model(olive_model, [metric], DEFAULT_CPU_ACCELERATOR)
+
+        # assert
+        for sub_type in metric.sub_types:
+            assert not sub_type.higher_is_better
+        assert actual_res.get_value(metric.name, MemorySubType.MODEL_SIZE.value) > 0
+        assert actual_res.get_value(metric.name, MemorySubType.SESSION_PEAK_RSS.value) >= 0
+        assert actual_res.get_value(metric.name, MemorySubType.INFERENCE_PEAK_RSS.value) >= actual_res.get_value(
+            metric.name, MemorySubType.STEADY_STATE_RSS.value
+        )
+
+
+class TestOpenVINOEvaluator:
+    @pytest.fixture
+    def openvino_model(self, tmp_path):
+        (tmp_path / "ov_model.xml").write_text("xml")
+        (tmp_path / "ov_model.bin").write_text("bin")
+        yield OpenVINOModel(tmp_path)
+        OpenVINOModel.clear_compiled_models()
+
+    @pytest.mark.parametrize("full_dataset", [True, False])
+    def test_evaluate_latency(self, openvino_model, full_dataset):
+        metric = get_latency_metric(LatencySubType.AVG)
+        for sub_type in metric.sub_types:
+            sub_type.metric_config.warmup_num = 2
+            sub_type.metric_config.repeat_test_num = 3
+            sub_type.metric_config.full_dataset = full_dataset
+        session = MagicMock()
+        runtime = MagicMock()
+
+        # execute
+        with patch.object(OpenVINOModel, "prepare_session", return_value=session), patch.dict(
+            "sys.modules", {"openvino": MagicMock(runtime=runtime), "openvino.runtime": runtime}
+        ):
+            actual_res = OpenVINOEvaluator().evaluate(openvino_model, [metric], Device.CPU)
+
+        # assert
+        assert actual_res.get_value(metric.name, LatencySubType.AVG.value) >= 0
+        # the inputs are set once per batch and only the inference is repeated
+        infer_request = session.create_infer_request.return_value
+        calls_with_inputs = [c for c in infer_request.infer.call_args_list if c.args]
+        if full_dataset:
+            # every batch is inferred once, after setting its inputs without inference
+            num_batches = infer_request.set_input_tensor.call_count
+            assert num_batches > 0
+            assert not calls_with_inputs
+            assert infer_request.infer.call_count == 2 + num_batches
+        else:
+            assert len(calls_with_inputs) == 1
+            assert infer_request.infer.call_count == 1 + 2 + 3
+
+    def test_evaluate_throughput(self, openvino_model):
+        metric = get_throughput_metric(
+            ThroughputSubType.REQUESTS_PER_SEC,
+            ThroughputSubType.AVG_LATENCY,
+            metric_config={"warmup_num": 1, "concurrency": 2, "duration": 0.1},
+        )
+
+        class FakeAsyncInferQueue:
+            # runs the requests synchronously, every request takes 1 ms
+            def __init__(self, compiled_model, jobs):
+                self.requests = [MagicMock(latency=1.0) for _ in range(jobs)]
+                self.callback = None
+                self.num_started = 0
+
+            def __iter__(self):
+                return iter(self.requests)
+
+            def set_callback(self, callback):
+                self.callback = callback
+
+            def start_async(self, inputs=None, userdata=None):
+                request = self.requests[self.num_started % len(self.requests)]
+                self.num_started += 1
+                if self.callback:
+                    self.callback(request, userdata)
+
+            def wait_all(self):
+                pass
+
+        runtime = MagicMock(AsyncInferQueue=FakeAsyncInferQueue)
+
+        # execute
+        with patch.object(OpenVINOModel, "prepare_session", return_value=MagicMock()), patch.dict(
+            "sys.modules", {"openvino": MagicMock(runtime=runtime), "openvino.runtime": runtime}
+        ):
+            actual_res = OpenVINOEvaluator().evaluate(openvino_model, [metric], Device.CPU)
+
+        # assert
+        assert actual_res.get_value(metric.name, ThroughputSubType.REQUESTS_PER_SEC.value) > 0
+        assert actual_res.get_value(metric.name, ThroughputSubType.AVG_LATENCY.value) == 1
+
+    def test_compiled_model_cache(self, openvino_model):
+        runtime = MagicMock()
+        compile_model = runtime.Core.return_value.compile_model
+        compile_model.side_effect = lambda **kwargs: MagicMock()
+
+        # execute
+        with patch.dict("sys.modules", {"openvino": MagicMock(runtime=runtime), "openvino.runtime": runtime}):
+            sessions = [openvino_model.prepare_session(None, Device.CPU) for _ in range(2)]
+            gpu_session = openvino_model.prepare_session(None, Device.GPU)
+
+        # assert
+        # the model is compiled once per device
+        assert sessions[0] is sessions[1]
+        assert gpu_session is not sessions[0]
+        assert [c.kwargs["device_name"] for c in compile_model.call_args_list] == ["CPU", "GPU"]
+
 
 @pytest.mark.skip(reason="Requires custom onnxruntime build with mpi enabled")
 class TestDistributedOnnxEvaluator:
@@ -2,9 +2,18 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 # --------------------------------------------------------------------------
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
 import torch
 
-from olive.model.hf_utils import load_huggingface_model_from_model_class, load_huggingface_model_from_task
+from olive.model.hf_utils import (
+    _tokenizer_cache,
+    get_tokenizer,
+    load_huggingface_model_from_model_class,
+    load_huggingface_model_from_task,
+)
 
 
 def test_load_huggingface_model_from_task():
@@ -22,3 +31,45 @@ def test_load_huggingface_model_from_model_class():
     model_name = "facebook/wav2vec2-base-960h"
     model = load_huggingface_model_from_model_class(model_class, model_name)
     assert isinstance(model, torch.nn.Module)
+
+
+@patch("transformers.AutoTokenizer.from_pretrained")
+def test_get_tokenizer_is_cached(mock_from_pretrained):
+    _tokenizer_cache.clear()
+    tokenizer = get_tokenizer("bert-base-uncased")
+    assert get_tokenizer("bert-base-uncased") is tokenizer
+    mock_from_pretrained.assert_called_once_with("bert-base-uncased")
+
+    # different kwargs create a new tokenizer
+    get_tokenizer("bert-base-uncased", use_fast=False)
+    assert mock_from_pretrained.call_count == 2
+
+    # kwargs with lists and dicts are cached too
+    special_tokens = {"additional_special_tokens": ["<a>", "<b>"]}
+    tokenizer = get_tokenizer("bert-base-uncased", **special_tokens)
+    assert get_tokenizer("bert-base-uncased", **special_tokens) is tokenizer
+    assert mock_from_pretrained.call_count == 3
+
+    # kwargs that are not json serializable are not cached
+    get_tokenizer("bert-base-uncased", dtype=object())
+    get_tokenizer("bert-base-uncased", dtype=object())
+    assert mock_from_pretrained.call_count == 5
+    _tokenizer_cache.clear()
+
+
+@patch("transformers.AutoTokenizer.from_pretrained")
+def test_get_tokenizer_concurrently(mock_from_pretrained):
+    # setup
+    _tokenizer_cache.clear()
+    # slow creation so that the callers overlap
+    mock_from_pretrained.side_effect = lambda *args, **kwargs: time.sleep(0.1) or object()
+
+    # execute
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        tokenizers = list(executor.map(lambda _: get_tokenizer("bert-base-uncased"), range(4)))
+
+    # assert
+    # the tokenizer is created once and shared by every caller
+    mock_from_pretrained.assert_called_once_with("bert-base-uncased")
+    assert all(tokenizer is tokenizers[0] for tokenizer in tokenizers)
+    _tokenizer_cache.clear()
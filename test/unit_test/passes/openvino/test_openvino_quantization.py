@@ -16,7 +16,7 @@ from olive.hardware import AcceleratorSpec
 from olive.model import PyTorchModel
 from olive.passes.olive_pass import create_pass_from_dict
 from olive.passes.openvino.conversion import OpenVINOConversion
-from olive.passes.openvino.quantization import OpenVINOQuantization
+from olive.passes.openvino.quantization import OpenVINOQuantization, _LazyDataLoader
 from olive.systems.local import LocalSystem
 
 
@@ -76,6 +76,66 @@ def test_openvino_quantization(data_source):
         assert (Path(quantized_model.model_path) / "ov_model.mapping").is_file()
 
 
+class CountingDataset(torch.utils.data.Dataset):
+    def __init__(self, num_samples):
+        self.num_samples = num_samples
+        self.accessed = []
+
+    def __len__(self):
+        return self.num_samples
+
+    def __getitem__(self, index):
+        self.accessed.append(index)
+        return torch.full((3,), float(index)), index
+
+
+@pytest.mark.parametrize("prefetch_size", [0, 2])
+def test_lazy_dataloader(prefetch_size):
+    # setup
+    dataset = CountingDataset(5)
+    dataloader = torch.utils.data.DataLoader(dataset, batch_size=2)
+
+    # execute
+    lazy_dataloader = _LazyDataLoader(dataloader, prefetch_size)
+
+    # assert
+    # nothing is loaded up front
+    assert not dataset.accessed
+    assert len(lazy_dataloader) == 3
+    data, label = lazy_dataloader[2]
+    assert data.shape == (1, 3)
+    assert (data == 4).all()
+    assert label.tolist() == [4]
+    data, label = lazy_dataloader[0]
+    assert data.shape == (2, 3)
+    assert label.tolist() == [0, 1]
+    with pytest.raises(IndexError):
+        lazy_dataloader[3]
+    # at most prefetch_size items are cached
+    assert len(lazy_dataloader._prefetched) <= prefetch_size
+
+    # closing drops the prefetched items and stops the thread, items are still fetched on demand
+    lazy_dataloader.close()
+    assert not lazy_dataloader._prefetched
+    assert lazy_dataloader._executor is None
+    data, label = lazy_dataloader[1]
+    assert label.tolist() == [2, 3]
+
+
+def test_lazy_dataloader_not_indexable():
+    # setup
+    dataloader = ((torch.full((1, 3), float(i)), i) for i in range(3))
+
+    # execute
+    lazy_dataloader = _LazyDataLoader(dataloader)
+
+    # assert
+    assert len(lazy_dataloader) == 3
+    data, label = lazy_dataloader[1]
+    assert (data == 1).all()
+    assert label == 1
+
+
 def get_openvino_model(tempdir):
     local_system = LocalSystem()
     torch_hub_model_path = "chenyaofo/pytorch-cifar-models"
@@ -0,0 +1,33 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------
+import importlib
+
+import pytest
+
+from olive.passes import REGISTRY
+from olive.passes.pass_registry import PASS_MODULES
+
+
+@pytest.mark.parametrize("pass_name", list(PASS_MODULES))
+def test_pass_manifest(pass_name):
+    # the manifest must point to the module that defines the pass
+    module = importlib.import_module(PASS_MODULES[pass_name])
+    assert getattr(module, pass_name).__name__ == pass_name
+
+
+def test_lazy_registry_lookup():
+    assert "onnxdynamicquantization" in REGISTRY
+    assert REGISTRY["onnxdynamicquantization"].__name__ == "OnnxDynamicQuantization"
+    assert "notapass" not in REGISTRY
+    assert REGISTRY.get("notapass") is None
+
+
+def test_lazy_package_attribute():
+    from olive.passes import OrtPerfTuning
+    from olive.passes.onnx import OrtPerfTuning as OnnxOrtPerfTuning
+
+    assert OrtPerfTuning is OnnxOrtPerfTuning
+    with pytest.raises(ImportError):
+        from olive.passes.onnx import SNPEConversion  # noqa: F401
@@ -0,0 +1,118 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------
+import os
+import platform
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+# stub of snpe-net-run: writes the first output_size elements of the first input of every sample as the output and
+# appends the input paths to snpe-net-run.log in the SNPE root
+SNPE_NET_RUN_STUB = """#!{python}
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--container")
+parser.add_argument("--input_list")
+parser.add_argument("--output_dir")
+args, _ = parser.parse_known_args()
+
+output_dir = Path(args.output_dir)
+samples = [line.split() for line in open(args.input_list) if line.strip() and line[0] not in "#%"]
+with open(Path(__file__).parents[2] / "snpe-net-run.log", "a") as log:
+    for i, inputs in enumerate(samples):
+        input_paths = [input.split(":=")[-1] for input in inputs]
+        log.write(" ".join(input_paths) + "\\n")
+        result_dir = output_dir / f"Result_{{i}}"
+        result_dir.mkdir(parents=True, exist_ok=True)
+        np.fromfile(input_paths[0], dtype=np.float32)[:{output_size}].tofile(result_dir / "output.raw")
+run = len(list(output_dir.glob("SNPEDiag_*.log")))
+(output_dir / f"SNPEDiag_{{run}}.log").write_text("diag")
+"""
+
+SNPE_DIAGVIEW_STUB = """#!{python}
+import argparse
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--input_log")
+parser.add_argument("--output")
+args = parser.parse_args()
+
+with open(args.output, "w") as f:
+    f.write("0,Init,0,1000000\\n")
+    f.write("0,Avg_Total_Inference_Time,0,2000000\\n")
+"""
+
+# fake adb: the device file system is the FAKE_ADB_DEVICE_ROOT directory and every command is appended to adb.log next
+# to it
+FAKE_ADB = """#!{python}
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+device_root = Path(os.environ["FAKE_ADB_DEVICE_ROOT"])
+args = sys.argv[1:]
+if args[0] == "-s":
+    args = args[2:]
+with open(device_root.parent / "adb.log", "a") as log:
+    log.write(" ".join(args) + "\\n")
+
+if args[0] == "shell":
+    script = " ".join(args[1:]).replace("/data/", f"{{device_root}}/data/")
+    sys.exit(subprocess.run(["sh", "-c", script]).returncode)
+elif args[0] == "push":
+    src, dst = args[1], f"{{device_root}}{{args[2]}}"
+    if src.endswith("/."):
+        shutil.copytree(src[:-2], dst, dirs_exist_ok=True)
+    else:
+        shutil.copy(src, dst)
+"""
+
+
+@pytest.fixture
+def fake_adb(tmp_path, monkeypatch):
+    """
+    Fake adb executable on the PATH. Returns the device root directory.
+    """
+    if platform.system() != "Linux":
+        pytest.skip("The fake adb is only available on Linux")
+
+    bin_dir = tmp_path / "adb_bin"
+    bin_dir.mkdir()
+    script = bin_dir / "adb"
+    script.write_text(FAKE_ADB.format(python=sys.executable))
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    device_root = tmp_path / "device"
+    device_root.mkdir()
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_ADB_DEVICE_ROOT", str(device_root))
+    return device_root
+
+
+@pytest.fixture
+def stub_snpe_root(tmp_path, monkeypatch):
+    """
+    SNPE_ROOT with stub snpe-net-run and snpe-diagview commands for x64-Linux. The outputs have 2 elements.
+    """
+    if platform.system() != "Linux" or platform.machine() != "x86_64":
+        pytest.skip("The stub SNPE commands are only available on x64-Linux")
+
+    snpe_root = tmp_path / "snpe"
+    bin_dir = snpe_root / "bin" / "x86_64-linux-clang"
+    bin_dir.mkdir(parents=True)
+    (snpe_root / "lib" / "x86_64-linux-clang").mkdir(parents=True)
+    for name, stub in [("snpe-net-run", SNPE_NET_RUN_STUB), ("snpe-diagview", SNPE_DIAGVIEW_STUB)]:
+        script = bin_dir / name
+        script.write_text(stub.format(python=sys.executable, output_size=2))
+        script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("SNPE_ROOT", str(snpe_root))
+    return Path(snpe_root)
@@ -4,13 +4,14 @@
 # --------------------------------------------------------------------------
 import os
 import platform
+import shutil
 from pathlib import Path
 from subprocess import CompletedProcess
 from unittest.mock import patch
 
 import pytest
 
-from olive.snpe.utils.adb import run_adb_command
+from olive.snpe.utils.adb import AdbDeviceSession, get_snpe_adb_env, run_adb_command
 from olive.snpe.utils.local import run_snpe_command
 
 
@@ -60,3 +61,71 @@ def test_run_snpe_command():
             cwd=None,
         )
         assert stdout.strip() == "stdout"
+
+
+def create_snpe_android_root(root: Path) -> Path:
+    for relative_dir, file_name in [
+        ("bin/aarch64-android", "snpe-net-run"),
+        ("lib/aarch64-android", "libSNPE.so"),
+        ("lib/dsp", "libSnpeHtpV73Skel.so"),
+    ]:
+        (root / relative_dir).mkdir(parents=True, exist_ok=True)
+        (root / relative_dir / file_name).write_text(file_name)
+    return root
+
+
+def test_adb_device_session_incremental_push(fake_adb, tmp_path, monkeypatch, android_target):
+    # setup
+    snpe_android_root = create_snpe_android_root(tmp_path / "snpe")
+    monkeypatch.setenv("SNPE_ANDROID_ROOT", str(snpe_android_root))
+    monkeypatch.setattr(AdbDeviceSession, "_sessions", {})
+    adb_log = fake_adb.parent / "adb.log"
+    adb_snpe_root = fake_adb / "data/local/tmp/olive-snpe/aarch64-android"
+
+    def get_pushes():
+        return [line for line in adb_log.read_text().splitlines() if line.startswith("push")]
+
+    # execute
+    # the sdk is pushed once per session
+    env = get_snpe_adb_env(android_target)
+    assert get_snpe_adb_env(android_target) == env
+    first_pushes = get_pushes()
+
+    # a new session only pushes the changed files and removes the deleted ones
+    monkeypatch.setattr(AdbDeviceSession, "_sessions", {})
+    (snpe_android_root / "lib/aarch64-android/libSNPE.so").write_text("updated")
+    (snpe_android_root / "lib/aarch64-android/libSnpeHtpPrepare.so").write_text("new")
+    (snpe_android_root / "lib/dsp/libSnpeHtpV73Skel.so").unlink()
+    get_snpe_adb_env(android_target)
+    second_pushes = get_pushes()[len(first_pushes) :]  # noqa: E203
+
+    # assert
+    # the directories are pushed as a whole the first time
+    assert len(first_pushes) == 3
+    assert sorted(Path(line.split()[1]).name for line in second_pushes) == ["libSNPE.so", "libSnpeHtpPrepare.so"]
+    assert (adb_snpe_root / "lib/libSNPE.so").read_text() == "updated"
+    assert (adb_snpe_root / "lib/libSnpeHtpPrepare.so").read_text() == "new"
+    assert not (adb_snpe_root / "dsp/libSnpeHtpV73Skel.so").exists()
+    assert os.access(adb_snpe_root / "bin/snpe-net-run", os.X_OK)
+    # the device is rooted once per session
+    assert adb_log.read_text().splitlines().count("root") == 2
+
+
+def test_adb_device_session_device_wiped(fake_adb, tmp_path, monkeypatch, android_target):
+    # setup
+    snpe_android_root = create_snpe_android_root(tmp_path / "snpe")
+    monkeypatch.setenv("SNPE_ANDROID_ROOT", str(snpe_android_root))
+    monkeypatch.setattr(AdbDeviceSession, "_sessions", {})
+    adb_log = fake_adb.parent / "adb.log"
+    adb_snpe_root = fake_adb / "data/local/tmp/olive-snpe/aarch64-android"
+
+    # execute
+    env = get_snpe_adb_env(android_target)
+    shutil.rmtree(fake_adb / "data")
+    # the session notices that the sdk is gone and pushes it again
+    assert get_snpe_adb_env(android_target) == env
+
+    # assert
+    assert (adb_snpe_root / "lib/libSNPE.so").exists()
+    assert os.access(adb_snpe_root / "bin/snpe-net-run", os.X_OK)
+    assert adb_log.read_text().splitlines().count("root") == 2
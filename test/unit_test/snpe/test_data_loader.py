@@ -0,0 +1,131 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from olive.snpe import SNPEDataLoader, SNPERandomDataLoader
+from olive.snpe.tools.inference import snpe_net_run
+
+
+def get_dataloader(batch_size=2):
+    io_config = {"input_names": ["input"], "input_shapes": [[1, 4]], "output_names": ["output"]}
+    return SNPERandomDataLoader(io_config, num_samples=5, batch_size=batch_size)
+
+
+def test_batches_are_staged_once():
+    # setup
+    dataloader = get_dataloader()
+
+    # execute
+    first_pass = list(dataloader)
+    second_pass = list(dataloader)
+
+    # assert
+    assert len(first_pass) == 3
+    # the staged batches are reused by the next iteration
+    assert [batch[:2] for batch in first_pass] == [batch[:2] for batch in second_pass]
+    # every batch has its own directory, only containing the batch inputs
+    assert len({batch_dir for batch_dir, _, _ in first_pass}) == 3
+    for batch_dir, batch_input_list, _ in first_pass:
+        input_paths = [line.strip() for line in open(batch_input_list) if line.strip()]
+        assert sorted(Path(batch_dir).rglob("*.raw")) == sorted(Path(path) for path in input_paths)
+        for input_path in input_paths:
+            # the inputs are hardlinked to the source data
+            source_path = Path(dataloader.data_dir) / Path(input_path).relative_to(batch_dir)
+            assert os.path.samefile(input_path, source_path)
+
+
+def test_batches_are_copied_if_not_linkable():
+    # setup
+    dataloader = get_dataloader()
+
+    # execute
+    with patch("olive.snpe.data_loader.os.link", side_effect=OSError("cross-device link")):
+        batch_dir, batch_input_list, _ = dataloader.get_batch(0)
+
+    # assert
+    for input_path in [line.strip() for line in open(batch_input_list) if line.strip()]:
+        source_path = Path(dataloader.data_dir) / Path(input_path).relative_to(batch_dir)
+        assert not os.path.samefile(input_path, source_path)
+        assert Path(input_path).read_bytes() == source_path.read_bytes()
+
+
+def test_batches_are_reused_by_later_dataloaders(tmp_path):
+    # setup
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    input_list = tmp_path / "input_list.txt"
+    for i in range(3):
+        (data_dir / f"{i}.raw").write_bytes(bytes([i]))
+    input_list.write_text("".join(f"{data_dir / f'{i}.raw'}\n" for i in range(3)))
+
+    class InputListDataLoader(SNPEDataLoader):
+        def load_data(self):
+            return str(data_dir), str(input_list), None
+
+    first_batches = list(InputListDataLoader({}, batch_size=2))
+
+    # execute
+    # a new dataloader of the same data, such as in the next evaluation
+    with patch("olive.snpe.data_loader.os.link") as mock_link:
+        second_batches = list(InputListDataLoader({}, batch_size=2))
+    # an input file is replaced after the batches were staged
+    (data_dir / "0.raw").unlink()
+    (data_dir / "0.raw").write_bytes(b"new")
+    third_batches = list(InputListDataLoader({}, batch_size=2))
+
+    # assert
+    mock_link.assert_not_called()
+    assert second_batches == first_batches
+    # the batch of the replaced file is staged again
+    assert third_batches == first_batches
+    batch_dir, batch_input_list, _ = third_batches[0]
+    assert (Path(batch_dir) / "0.raw").read_bytes() == b"new"
+
+
+@pytest.mark.parametrize(
+    "input_line,error",
+    [
+        # multiple inputs must be named
+        ("{data_dir}/a.raw {data_dir}/b.raw", "For multiple inputs"),
+        # the inputs must be in the data directory
+        ("{other_dir}/a.raw", "is not in the data directory"),
+    ],
+)
+def test_invalid_input_list(input_line, error, tmp_path):
+    # setup
+    data_dir = tmp_path / "data"
+    input_list = tmp_path / "input_list.txt"
+    input_list.write_text(input_line.format(data_dir=data_dir, other_dir=tmp_path / "other") + "\n")
+
+    class InputListDataLoader(SNPEDataLoader):
+        def load_data(self):
+            return str(data_dir), str(input_list), None
+
+    # execute and assert
+    with pytest.raises(ValueError, match=error):
+        InputListDataLoader({}, batch_size=2)
+
+
+def test_snpe_net_run_on_staged_batches(stub_snpe_root):
+    # setup
+    dataloader = get_dataloader()
+
+    # execute
+    results = [
+        snpe_net_run("model.dlc", input_list, data_dir, ["output"], [[2]], return_numpy_results=True)
+        for data_dir, input_list, _ in dataloader
+    ]
+
+    # assert
+    assert [result["results"]["output"].shape for result in results] == [(2, 2), (2, 2), (1, 2)]
+    assert results[0]["latencies"] == {"init": [1.0], "total_inference_time": [2.0]}
+    # snpe-net-run reads the staged inputs
+    run_inputs = (stub_snpe_root / "snpe-net-run.log").read_text().split()
+    assert len(run_inputs) == 5
+    assert all(Path(path).parents[2] == dataloader.batch_root_dir for path in run_inputs)
@@ -0,0 +1,67 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from olive.snpe.tools.inference import read_raw_file, snpe_net_run
+
+
+def create_inputs(data_dir: Path, num_samples: int):
+    """
+    Create num_samples raw inputs of 4 elements and the input list. The first element of sample i is i.
+    """
+    (data_dir / "input").mkdir(parents=True)
+    input_list = data_dir / "input_list.txt"
+    with open(input_list, "w") as f:
+        for i in range(num_samples):
+            input_file = data_dir / "input" / f"{i}.raw"
+            np.arange(i, i + 4, dtype=np.float32).tofile(input_file)
+            f.write(f"{input_file.as_posix()}\n")
+    return str(input_list)
+
+
+@pytest.mark.parametrize("workspace", [True, False])
+def test_snpe_net_run_results(stub_snpe_root, tmp_path, workspace):
+    # setup
+    num_samples = 50
+    input_list = create_inputs(tmp_path / "data", num_samples)
+    workspace_dir = tmp_path / "workspace" if workspace else None
+
+    # execute
+    output = snpe_net_run(
+        "model.dlc",
+        input_list,
+        str(tmp_path / "data"),
+        ["output"],
+        [[2]],
+        runs=2,
+        workspace=workspace_dir,
+        return_numpy_results=True,
+    )
+
+    # assert
+    # the outputs are the first 2 elements of the inputs, in the order of the input list
+    expected = np.array([[i, i + 1] for i in range(num_samples)], dtype=np.float32)
+    assert np.array_equal(output["results"]["output"], expected)
+    assert output["latencies"] == {"init": [1.0, 1.0], "total_inference_time": [2.0, 2.0]}
+    if workspace:
+        result_files = output["result_files"]["output"]
+        assert [Path(f).name for f in result_files] == [f"{i}.raw" for i in range(num_samples)]
+        assert (workspace_dir / "snpe-output" / "perf_results_1.csv").exists()
+
+
+def test_read_raw_file_size_mismatch(tmp_path):
+    # setup
+    raw_file = tmp_path / "output.raw"
+    np.zeros(3, dtype=np.float32).tofile(raw_file)
+
+    # execute and assert
+    assert np.array_equal(read_raw_file(raw_file, np.ones(3, dtype=np.float32)), np.zeros(3))
+    with pytest.raises(ValueError, match="does not match the output shape"):
+        read_raw_file(raw_file, np.empty(2, dtype=np.float32))
+    with pytest.raises(ValueError, match="does not match the output shape"):
+        read_raw_file(raw_file, np.empty(4, dtype=np.float32))
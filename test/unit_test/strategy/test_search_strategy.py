@@ -0,0 +1,157 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------
+import json
+
+import pytest
+
+from olive.evaluator.metric import MetricResult
+from olive.strategy.search_parameter import Categorical
+from olive.strategy.search_results import SearchResults
+from olive.strategy.search_strategy import SearchStrategy
+
+OBJECTIVE = "accuracy-accuracy_score"
+
+
+def get_signal(value):
+    return MetricResult.parse_obj({OBJECTIVE: {"value": value, "priority": 1, "higher_is_better": True}})
+
+
+def test_successive_halving():
+    search_strategy = SearchStrategy(
+        {
+            "execution_order": "joint",
+            "search_algorithm": "exhaustive",
+            "successive_halving": {"min_fraction": 1 / 9, "reduction_factor": 3},
+        }
+    )
+    search_strategy.initialize(
+        [("pass", {"param": Categorical(list(range(9)))})],
+        "model",
+        {OBJECTIVE: {"higher_is_better": True, "goal": None, "priority": 1}},
+    )
+
+    # execute
+    fractions = []
+    while True:
+        next_step = search_strategy.next_step()
+        if next_step is None:
+            break
+        subset = next_step["subset"]
+        fractions.append(subset.fraction if subset else 1)
+        param = next_step["search_point"]["pass"]["param"]
+        search_strategy.record_feedback_signal(next_step["search_point"], get_signal(param), [f"model_{param}"])
+
+    # assert
+    # 9 candidates on 1/9 of the data, the best 3 on 1/3 of the data and the best one on the full data
+    assert fractions == [1 / 9] * 9 + [1 / 3] * 3 + [1]
+    search_results = search_strategy._search_results[("pass",)]
+    model_ids, _, _ = search_results.sort_search_points()
+    assert model_ids == [["model_8"]]
+
+
+@pytest.mark.parametrize("search_algorithm", ["exhaustive", "random", "tpe"])
+def test_warm_start(search_algorithm, tmp_path):
+    # setup
+    footprint = {"input_model": {"model_id": "input_model"}}
+    for param in [2, 5, 7, 100]:
+        # the point with param 100 is not in the search space
+        footprint[f"model_{param}"] = {
+            "model_id": f"model_{param}",
+            "parent_model_id": "input_model",
+            "from_pass": "DummyPass",
+            "pass_run_config": {"param": param, "other_param": "value"},
+            "metrics": {"value": get_signal(param).to_json(), "is_goals_met": False},
+        }
+    footprint_path = tmp_path / "footprints.json"
+    with open(footprint_path, "w") as f:
+        json.dump(footprint, f)
+
+    search_algorithm_config = {} if search_algorithm == "exhaustive" else {"num_samples": 5}
+    search_strategy = SearchStrategy(
+        {
+            "execution_order": "joint",
+            "search_algorithm": search_algorithm,
+            "search_algorithm_config": search_algorithm_config,
+            "warm_start_footprints": [str(footprint_path)],
+        }
+    )
+    search_strategy.initialize(
+        [("pass", {"param": Categorical(list(range(9)))})],
+        "model",
+        {OBJECTIVE: {"higher_is_better": True, "goal": None, "priority": 1}},
+    )
+
+    # execute
+    params = []
+    while True:
+        next_step = search_strategy.next_step()
+        if next_step is None:
+            break
+        param = next_step["search_point"]["pass"]["param"]
+        params.append(param)
+        search_strategy.record_feedback_signal(next_step["search_point"], get_signal(param), [f"model_{param}"])
+
+    # assert
+    # the previous candidates are suggested first, best first
+    assert params[:3] == [7, 5, 2]
+    if search_algorithm == "exhaustive":
+        # the previous candidates are not suggested again
+        assert sorted(params) == list(range(9))
+
+
+@pytest.mark.parametrize("storage", ["sqlite", "journal"])
+def test_resume_optuna_study(storage, tmp_path):
+    # setup
+    storage = f"sqlite:///{tmp_path / 'study.db'}" if storage == "sqlite" else str(tmp_path / "study.log")
+    config = {
+        "execution_order": "joint",
+        "search_algorithm": "tpe",
+        "search_algorithm_config": {"num_samples": 4, "storage": storage},
+    }
+
+    def run_search(max_steps=None):
+        search_strategy = SearchStrategy(config)
+        search_strategy.initialize(
+            [("pass", {"param": Categorical(list(range(9)))})],
+            "model",
+            {OBJECTIVE: {"higher_is_better": True, "goal": None, "priority": 1}},
+        )
+        params = []
+        while max_steps is None or len(params) < max_steps:
+            next_step = search_strategy.next_step()
+            if next_step is None:
+                break
+            param = next_step["search_point"]["pass"]["param"]
+            params.append(param)
+            search_strategy.record_feedback_signal(next_step["search_point"], get_signal(param), [f"model_{param}"])
+        return params, search_strategy
+
+    # execute
+    # the first search stops after 2 samples, like a crashed search
+    first_params, _ = run_search(max_steps=2)
+    resumed_params, search_strategy = run_search()
+
+    # assert
+    # the resumed search replays the completed samples and only suggests the remaining ones
+    assert resumed_params[:2] == first_params
+    assert len(resumed_params) == 4
+    searcher = search_strategy._searchers[("pass",)]
+    assert len(searcher._study.trials) == 4
+
+
+def test_search_results_skip_early_stopped():
+    # setup
+    search_results = SearchResults({OBJECTIVE: {"higher_is_better": True, "goal": None, "priority": 1}})
+    early_stopped_signal = get_signal(0.9)
+    early_stopped_signal[OBJECTIVE].is_early_stopped = True
+    search_results.record({"pass": {"param": 0}}, early_stopped_signal, ["0"])
+    search_results.record({"pass": {"param": 1}}, get_signal(0.5), ["1"])
+
+    # execute
+    sorted_model_ids, _, _ = search_results.sort_search_points()
+
+    # assert
+    # the partial accuracy of the early stopped evaluation is not ranked
+    assert sorted_model_ids == [["1"]]
@@ -13,8 +13,10 @@ from unittest.mock import MagicMock, Mock, patch
 import pytest
 from azure.ai.ml import Input, Output
 from azure.ai.ml.constants import AssetTypes
+from azure.core.exceptions import ResourceNotFoundError
 
 from olive.azureml.azureml_client import AzureMLClientConfig
+from olive.common.utils import hash_path_content, hash_string
 from olive.evaluator.metric import AccuracySubType, LatencySubType, MetricResult
 from olive.hardware import DEFAULT_CPU_ACCELERATOR
 from olive.model import ONNXModel
@@ -38,6 +40,31 @@ class TestAzureMLSystem:
         mock_azureml_client_config = Mock(spec=AzureMLClientConfig)
         self.system = AzureMLSystem(mock_azureml_client_config, "dummy", docker_config)
 
+    def mock_data_assets(self, registered_versions=None):
+        # ml client with a data asset registry, only containing the given versions at first
+        ml_client = MagicMock()
+        registered_versions = registered_versions or []
+
+        def get_data(name, version):
+            if version not in registered_versions:
+                raise ResourceNotFoundError("data asset not found")
+            return Mock(version=version)
+
+        def create_or_update(data):
+            return data
+
+        ml_client.data.get.side_effect = get_data
+        ml_client.data.create_or_update = MagicMock(side_effect=create_or_update)
+        ml_client.data.create_or_update.__name__ = "create_or_update"
+        self.system.azureml_client_config.create_client.return_value = ml_client
+        self.system.azureml_client_config.max_operation_retries = 3
+        self.system.azureml_client_config.operation_retry_interval = 5
+        return ml_client
+
+    @staticmethod
+    def get_file_version(path):
+        return hash_string(f"{Path(path).name}:{hash_path_content(path)}")
+
     METRIC_TEST_CASE = [
         (get_accuracy_metric(AccuracySubType.ACCURACY_SCORE)),
         (get_accuracy_metric(AccuracySubType.F1_SCORE)),
@@ -152,6 +179,7 @@ class TestAzureMLSystem:
             "resource_group": "resource_group",
         }
         self.system.azureml_client_config.get_workspace_config.return_value = ws_config
+        self.mock_data_assets()
         resource_paths = {
             ResourceType.AzureMLModel: {
                 "type": ResourceType.AzureMLModel,
@@ -177,7 +205,10 @@ class TestAzureMLSystem:
         if model_resource_type == ResourceType.AzureMLModel:
             expected_model_path = Input(type=AssetTypes.CUSTOM_MODEL, path="azureml:model_name:version")
         else:
-            expected_model_path = Input(type=AssetTypes.URI_FILE, path=Path(temp_model.name).resolve())
+            expected_model_path = Input(
+                type=AssetTypes.URI_FILE,
+                path=f"azureml:olive-backend-uri-file:{self.get_file_version(temp_model.name)}",
+            )
         expected_model_script = Input(type=AssetTypes.URI_FILE, path="model_script")
         expected_model_script_dir = Input(type=AssetTypes.URI_FOLDER, path="script_dir")
         expected_model_config = Input(type=AssetTypes.URI_FILE, path=model_config_path)
@@ -208,11 +239,16 @@ class TestAzureMLSystem:
             }
         }
         metric_config_path = tem_dir / "metric_config.json"
+        if os.path.exists(metric_config_path):
+            os.remove(metric_config_path)
+        self.mock_data_assets()
 
         expected_metric_config = Input(type=AssetTypes.URI_FILE, path=metric_config_path)
         expected_metric_user_script = Input(type=AssetTypes.URI_FILE, path="user_script")
         expected_metric_script_dir = Input(type=AssetTypes.URI_FOLDER, path="script_dir")
-        expected_metric_data_dir = Input(type=AssetTypes.URI_FOLDER, path=str(tem_dir))
+        expected_metric_data_dir = Input(
+            type=AssetTypes.URI_FOLDER, path=f"azureml:olive-backend-uri-folder:{hash_path_content(tem_dir)}"
+        )
         expected_res = {
             "metric_config": expected_metric_config,
             "metric_user_script": expected_metric_user_script,
@@ -233,6 +269,55 @@ class TestAzureMLSystem:
         if os.path.exists(metric_config_path):
             os.remove(metric_config_path)
 
+    def test__create_local_input_reuses_data_assets(self, tmp_path):
+        # setup
+        model_path = tmp_path / "model.onnx"
+        model_path.write_bytes(b"model")
+        script_dir = tmp_path / "script_dir"
+        script_dir.mkdir()
+        (script_dir / "user_script.py").write_text("pass")
+        # same content as the user script but a different name
+        (script_dir / "model_script.py").write_text("pass")
+        model_version = self.get_file_version(model_path)
+        # the script dir was registered by a previous run
+        ml_client = self.mock_data_assets([hash_path_content(script_dir)])
+
+        def create_args():
+            model_json = {
+                "type": "onnxmodel",
+                "config": {
+                    "model_script": str(script_dir / "model_script.py"),
+                    "script_dir": str(script_dir),
+                    "model_path": str(model_path),
+                },
+            }
+            metric_config = {
+                "user_config": {"user_script": str(script_dir / "user_script.py"), "script_dir": None, "data_dir": None}
+            }
+            return {
+                **self.system._create_model_args(model_json, tmp_path),
+                **self.system._create_metric_args(metric_config, tmp_path),
+            }
+
+        # execute
+        first_args = create_args()
+        second_args = create_args()
+        model_path.write_bytes(b"modified model")
+        modified_args = create_args()
+
+        # assert
+        assert first_args == second_args
+        assert first_args["model_path"].path == f"azureml:olive-backend-uri-file:{model_version}"
+        assert first_args["model_script"].path != first_args["metric_user_script"].path
+        assert modified_args["model_path"].path != first_args["model_path"].path
+        assert modified_args["model_script_dir"] == first_args["model_script_dir"]
+        # the model, the modified model, the model script and the metric user script are uploaded once each
+        registered_paths = [call.args[0].path for call in ml_client.data.create_or_update.call_args_list]
+        assert sorted(registered_paths) == sorted(
+            [str(model_path), str(model_path), str(script_dir / "user_script.py"), str(script_dir / "model_script.py")]
+        )
+        assert ml_client.data.get.call_count == 5
+
     @pytest.mark.parametrize(
         "model_resource_type",
         [ResourceType.AzureMLModel, ResourceType.LocalFile],
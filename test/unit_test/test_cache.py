@@ -7,13 +7,22 @@ import os
 import platform
 import shutil
 import tempfile
+import threading
+import time
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-from olive.cache import clean_pass_run_cache, create_cache, download_resource, get_cache_sub_dirs, save_model
-from olive.resource_path import AzureMLModel
+from olive.cache import (
+    clean_pass_run_cache,
+    create_cache,
+    download_resource,
+    download_resources,
+    get_cache_sub_dirs,
+    save_model,
+)
+from olive.resource_path import AzureMLDatastore, AzureMLModel, create_resource_path
 
 
 class TestCache:
@@ -149,3 +158,82 @@ class TestCache:
         cached_path = download_resource(resource_path, cache_dir2)
         assert cached_path.get_path() == "dummy_string_name"
         assert mock_save_to_dir.call_count == 2
+
+    def test_download_resources_concurrently(self, tmp_path):
+        # setup
+        resource_paths = [
+            create_resource_path(
+                f"azureml://subscriptions/sub/resourcegroups/rg/workspaces/ws/datastores/ds/paths/data_{i}.bin"
+            )
+            for i in range(3)
+        ]
+        active_downloads = []
+        max_active_downloads = [0]
+        lock = threading.Lock()
+
+        # fake datastore downloading a file named after the relative path of the resource
+        def fake_save_to_dir(resource_path, dir_path, name=None, overwrite=False):
+            with lock:
+                active_downloads.append(resource_path)
+                max_active_downloads[0] = max(max_active_downloads[0], len(active_downloads))
+            time.sleep(0.5)
+            file_path = Path(dir_path) / resource_path.get_relative_path()
+            file_path.write_text(resource_path.get_relative_path())
+            with lock:
+                active_downloads.remove(resource_path)
+            return str(file_path)
+
+        # execute
+        with patch.object(AzureMLDatastore, "save_to_dir", autospec=True, side_effect=fake_save_to_dir):
+            local_paths = download_resources([(resource_path, tmp_path) for resource_path in resource_paths])
+
+        # assert
+        assert max_active_downloads[0] > 1
+        for i, local_path in enumerate(local_paths):
+            assert Path(local_path.get_path()).read_text() == f"data_{i}.bin"
+            assert Path(local_path.get_path()).parent.parent == get_cache_sub_dirs(tmp_path)[3]
+        # only the complete downloads are left in the cache
+        assert not list(get_cache_sub_dirs(tmp_path)[3].glob("*.tmp"))
+
+    def test_download_resource_interrupted(self, tmp_path):
+        # setup
+        resource_path = create_resource_path(
+            "azureml://subscriptions/sub/resourcegroups/rg/workspaces/ws/datastores/ds/paths/data.bin"
+        )
+
+        def interrupted_save_to_dir(dir_path, name=None, overwrite=False):
+            (Path(dir_path) / "data.bin").write_text("partial")
+            raise ConnectionError("connection reset")
+
+        def save_to_dir(dir_path, name=None, overwrite=False):
+            (Path(dir_path) / "data.bin").write_text("data")
+            return str(Path(dir_path) / "data.bin")
+
+        # execute
+        with patch.object(AzureMLDatastore, "save_to_dir", side_effect=interrupted_save_to_dir), pytest.raises(
+            ConnectionError
+        ):
+            download_resource(resource_path, tmp_path)
+        # the partial download is not cached
+        assert not list(get_cache_sub_dirs(tmp_path)[3].iterdir())
+        with patch.object(AzureMLDatastore, "save_to_dir", side_effect=save_to_dir):
+            local_path = download_resource(resource_path, tmp_path)
+
+        # assert
+        assert Path(local_path.get_path()).read_text() == "data"
+
+    def test_download_resources_failure(self, tmp_path):
+        # setup
+        resource_path = create_resource_path(
+            "azureml://subscriptions/sub/resourcegroups/rg/workspaces/ws/datastores/ds/paths/data.bin"
+        )
+
+        # execute
+        with patch.object(AzureMLDatastore, "save_to_dir", side_effect=ConnectionError("connection reset")):
+            with pytest.raises(ConnectionError):
+                download_resources([(resource_path, tmp_path)])
+            local_paths = download_resources([(resource_path, tmp_path)], raise_errors=False)
+
+        # assert
+        # the failed download is only logged so that it can be downloaded again when used
+        assert local_paths == [None]
@@ -143,6 +143,30 @@ def get_latency_metric(*lat_subtype, user_config=None):
     return latency_metric
 
 
+def get_throughput_metric(*throughput_subtype, user_config=None, metric_config=None):
+    throughput_metric_config = {"dataloader_func": create_dataloader}
+    sub_types = [{"name": sub, "metric_config": metric_config or {}} for sub in throughput_subtype]
+    throughput_metric = Metric(
+        name="throughput",
+        type=MetricType.THROUGHPUT,
+        sub_types=sub_types,
+        user_config=user_config or throughput_metric_config,
+    )
+    return throughput_metric
+
+
+def get_memory_metric(*memory_subtype, user_config=None, metric_config=None):
+    memory_metric_config = {"dataloader_func": create_dataloader}
+    sub_types = [{"name": sub, "metric_config": metric_config or {}} for sub in memory_subtype]
+    memory_metric = Metric(
+        name="memory",
+        type=MetricType.MEMORY,
+        sub_types=sub_types,
+        user_config=user_config or memory_metric_config,
+    )
+    return memory_metric
+
+
 def get_onnxconversion_pass(ignore_pass_config=True):
     onnx_conversion_config = {}
     p = create_pass_from_dict(OnnxConversion, onnx_conversion_config)